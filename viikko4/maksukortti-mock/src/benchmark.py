@@ -0,0 +1,51 @@
+import random
+import time
+from kassapaate import Kassapaate, LATAA, OSTA
+from maksukortti import Maksukortti
+
+
+def luo_tapahtumat(kortteja, tapahtumia):
+    satunnainen = random.Random(1)
+    kortti_idt = [satunnainen.randrange(kortteja) for _ in range(tapahtumia)]
+    summat = [satunnainen.randrange(1, 20) for _ in range(tapahtumia)]
+    toiminnot = [OSTA if satunnainen.random() < 0.8 else LATAA for _ in range(tapahtumia)]
+
+    return kortti_idt, summat, toiminnot
+
+
+def yksittain(kortteja, tapahtumat):
+    kassa = Kassapaate()
+    kortit = {i: Maksukortti(20) for i in range(kortteja)}
+
+    alku = time.perf_counter()
+    for kortti_id, summa, toiminto in zip(*tapahtumat):
+        if toiminto == OSTA:
+            kassa.osta_lounas(kortit[kortti_id])
+        else:
+            kassa.lataa(kortit[kortti_id], summa)
+
+    return time.perf_counter() - alku
+
+
+def erana(kortteja, tapahtumat):
+    kassa = Kassapaate()
+    kortit = {i: Maksukortti(20) for i in range(kortteja)}
+
+    alku = time.perf_counter()
+    kassa.tilita(kortit, *tapahtumat)
+
+    return time.perf_counter() - alku
+
+
+def main():
+    for kortteja, tapahtumia in ((100, 100_000), (10_000, 1_000_000)):
+        tapahtumat = luo_tapahtumat(kortteja, tapahtumia)
+        print(
+            f"{kortteja} korttia, {tapahtumia} tapahtumaa: "
+            f"yksittäin {tapahtumia / yksittain(kortteja, tapahtumat):>10.0f} tapahtumaa/s, "
+            f"eränä {tapahtumia / erana(kortteja, tapahtumat):>10.0f} tapahtumaa/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
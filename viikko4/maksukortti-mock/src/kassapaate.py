@@ -1,16 +1,71 @@
 HINTA = 5
 
+LATAA = 0
+OSTA = 1
+
 
 class Kassapaate:
-    def __init__(self):
-        self.__myytyja_lounaita = 0
+    def __init__(self, myytyja_lounaita=0):
+        self.__myytyja_lounaita = myytyja_lounaita
+
+    def myytyja_lounaita(self):
+        return self.__myytyja_lounaita
 
     def lataa(self, kortti, summa):
         if summa > 0:
             kortti.lataa(summa)
+            return True
+        return False
 
     def osta_lounas(self, kortti):
         if kortti.saldo() < HINTA:
-            return
+            return False
         kortti.osta(HINTA)
         self.__myytyja_lounaita = self.__myytyja_lounaita + 1
+        return True
+
+    def tilita(self, kortit, kortti_idt, summat, toiminnot):
+        # Käsittelee vuoron tapahtumat yhdellä läpikäynnillä. Korttien saldot
+        # luetaan kerran ja muutokset lasketaan ensin paikallisesti, jolloin
+        # jokaista korttia kohden tehdään vain yksi lataus tai osto.
+        # Palauttaa jokaisen tapahtuman onnistumisen ja myytyjen lounaiden määrän.
+        # Virheellinen syöte hylätään ennen kuin yhdenkään kortin saldoa muutetaan.
+        # Erä ei ole mitattavasti nopeampi kuin tapahtumat yksitellen, koska
+        # kummassakin työ on muutama sanakirjahaku tapahtumaa kohden; se on
+        # olemassa kaikki tai ei mitään -käsittelyn ja yhden kutsun rajapinnan vuoksi.
+        saldot = {}
+        tulokset = []
+        myytyja = 0
+
+        for kortti_id, summa, toiminto in zip(kortti_idt, summat, toiminnot, strict=True):
+            saldo = saldot.get(kortti_id)
+            if saldo is None:
+                saldo = kortit[kortti_id].saldo()
+
+            if toiminto == OSTA:
+                onnistui = saldo >= HINTA
+                if onnistui:
+                    saldo -= HINTA
+                    myytyja += 1
+            elif toiminto == LATAA:
+                onnistui = summa > 0
+                if onnistui:
+                    saldo += summa
+            else:
+                raise ValueError(f"tuntematon toiminto: {toiminto!r}")
+
+            saldot[kortti_id] = saldo
+            tulokset.append(onnistui)
+
+        for kortti_id, saldo in saldot.items():
+            kortti = kortit[kortti_id]
+            muutos = saldo - kortti.saldo()
+
+            if muutos > 0:
+                kortti.lataa(muutos)
+            elif muutos < 0:
+                kortti.osta(-muutos)
+
+        self.__myytyja_lounaita = self.__myytyja_lounaita + myytyja
+
+        return tulokset, self.__myytyja_lounaita
@@ -0,0 +1,42 @@
+from threading import Lock, local
+from kassapaate import Kassapaate
+
+
+class Kassapalvelu:
+    # Useampi kassa voi veloittaa samaa korttia yhtä aikaa. Saman kortin
+    # tapahtumat suoritetaan kortin lukon alla, ja kortit jaetaan lukoille,
+    # jolloin eri kortteja käsittelevät kassat eivät odota toisiaan.
+    # Jokaisella säikeellä on oma Kassapaate, joten myytyjen lounaiden laskuri
+    # ei vaadi lukitusta. Kokonaismäärä lasketaan yhteen luettaessa.
+    def __init__(self, lukkoja=64):
+        self._lukot = [Lock() for _ in range(lukkoja)]
+        self._saikeen = local()
+        self._kassat = []
+        self._kassojen_lukko = Lock()
+
+    def lataa(self, kortti, summa):
+        with self._lukko(kortti):
+            return self._kassa().lataa(kortti, summa)
+
+    def osta_lounas(self, kortti):
+        with self._lukko(kortti):
+            return self._kassa().osta_lounas(kortti)
+
+    def myytyja_lounaita(self):
+        with self._kassojen_lukko:
+            kassat = list(self._kassat)
+
+        return sum(kassa.myytyja_lounaita() for kassa in kassat)
+
+    def _lukko(self, kortti):
+        return self._lukot[hash(kortti) % len(self._lukot)]
+
+    def _kassa(self):
+        kassa = getattr(self._saikeen, "kassa", None)
+
+        if kassa is None:
+            kassa = self._saikeen.kassa = Kassapaate()
+            with self._kassojen_lukko:
+                self._kassat.append(kassa)
+
+        return kassa
@@ -0,0 +1,152 @@
+import os
+from kassapaate import Kassapaate, HINTA
+from maksukortti import Maksukortti
+
+
+def _tarkista_kokonaisluku(arvo):
+    # tilikirja luetaan takaisin int():llä, joten muuta ei saa kirjata
+    if isinstance(arvo, bool) or not isinstance(arvo, int):
+        raise TypeError(f"summan pitää olla kokonaisluku, ei {type(arvo).__name__}")
+
+
+class Korttirekisteri:
+    # Pitää kirjaa kassan korteista ja tallentaa jokaisen latauksen ja oston
+    # tekstimuotoiseen tilikirjaan. Rivit puskuroidaan ja kirjoitetaan levylle
+    # erissä, ja kun tilikirja kasvaa liian pitkäksi, se tiivistetään yhdeksi
+    # saldoriviksi korttia kohden. Korttien tunnisteet ovat merkkijonoja,
+    # joissa ei ole välilyöntejä, jotta rivit voidaan lukea takaisin.
+    # Tilikirjan rivit ovat muotoa:
+    #   K <id> <saldo>   kortti ja sen saldo
+    #   L <id> <summa>   lataus
+    #   O <id>           lounaan osto
+    #   M <määrä>        myytyjä lounaita tiivistyshetkellä
+    def __init__(self, polku, tiivistysraja=100_000, puskuri=64 * 1024):
+        self._polku = polku
+        self._tiivistysraja = tiivistysraja
+        self._puskuri = puskuri
+        self._kortit = {}
+        self._vahissa_saldoissa = set()
+
+        myytyja, self._riveja = self._palauta()
+        self._kassa = Kassapaate(myytyja)
+        self._tilikirja = open(self._polku, "a", encoding="utf-8", buffering=self._puskuri)
+
+    def __len__(self):
+        return len(self._kortit)
+
+    def hae(self, kortti_id):
+        return self._kortit[kortti_id]
+
+    def myytyja_lounaita(self):
+        return self._kassa.myytyja_lounaita()
+
+    def vahissa_saldoissa(self):
+        # kortit, joiden saldo ei riitä lounaaseen
+        return list(self._vahissa_saldoissa)
+
+    def lisaa_kortti(self, kortti_id, saldo=0):
+        if not isinstance(kortti_id, str):
+            raise TypeError(f"kortin tunnisteen pitää olla merkkijono, ei {type(kortti_id).__name__}")
+        if not kortti_id or any(merkki.isspace() for merkki in kortti_id):
+            raise ValueError(f"kortin tunnisteessa ei saa olla välilyöntejä: {kortti_id!r}")
+        if kortti_id in self._kortit:
+            raise ValueError(f"kortti {kortti_id} on jo rekisterissä")
+        _tarkista_kokonaisluku(saldo)
+
+        self._kortit[kortti_id] = Maksukortti(saldo)
+        self._paivita_indeksi(kortti_id)
+        self._kirjaa(f"K {kortti_id} {saldo}\n")
+
+    def lataa(self, kortti_id, summa):
+        _tarkista_kokonaisluku(summa)
+
+        if not self._kassa.lataa(self._kortit[kortti_id], summa):
+            return False
+
+        self._paivita_indeksi(kortti_id)
+        self._kirjaa(f"L {kortti_id} {summa}\n")
+
+        return True
+
+    def osta_lounas(self, kortti_id):
+        if not self._kassa.osta_lounas(self._kortit[kortti_id]):
+            return False
+
+        self._paivita_indeksi(kortti_id)
+        self._kirjaa(f"O {kortti_id}\n")
+
+        return True
+
+    def tyhjenna(self):
+        self._tilikirja.flush()
+
+    def tiivista(self):
+        self._tilikirja.close()
+
+        valiaikainen = self._polku + ".tmp"
+        with open(valiaikainen, "w", encoding="utf-8", buffering=self._puskuri) as tiedosto:
+            for kortti_id, kortti in self._kortit.items():
+                tiedosto.write(f"K {kortti_id} {kortti.saldo()}\n")
+            tiedosto.write(f"M {self.myytyja_lounaita()}\n")
+        os.replace(valiaikainen, self._polku)
+
+        self._riveja = len(self._kortit) + 1
+        self._tilikirja = open(self._polku, "a", encoding="utf-8", buffering=self._puskuri)
+
+    def sulje(self):
+        self._tilikirja.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.sulje()
+
+    def _kirjaa(self, rivi):
+        self._tilikirja.write(rivi)
+        self._riveja += 1
+
+        if self._riveja >= self._tiivistysraja + len(self._kortit):
+            self.tiivista()
+
+    def _paivita_indeksi(self, kortti_id):
+        if self._kortit[kortti_id].saldo() < HINTA:
+            self._vahissa_saldoissa.add(kortti_id)
+        else:
+            self._vahissa_saldoissa.discard(kortti_id)
+
+    def _palauta(self):
+        if not os.path.exists(self._polku):
+            return 0, 0
+
+        saldot = {}
+        myytyja = 0
+        riveja = 0
+
+        with open(self._polku, "rb") as tiedosto:
+            data = tiedosto.read()
+
+        # kaatumisen yhteydessä viimeinen rivi on voinut jäädä kesken
+        ehjat = data.rfind(b"\n") + 1
+        if ehjat < len(data):
+            os.truncate(self._polku, ehjat)
+
+        for rivi in data[:ehjat].decode("utf-8").splitlines():
+            osat = rivi.split()
+            riveja += 1
+
+            if osat[0] == "K":
+                saldot[osat[1]] = int(osat[2])
+            elif osat[0] == "L":
+                saldot[osat[1]] += int(osat[2])
+            elif osat[0] == "O":
+                saldot[osat[1]] -= HINTA
+                myytyja += 1
+            elif osat[0] == "M":
+                myytyja = int(osat[1])
+
+        for kortti_id, saldo in saldot.items():
+            self._kortit[kortti_id] = Maksukortti(saldo)
+            self._paivita_indeksi(kortti_id)
+
+        return myytyja, riveja
@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import Mock, ANY
-from kassapaate import Kassapaate, HINTA
+from kassapaate import Kassapaate, HINTA, LATAA, OSTA
 from maksukortti import Maksukortti
 
 
@@ -36,4 +36,62 @@ class TestKassapaate(unittest.TestCase):
 
         self.kassa.lataa(maksukortti_mock, -10000)
 
-        maksukortti_mock.lataa.assert_not_called()
\ No newline at end of file
+        maksukortti_mock.lataa.assert_not_called()
+
+    def test_tilitys_kasittelee_tapahtumat_jarjestyksessa(self):
+        kortit = {1: Maksukortti(4), 2: Maksukortti(10)}
+
+        tulokset, myytyja = self.kassa.tilita(
+            kortit,
+            [1, 2, 1, 1, 2, 2, 1],
+            [0, 0, 6, 0, -3, 0, 0],
+            [OSTA, OSTA, LATAA, OSTA, LATAA, OSTA, OSTA],
+        )
+
+        self.assertEqual(tulokset, [False, True, True, True, False, True, True])
+        self.assertEqual(myytyja, 4)
+        self.assertEqual(self.kassa.myytyja_lounaita(), 4)
+        self.assertEqual(kortit[1].saldo(), 0)
+        self.assertEqual(kortit[2].saldo(), 0)
+
+    def test_tilitys_hylkaa_eripituiset_listat(self):
+        kortit = {1: Maksukortti(10)}
+
+        self.assertRaises(ValueError, self.kassa.tilita, kortit, [1, 1, 1], [0, 0], [OSTA] * 3)
+        self.assertEqual(kortit[1].saldo(), 10)
+        self.assertEqual(self.kassa.myytyja_lounaita(), 0)
+
+    def test_tilitys_hylkaa_tuntemattoman_toiminnon(self):
+        kortit = {1: Maksukortti(10)}
+
+        self.assertRaises(ValueError, self.kassa.tilita, kortit, [1, 1], [0, 10], [OSTA, "osta"])
+        self.assertEqual(kortit[1].saldo(), 10)
+        self.assertEqual(self.kassa.myytyja_lounaita(), 0)
+
+    def test_tilitys_vastaa_yksittaisia_kutsuja(self):
+        yksittain = Kassapaate()
+        kortit = {i: Maksukortti(i) for i in range(10)}
+        vertailukortit = {i: Maksukortti(i) for i in range(10)}
+        kortti_idt = [(i * 7) % 10 for i in range(200)]
+        summat = [(i * 3) % 11 - 2 for i in range(200)]
+        toiminnot = [OSTA if i % 3 else LATAA for i in range(200)]
+
+        for kortti_id, summa, toiminto in zip(kortti_idt, summat, toiminnot):
+            if toiminto == OSTA:
+                yksittain.osta_lounas(vertailukortit[kortti_id])
+            else:
+                yksittain.lataa(vertailukortit[kortti_id], summa)
+
+        _, myytyja = self.kassa.tilita(kortit, kortti_idt, summat, toiminnot)
+
+        self.assertEqual(myytyja, yksittain.myytyja_lounaita())
+        for i in range(10):
+            self.assertEqual(kortit[i].saldo(), vertailukortit[i].saldo())
+
+    def test_tilitys_tekee_yhden_muutoksen_korttia_kohden(self):
+        maksukortti_mock = Mock()
+        maksukortti_mock.saldo.return_value = 100
+
+        self.kassa.tilita({1: maksukortti_mock}, [1, 1, 1], [0, 0, 0], [OSTA, OSTA, OSTA])
+
+        maksukortti_mock.osta.assert_called_once_with(3 * HINTA)
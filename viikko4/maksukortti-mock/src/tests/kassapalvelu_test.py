@@ -0,0 +1,63 @@
+import sys
+import unittest
+from threading import Barrier, Thread
+from kassapaate import HINTA
+from kassapalvelu import Kassapalvelu
+from maksukortti import Maksukortti
+
+
+class TestKassapalvelu(unittest.TestCase):
+    def setUp(self):
+        self.palvelu = Kassapalvelu(lukkoja=8)
+        self.vaihtovali = sys.getswitchinterval()
+        # vaihdetaan säiettä mahdollisimman usein, jotta kilpatilanteet tulevat esiin
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.vaihtovali)
+
+    def aja_kassoilla(self, kassoja, tehtava):
+        este = Barrier(kassoja)
+
+        def aja():
+            este.wait()
+            tehtava()
+
+        saikeet = [Thread(target=aja) for _ in range(kassoja)]
+        for saie in saikeet:
+            saie.start()
+        for saie in saikeet:
+            saie.join()
+
+    def test_yhteinen_kortti_ei_mene_miinukselle(self):
+        kortti = Maksukortti(100 * HINTA + 3)
+
+        def osta():
+            for _ in range(100):
+                self.palvelu.osta_lounas(kortti)
+
+        self.aja_kassoilla(8, osta)
+
+        self.assertEqual(kortti.saldo(), 3)
+        self.assertEqual(self.palvelu.myytyja_lounaita(), 100)
+
+    def test_rinnakkaiset_lataukset_ja_ostot_tasmaavat(self):
+        kortit = [Maksukortti(0) for _ in range(16)]
+
+        def asioi():
+            for _ in range(50):
+                for kortti in kortit:
+                    self.palvelu.lataa(kortti, HINTA)
+                    self.palvelu.osta_lounas(kortti)
+
+        self.aja_kassoilla(8, asioi)
+
+        self.assertTrue(all(kortti.saldo() == 0 for kortti in kortit))
+        self.assertEqual(self.palvelu.myytyja_lounaita(), 8 * 50 * 16)
+
+    def test_palvelu_palauttaa_tapahtuman_onnistumisen(self):
+        kortti = Maksukortti(HINTA)
+
+        self.assertTrue(self.palvelu.osta_lounas(kortti))
+        self.assertFalse(self.palvelu.osta_lounas(kortti))
+        self.assertFalse(self.palvelu.lataa(kortti, 0))
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from kassapaate import HINTA
+from korttirekisteri import Korttirekisteri
+
+
+class TestKorttirekisteri(unittest.TestCase):
+    def setUp(self):
+        hakemisto = tempfile.TemporaryDirectory()
+        self.addCleanup(hakemisto.cleanup)
+        self.polku = os.path.join(hakemisto.name, "tilikirja.txt")
+        self.rekisteri = Korttirekisteri(self.polku)
+        self.addCleanup(self.rekisteri.sulje)
+
+    def test_kortti_loytyy_tunnisteella(self):
+        self.rekisteri.lisaa_kortti("a", 10)
+
+        self.assertEqual(self.rekisteri.hae("a").saldo(), 10)
+
+    def test_samaa_korttia_ei_voi_lisata_kahdesti(self):
+        self.rekisteri.lisaa_kortti("a", 10)
+
+        self.assertRaises(ValueError, self.rekisteri.lisaa_kortti, "a", 3)
+
+    def test_vahissa_saldoissa_olevat_kortit_loytyvat_indeksista(self):
+        self.rekisteri.lisaa_kortti("a", 10)
+        self.rekisteri.lisaa_kortti("b", HINTA - 1)
+        self.assertEqual(self.rekisteri.vahissa_saldoissa(), ["b"])
+
+        self.rekisteri.osta_lounas("a")
+        self.rekisteri.osta_lounas("a")
+        self.rekisteri.lataa("b", 1)
+
+        self.assertEqual(self.rekisteri.vahissa_saldoissa(), ["a"])
+
+    def test_epaonnistuneita_tapahtumia_ei_kirjata(self):
+        self.rekisteri.lisaa_kortti("a", 1)
+
+        self.assertFalse(self.rekisteri.osta_lounas("a"))
+        self.assertFalse(self.rekisteri.lataa("a", -5))
+        self.assertEqual(self.rekisteri.myytyja_lounaita(), 0)
+
+    def test_valilyonnillinen_tunniste_hylataan_ja_rekisterin_voi_avata(self):
+        self.rekisteri.lisaa_kortti("a", 10)
+
+        self.assertRaises(ValueError, self.rekisteri.lisaa_kortti, "matti m", 10)
+        self.assertRaises(ValueError, self.rekisteri.lisaa_kortti, "", 10)
+        self.rekisteri.sulje()
+
+        with Korttirekisteri(self.polku) as rekisteri:
+            self.assertEqual(len(rekisteri), 1)
+            self.assertEqual(rekisteri.hae("a").saldo(), 10)
+
+    def test_muu_kuin_merkkijonotunniste_hylataan_ja_rekisterin_voi_avata(self):
+        self.assertRaises(TypeError, self.rekisteri.lisaa_kortti, 1, 10)
+        self.rekisteri.lisaa_kortti("1", 10)
+        self.rekisteri.sulje()
+
+        with Korttirekisteri(self.polku) as rekisteri:
+            self.assertEqual(rekisteri.hae("1").saldo(), 10)
+
+    def test_muu_kuin_kokonaislukusumma_hylataan_ja_rekisterin_voi_avata(self):
+        self.assertRaises(TypeError, self.rekisteri.lisaa_kortti, "a", 2.5)
+        self.assertRaises(TypeError, self.rekisteri.lisaa_kortti, "a", "10")
+        self.rekisteri.lisaa_kortti("a", 10)
+        self.assertRaises(TypeError, self.rekisteri.lataa, "a", 2.5)
+        self.assertRaises(TypeError, self.rekisteri.lataa, "a", True)
+        self.rekisteri.sulje()
+
+        with Korttirekisteri(self.polku) as rekisteri:
+            self.assertEqual(rekisteri.hae("a").saldo(), 10)
+
+    def test_tila_palautetaan_tilikirjasta(self):
+        self.rekisteri.lisaa_kortti("a", 10)
+        self.rekisteri.lisaa_kortti("b", 0)
+        self.rekisteri.osta_lounas("a")
+        self.rekisteri.lataa("b", 7)
+        self.rekisteri.sulje()
+
+        with Korttirekisteri(self.polku) as rekisteri:
+            self.assertEqual(rekisteri.hae("a").saldo(), 5)
+            self.assertEqual(rekisteri.hae("b").saldo(), 7)
+            self.assertEqual(rekisteri.myytyja_lounaita(), 1)
+            self.assertEqual(rekisteri.vahissa_saldoissa(), [])
+
+    def test_tiivistys_lyhentaa_tilikirjan_ja_sailyttaa_tilan(self):
+        with Korttirekisteri(self.polku, tiivistysraja=10) as rekisteri:
+            rekisteri.lisaa_kortti("a", 0)
+            for _ in range(25):
+                rekisteri.lataa("a", HINTA)
+                rekisteri.osta_lounas("a")
+
+        with open(self.polku, encoding="utf-8") as tiedosto:
+            self.assertLess(len(tiedosto.readlines()), 12)
+
+        with Korttirekisteri(self.polku) as rekisteri:
+            self.assertEqual(rekisteri.hae("a").saldo(), 0)
+            self.assertEqual(rekisteri.myytyja_lounaita(), 25)
+
+    def test_kesken_jaanyt_rivi_ohitetaan(self):
+        self.rekisteri.lisaa_kortti("a", 10)
+        self.rekisteri.sulje()
+        with open(self.polku, "a", encoding="utf-8") as tiedosto:
+            tiedosto.write("L a 10")
+
+        with Korttirekisteri(self.polku) as rekisteri:
+            rekisteri.osta_lounas("a")
+
+        with Korttirekisteri(self.polku) as rekisteri:
+            self.assertEqual(rekisteri.hae("a").saldo(), 5)
@@ -0,0 +1,135 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from kauppa import ota_varastosta, palauta_korista
+from ostoskori import Ostoskori
+
+
+class Asiointikauppa:
+    # Kauppa, joka palvelee useaa asiakasta yhtä aikaa. Ostoskorit ovat
+    # istunnon tunnisteen takana, ja niitä pidetään muistissa korkeintaan
+    # koreja kappaletta. Kori vanhenee, kun sitä ei ole käytetty
+    # vanhenemisajan kuluessa, ja sen tuotteet palautetaan varastoon.
+    def __init__(self, varasto, pankki, viitegeneraattori, koreja=100_000, vanhenemisaika=1800, kello=time.monotonic):
+        self._varasto = varasto
+        self._pankki = pankki
+        self._viitegeneraattori = viitegeneraattori
+        self._kaupan_tili = "33333-44455"
+        self._koreja = koreja
+        self._vanhenemisaika = vanhenemisaika
+        self._kello = kello
+        # istunto -> [ostoskori, viimeisin käyttö], vanhimmin käytetty ensin
+        self._korit = OrderedDict()
+        self._lukko = Lock()
+
+    def __len__(self):
+        return len(self._korit)
+
+    def aloita_asiointi(self, istunto):
+        with self._lukko:
+            vanha = self._korit.pop(istunto, None)
+            self._korit[istunto] = [Ostoskori(), self._kello()]
+            poistettavat = self._vanhentuneet()
+
+        if vanha:
+            self._palauta_kori(vanha[0])
+        self._palauta_korit(poistettavat)
+
+    def lisaa_koriin(self, istunto, id):
+        ostoskori = self._kori(istunto)
+        tuote = ota_varastosta(self._varasto, id)
+
+        if not tuote:
+            return
+
+        # kori on voitu poistaa ja sen tuotteet palauttaa sillä välin, kun
+        # tuotetta otettiin varastosta, jolloin otettu tuote palautetaan
+        with self._lukko:
+            if self._voimassa(istunto, ostoskori):
+                ostoskori.lisaa(tuote)
+                return
+
+        self._varasto.palauta_varastoon(tuote)
+
+    def poista_korista(self, istunto, id):
+        ostoskori = self._kori(istunto)
+        tuote = self._varasto.hae_tuote(id)
+
+        with self._lukko:
+            if self._voimassa(istunto, ostoskori):
+                palauta_korista(self._varasto, ostoskori, tuote)
+
+    def tilimaksu(self, istunto, nimi, tili_numero):
+        # kori otetaan pois maksun ajaksi, jottei sitä vanhenneta tai makseta
+        # kahdesti; jos maksu ei onnistu, kori palautetaan istunnolle
+        with self._lukko:
+            ostoskori, _ = self._korit.pop(istunto)
+
+        onnistui = False
+        try:
+            viite = self._viitegeneraattori.uusi()
+            onnistui = self._pankki.tilisiirto(nimi, viite, tili_numero, self._kaupan_tili, ostoskori.hinta())
+        finally:
+            if not onnistui:
+                self._palauta_istunnolle(istunto, ostoskori)
+
+        return onnistui
+
+    def _palauta_istunnolle(self, istunto, ostoskori):
+        with self._lukko:
+            # istunto on voitu aloittaa maksun aikana uudelleen, jolloin
+            # vanhan korin tuotteet palautetaan varastoon
+            if istunto in self._korit:
+                palautettavat = [ostoskori]
+            else:
+                self._korit[istunto] = [ostoskori, self._kello()]
+                palautettavat = self._vanhentuneet()
+
+        self._palauta_korit(palautettavat)
+
+    def siivoa(self):
+        with self._lukko:
+            poistettavat = self._vanhentuneet()
+
+        self._palauta_korit(poistettavat)
+
+    def _kori(self, istunto):
+        with self._lukko:
+            kori = self._korit[istunto]
+            kori[1] = self._kello()
+            self._korit.move_to_end(istunto)
+            poistettavat = self._vanhentuneet()
+
+        self._palauta_korit(poistettavat)
+
+        return kori[0]
+
+    def _voimassa(self, istunto, ostoskori):
+        kori = self._korit.get(istunto)
+
+        return kori is not None and kori[0] is ostoskori
+
+    def _vanhentuneet(self):
+        # korit ovat käyttöjärjestyksessä, joten vanhentuneet ovat alussa
+        raja = self._kello() - self._vanhenemisaika
+        poistettavat = []
+
+        while self._korit:
+            istunto, (ostoskori, kaytetty) = next(iter(self._korit.items()))
+
+            if kaytetty > raja and len(self._korit) <= self._koreja:
+                break
+
+            del self._korit[istunto]
+            poistettavat.append(ostoskori)
+
+        return poistettavat
+
+    def _palauta_korit(self, ostoskorit):
+        for ostoskori in ostoskorit:
+            self._palauta_kori(ostoskori)
+
+    def _palauta_kori(self, ostoskori):
+        for tuote, maara in ostoskori.tuotteet():
+            for _ in range(maara):
+                self._varasto.palauta_varastoon(tuote)
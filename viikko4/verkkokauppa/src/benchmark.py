@@ -0,0 +1,267 @@
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from threading import Thread
+from asiointikauppa import Asiointikauppa
+from jaettu_viitegeneraattori import JaettuViitegeneraattori
+from kassajono import Kassajono
+from kauppa import Kauppa
+from kirjanpito import Kirjanpito
+from pankki import Pankki
+from pankki_stub import PankkiStub
+from pankkiasiakas import PankkiAsiakas
+from pankkipalvelin import PankkiPalvelin
+from rinnakkainen_varasto import RinnakkainenVarasto
+from tapahtumaloki import Tapahtumaloki
+from tilannekuva import TilannekuvaVarasto
+from tuote import Tuote
+from tuoteluettelo import lue_luettelo
+from varasto import Varasto
+from viitegeneraattori import Viitegeneraattori
+
+
+def luo_varasto(tuotteita, luokka=Varasto):
+    varasto = luokka(Kirjanpito())
+
+    varasto.lisaa_tuotteet(
+        (Tuote(id, f"tuote {id}", id % 50 + 1), 1_000_000) for id in range(6, tuotteita + 1)
+    )
+
+    return varasto
+
+
+def koriin_lisays(tuotteita, lisayksia=100_000):
+    varasto = luo_varasto(tuotteita)
+    kauppa = Kauppa(varasto, Pankki(Kirjanpito()), Viitegeneraattori())
+    kauppa.aloita_asiointi()
+
+    alku = time.perf_counter()
+    for i in range(lisayksia):
+        kauppa.lisaa_koriin(i % tuotteita + 1)
+    kesto = time.perf_counter() - alku
+
+    return lisayksia / kesto
+
+
+def rinnakkainen_koriin_lisays(saikeita, tuotteita=10_000, lisayksia=200_000):
+    varasto = luo_varasto(tuotteita, RinnakkainenVarasto)
+    pankki = Pankki(Kirjanpito())
+
+    def asioi(alku):
+        kauppa = Kauppa(varasto, pankki, Viitegeneraattori())
+        kauppa.aloita_asiointi()
+        for i in range(alku, alku + lisayksia // saikeita):
+            kauppa.lisaa_koriin(i % tuotteita + 1)
+
+    saikeet = [Thread(target=asioi, args=(i * 7919,)) for i in range(saikeita)]
+
+    alku = time.perf_counter()
+    for saie in saikeet:
+        saie.start()
+    for saie in saikeet:
+        saie.join()
+    kesto = time.perf_counter() - alku
+
+    return lisayksia / kesto
+
+
+def maksut(kassajono, viive, maksuja=500):
+    pankki = PankkiStub(viive)
+    viitegeneraattori = Viitegeneraattori()
+    jono = Kassajono(pankki, viitegeneraattori) if kassajono else None
+    kauppa = Kauppa(luo_varasto(10), pankki, viitegeneraattori, jono)
+
+    alku = time.perf_counter()
+    tulokset = []
+    for i in range(maksuja):
+        kauppa.aloita_asiointi()
+        kauppa.lisaa_koriin(i % 10 + 1)
+        if kassajono:
+            tulokset.append(kauppa.tilimaksu_jonoon("pekka", "12345"))
+        else:
+            kauppa.tilimaksu("pekka", "12345")
+    for tulos in tulokset:
+        tulos.result()
+    kesto = time.perf_counter() - alku
+
+    if jono:
+        jono.sulje()
+
+    return maksuja / kesto
+
+
+def viitteiden_varaus(polku, maara=2_000_000):
+    viitegeneraattori = JaettuViitegeneraattori(polku, lohkon_koko=100_000)
+
+    alku = time.perf_counter()
+    for _ in range(maara):
+        viitegeneraattori.uusi()
+
+    return maara / (time.perf_counter() - alku)
+
+
+async def verkkomaksut(viive, maksuja=2_000):
+    palvelin = PankkiPalvelin(viive)
+    await palvelin.kaynnista()
+    asiakas = PankkiAsiakas("127.0.0.1", palvelin.portti, Kirjanpito(), yhteyksia=50)
+
+    alku = time.perf_counter()
+    await asyncio.gather(
+        *(asiakas.tilisiirto("pekka", viite, "12345", "33333-44455", 5) for viite in range(maksuja))
+    )
+    kesto = time.perf_counter() - alku
+
+    await asiakas.sulje()
+    await palvelin.sulje()
+
+    return maksuja / kesto
+
+
+def selailu(luokka, lukijoita, tuotteita=10_000, lukuja=200_000):
+    varasto = luo_varasto(tuotteita, luokka)
+    valmis = False
+
+    def kirjoita():
+        i = 0
+        while not valmis:
+            tuote = varasto.hae_tuote(i % tuotteita + 1)
+            varasto.ota_varastosta(tuote)
+            varasto.palauta_varastoon(tuote)
+            i += 1
+
+    def lue(alku):
+        for i in range(alku, alku + lukuja // lukijoita):
+            varasto.saldo(i % tuotteita + 1)
+
+    kirjoittaja = Thread(target=kirjoita)
+    lukijat = [Thread(target=lue, args=(i * 7919,)) for i in range(lukijoita)]
+    kirjoittaja.start()
+
+    alku = time.perf_counter()
+    for lukija in lukijat:
+        lukija.start()
+    for lukija in lukijat:
+        lukija.join()
+    kesto = time.perf_counter() - alku
+
+    valmis = True
+    kirjoittaja.join()
+
+    return lukuja / kesto
+
+
+def lokin_toisto(hakemisto, tapahtumia, tilannekuvan_vali):
+    with Tapahtumaloki(hakemisto, tilannekuvan_vali) as loki:
+        for i in range(tapahtumia):
+            loki.kirjaa_saldo(i % 10_000, -1 if i % 3 else 1)
+
+    alku = time.perf_counter()
+    loki = Tapahtumaloki(hakemisto)
+    kesto = time.perf_counter() - alku
+    loki.sulje()
+
+    return loki.toistettuja, kesto
+
+
+def istunnot(koreja=100_000, tuotteita=10_000):
+    varasto = luo_varasto(tuotteita)
+    kauppa = Asiointikauppa(varasto, Pankki(Kirjanpito()), Viitegeneraattori(), koreja=koreja)
+    viiveet = []
+
+    tracemalloc.start()
+    for istunto in range(koreja):
+        kauppa.aloita_asiointi(istunto)
+    for kierros in range(3):
+        for istunto in range(koreja):
+            alku = time.perf_counter()
+            kauppa.lisaa_koriin(istunto, (istunto * 31 + kierros) % tuotteita + 1)
+            viiveet.append(time.perf_counter() - alku)
+    muisti, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    viiveet.sort()
+    return len(kauppa), muisti / 2**20, viiveet[len(viiveet) // 2], viiveet[len(viiveet) * 99 // 100]
+
+
+def kirjoita_luettelo(polku, tuotteita):
+    with open(polku, "w", encoding="utf-8") as tiedosto:
+        tiedosto.write("id,nimi,hinta,saldo\n")
+        for id in range(1, tuotteita + 1):
+            tiedosto.write(f"{id},tuote {id % 5000},{id % 50}.{id % 100:02},{id % 200}\n")
+
+
+def kaytetty_muisti():
+    # prosessin nykyinen muistinkäyttö tavuina; ru_maxrss ei kelpaa, koska
+    # aliprosessi perii sen huippuarvon äitiprosessilta (myös execin yli)
+    with open("/proc/self/statm") as tiedosto:
+        return int(tiedosto.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def luettelon_lataus(polku):
+    # ajetaan omassa prosessissaan, jotta muistinkäyttö on vertailukelpoinen
+    muisti_alussa = kaytetty_muisti()
+
+    alku = time.perf_counter()
+    luettelo = lue_luettelo(polku)
+    kesto = time.perf_counter() - alku
+
+    muisti = kaytetty_muisti() - muisti_alussa
+
+    return len(luettelo), kesto, muisti / 2**20
+
+
+def main():
+    for tuotteita in (10, 1_000, 10_000, 200_000):
+        print(f"tuotteita {tuotteita:>7}: {koriin_lisays(tuotteita):>12.0f} koriin lisäystä/s")
+
+    for saikeita in (1, 2, 4, 8, 16):
+        print(f"säikeitä {saikeita:>8}: {rinnakkainen_koriin_lisays(saikeita):>12.0f} koriin lisäystä/s")
+
+    for lukijoita in (1, 4, 16):
+        print(
+            f"lukijoita {lukijoita:>2}: {selailu(RinnakkainenVarasto, lukijoita):>10.0f} saldoa/s lukoilla, "
+            f"{selailu(TilannekuvaVarasto, lukijoita):>10.0f} saldoa/s tilannekuvasta"
+        )
+
+    koreja, muisti, mediaani, p99 = istunnot()
+    print(
+        f"{koreja} avointa koria: muistia {muisti:.0f} MiB, lisäys koriin "
+        f"mediaani {mediaani * 1e6:.1f} µs, p99 {p99 * 1e6:.1f} µs (tracemalloc päällä)"
+    )
+
+    for viive in (0.001, 0.005):
+        print(
+            f"pankin viive {viive * 1000:.0f} ms: {maksut(False, viive):>8.0f} maksua/s yksitellen, "
+            f"{maksut(True, viive):>8.0f} maksua/s erissä"
+        )
+
+    for viive in (0.001, 0.005, 0.02):
+        print(f"verkkopankin viive {viive * 1000:.0f} ms: {asyncio.run(verkkomaksut(viive)):>8.0f} maksua/s")
+
+    with tempfile.TemporaryDirectory() as hakemisto:
+        polku = os.path.join(hakemisto, "viitteet.db")
+        with ProcessPoolExecutor(max_workers=4) as prosessit:
+            for prosessi, nopeus in enumerate(prosessit.map(viitteiden_varaus, [polku] * 4)):
+                print(f"prosessi {prosessi}: {nopeus:>12.0f} viitettä/s")
+
+        for tapahtumia in (100_000, 1_000_000):
+            lokihakemisto = tempfile.mkdtemp(dir=hakemisto)
+            toistettuja, kesto = lokin_toisto(lokihakemisto, tapahtumia, tapahtumia * 2)
+            print(f"loki {tapahtumia} tapahtumaa: {toistettuja / kesto:>10.0f} tapahtumaa/s toistossa")
+
+            lokihakemisto = tempfile.mkdtemp(dir=hakemisto)
+            toistettuja, kesto = lokin_toisto(lokihakemisto, tapahtumia, 10_000)
+            print(f"loki {tapahtumia} tapahtumaa tilannekuvin: palautus {kesto * 1000:.1f} ms")
+
+        polku = os.path.join(hakemisto, "luettelo.csv")
+        kirjoita_luettelo(polku, 1_000_000)
+        with ProcessPoolExecutor(max_workers=1) as prosessit:
+            tuotteita, kesto, muisti = prosessit.submit(luettelon_lataus, polku).result()
+        print(f"luettelo {tuotteita} tuotetta: ladattu {kesto:.2f} s, muistia {muisti:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import sqlite3
+from threading import Lock
+
+
+def tarkiste(perusosa):
+    # suomalaisen viitenumeron tarkiste: numerot painotetaan oikealta
+    # vasemmalle kertoimin 7, 3, 1, 7, 3, 1, ...
+    summa = 0
+    painot = (7, 3, 1)
+
+    for i, numero in enumerate(reversed(str(perusosa))):
+        summa += int(numero) * painot[i % 3]
+
+    return (10 - summa % 10) % 10
+
+
+# viitenumerossa on tarkisteineen 4-20 numeroa, joten perusosassa 3-19
+PIENIN_PERUSOSA = 100
+SUURIN_PERUSOSA = 10**19 - 1
+
+
+def viitenumero(perusosa):
+    if not PIENIN_PERUSOSA <= perusosa <= SUURIN_PERUSOSA:
+        raise ValueError(f"viitenumeron perusosassa pitää olla 3-19 numeroa: {perusosa}")
+
+    return perusosa * 10 + tarkiste(perusosa)
+
+
+class JaettuViitegeneraattori:
+    # Useampi prosessi voi jakaa saman laskurin SQLite-tiedoston kautta.
+    # Jokainen prosessi vuokraa laskurista oman lohkonsa, ja lohkon sisällä
+    # viitteet jaetaan ilman lukitusta ja ilman yhteyttä tiedostoon.
+    def __init__(self, polku, lohkon_koko=10_000, tarkisteella=False):
+        self._polku = polku
+        self._lohkon_koko = lohkon_koko
+        self._tarkisteella = tarkisteella
+        self._lohko = iter(())
+        self._lukko = Lock()
+        self._alusta()
+
+    def uusi(self):
+        perusosa = next(self._lohko, None)
+
+        if perusosa is None:
+            with self._lukko:
+                perusosa = next(self._lohko, None)
+                if perusosa is None:
+                    self._lohko = iter(self._vuokraa(self._lohkon_koko))
+                    perusosa = next(self._lohko)
+
+        return self._viite(perusosa)
+
+    def varaa_lohko(self, koko):
+        lohko = self._vuokraa(koko)
+
+        if self._tarkisteella:
+            return [self._viite(perusosa) for perusosa in lohko]
+
+        return lohko
+
+    def _viite(self, laskuri):
+        # laskuri alkaa kahdesta, joten tarkisteellisten viitteiden perusosa
+        # siirretään alkamaan sadasta, jotta viitteet ovat kelvollisia
+        if not self._tarkisteella:
+            return laskuri
+
+        return viitenumero(laskuri + PIENIN_PERUSOSA)
+
+    def _yhteys(self):
+        return sqlite3.connect(self._polku, timeout=30, isolation_level=None)
+
+    def _alusta(self):
+        yhteys = self._yhteys()
+        try:
+            yhteys.execute("CREATE TABLE IF NOT EXISTS laskuri (seuraava INTEGER NOT NULL)")
+            yhteys.execute("BEGIN IMMEDIATE")
+            if yhteys.execute("SELECT COUNT(*) FROM laskuri").fetchone()[0] == 0:
+                yhteys.execute("INSERT INTO laskuri VALUES (2)")
+            yhteys.execute("COMMIT")
+        finally:
+            yhteys.close()
+
+    def _vuokraa(self, koko):
+        yhteys = self._yhteys()
+        try:
+            yhteys.execute("BEGIN IMMEDIATE")
+            alku = yhteys.execute("SELECT seuraava FROM laskuri").fetchone()[0]
+            yhteys.execute("UPDATE laskuri SET seuraava = ?", (alku + koko,))
+            yhteys.execute("COMMIT")
+        finally:
+            yhteys.close()
+
+        return range(alku, alku + koko)
@@ -0,0 +1,102 @@
+import time
+from concurrent.futures import Future
+from queue import Empty, Queue
+from threading import Thread
+
+_LOPETA = object()
+
+
+class Kassajono:
+    # Kerää valmiit ostokset ja lähettää niiden tilisiirrot pankille erissä.
+    # Erä lähtee, kun siinä on eran_koko siirtoa tai kun ensimmäinen siirto on
+    # odottanut odotusaika sekuntia. Viitenumerot varataan viitegeneraattorilta
+    # lohkoina, joten jokainen maksu ei vaadi omaa kutsuaan.
+    def __init__(self, pankki, viitegeneraattori, eran_koko=100, odotusaika=0.01, viitelohko=1_000):
+        self._pankki = pankki
+        self._viitegeneraattori = viitegeneraattori
+        self._eran_koko = eran_koko
+        self._odotusaika = odotusaika
+        self._viitelohko = viitelohko
+        self._viitteet = iter(())
+        self._jono = Queue()
+        self._lahettaja = Thread(target=self._laheta, daemon=True)
+        self._lahettaja.start()
+
+    def lisaa(self, nimi, tililta, tilille, summa):
+        tulos = Future()
+        self._jono.put((nimi, tililta, tilille, summa, tulos))
+
+        return tulos
+
+    def sulje(self):
+        self._jono.put(_LOPETA)
+        self._lahettaja.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.sulje()
+
+    def _uusi_viite(self):
+        viite = next(self._viitteet, None)
+
+        if viite is None:
+            self._viitteet = iter(self._viitegeneraattori.varaa_lohko(self._viitelohko))
+            viite = next(self._viitteet)
+
+        return viite
+
+    def _seuraava_era(self):
+        era = [self._jono.get()]
+        takaraja = time.monotonic() + self._odotusaika
+
+        while len(era) < self._eran_koko and era[-1] is not _LOPETA:
+            jaljella = takaraja - time.monotonic()
+            if jaljella <= 0:
+                break
+
+            try:
+                era.append(self._jono.get(timeout=jaljella))
+            except Empty:
+                break
+
+        return era
+
+    def _laheta(self):
+        while True:
+            era = self._seuraava_era()
+            lopeta = era[-1] is _LOPETA
+            maksut = era[:-1] if lopeta else era
+
+            if maksut:
+                self._laheta_era(maksut)
+
+            if lopeta:
+                return
+
+    def _laheta_era(self, maksut):
+        # peruttuja tilauksia ei lähetetä pankille, ja muut merkitään
+        # käsittelyssä oleviksi, jolloin niitä ei voi enää perua
+        maksut = [maksu for maksu in maksut if maksu[-1].set_running_or_notify_cancel()]
+        if not maksut:
+            return
+
+        # mikään virhe ei saa pysäyttää lähettäjää, muuten jonossa odottavat
+        # tilaukset jäisivät valmistumatta
+        try:
+            siirrot = [
+                (nimi, self._uusi_viite(), tililta, tilille, summa)
+                for nimi, tililta, tilille, summa, _ in maksut
+            ]
+            tulokset = list(self._pankki.tilisiirrot(siirrot))
+
+            if len(tulokset) != len(maksut):
+                raise ValueError(f"pankki palautti {len(tulokset)} tulosta {len(maksut)} tilisiirrolle")
+        except Exception as virhe:
+            for *_, tulos in maksut:
+                tulos.set_exception(virhe)
+            return
+
+        for (*_, tulos), onnistui in zip(maksut, tulokset):
+            tulos.set_result(onnistui)
@@ -1,10 +1,30 @@
 from ostoskori import Ostoskori
 
+
+def ota_varastosta(varasto, id):
+    # palauttaa varastosta otetun tuotteen tai None, jos saldo on loppunut;
+    # saldo on voinut loppua tarkistuksen jälkeen, jos varastoa käyttää
+    # useampi asiointi yhtä aikaa
+    if varasto.saldo(id) > 0:
+        tuote = varasto.hae_tuote(id)
+
+        if varasto.ota_varastosta(tuote):
+            return tuote
+
+    return None
+
+
+def palauta_korista(varasto, ostoskori, tuote):
+    if ostoskori.poista(tuote):
+        varasto.palauta_varastoon(tuote)
+
+
 class Kauppa:
-    def __init__(self, varasto, pankki,viitegeneraattori):
+    def __init__(self, varasto, pankki,viitegeneraattori, kassajono=None):
         self._varasto = varasto
         self._pankki = pankki
         self._viitegeneraattori = viitegeneraattori
+        self._kassajono = kassajono
         self._kaupan_tili = "33333-44455"
 
 
@@ -13,17 +33,23 @@ class Kauppa:
 
     def poista_korista(self, id):
         tuote = self._varasto.hae_tuote(id)
-        self._ostoskori.poista(tuote)
-        self._varasto.palauta_varastoon(tuote)
+        palauta_korista(self._varasto, self._ostoskori, tuote)
 
     def lisaa_koriin(self, id):
-        if self._varasto.saldo(id) > 0:
-            tuote = self._varasto.hae_tuote(id)
+        tuote = ota_varastosta(self._varasto, id)
+
+        if tuote:
             self._ostoskori.lisaa(tuote)
-            self._varasto.ota_varastosta(tuote)
 
     def tilimaksu(self, nimi, tili_numero):
         viite = self._viitegeneraattori.uusi()
         summa = self._ostoskori.hinta()
 
         return self._pankki.tilisiirto(nimi, viite, tili_numero, self._kaupan_tili, summa)
+
+    def tilimaksu_jonoon(self, nimi, tili_numero):
+        # palauttaa Future-olion, joka valmistuu kun pankki on käsitellyt erän
+        if self._kassajono is None:
+            raise RuntimeError("kaupalle ei ole annettu kassajonoa")
+
+        return self._kassajono.lisaa(nimi, tili_numero, self._kaupan_tili, self._ostoskori.hinta())
@@ -1,9 +1,20 @@
+def muotoile(tapahtuma):
+    # viestit muotoillaan vasta luettaessa, jotta kirjaaminen on halpaa
+    muoto, arvot = tapahtuma
+
+    return muoto.format(*arvot) if arvot else muoto
+
+
 class Kirjanpito:
     def __init__(self):
-        self.tapahtumat = []
+        self._tapahtumat = []
+
+    @property
+    def tapahtumat(self):
+        return [muotoile(tapahtuma) for tapahtuma in self._tapahtumat]
 
-    def lisaa_tapahtuma(self, tapahtuma):
-        self.tapahtumat.append(tapahtuma)
+    def lisaa_tapahtuma(self, muoto, *arvot):
+        self._tapahtumat.append((muoto, arvot))
 
 
 kirjanpito = Kirjanpito()
@@ -0,0 +1,49 @@
+from kirjanpito import kirjanpito as default_kirjanpito
+from varasto import Varasto
+
+
+class LuetteloVarasto(Varasto):
+    # varasto, jonka tuotteet ja saldot ovat tiedostosta luetussa luettelossa
+    def __init__(self, luettelo, kirjanpito=default_kirjanpito):
+        self._luettelo = luettelo
+        super().__init__(kirjanpito)
+
+    def lisaa_tuote(self, tuote, saldo):
+        self._luettelo.aseta(tuote.id, tuote.nimi, round(tuote.hinta * 100), saldo)
+
+    def hae_tuote(self, id):
+        rivi = self._luettelo.rivi(id)
+
+        return None if rivi is None else self._luettelo.tuote(rivi)
+
+    def saldo(self, id):
+        return self._luettelo.saldot[self._rivi(id)]
+
+    def ota_varastosta(self, tuote):
+        rivi = self._rivi(tuote.id)
+
+        if self._luettelo.saldot[rivi] <= 0:
+            return False
+
+        self._luettelo.saldot[rivi] -= 1
+
+        self._kirjanpito.lisaa_tapahtuma("otettiin varastosta {}", tuote)
+
+        return True
+
+    def palauta_varastoon(self, tuote):
+        self._luettelo.saldot[self._rivi(tuote.id)] += 1
+
+        self._kirjanpito.lisaa_tapahtuma("palautettiin varastoon {}", tuote)
+
+    def _rivi(self, id):
+        # tuntematon id on KeyError kuten Varastossa
+        rivi = self._luettelo.rivi(id)
+
+        if rivi is None:
+            raise KeyError(id)
+
+        return rivi
+
+    def _alusta_tuotteet(self):
+        pass
@@ -1,16 +1,46 @@
 class Ostoskori:
     def __init__(self):
-        self._tuotteet = []
-    
+        # tuotteen id -> [tuote, kappalemäärä]
+        self._rivit = {}
+        self._hinta = 0
+        self._tavaroita = 0
+
     def lisaa(self, tuote):
-        self._tuotteet.append(tuote)
-    
+        rivi = self._rivit.get(tuote.id)
+
+        if rivi is None:
+            self._rivit[tuote.id] = [tuote, 1]
+        else:
+            rivi[1] += 1
+
+        self._hinta += tuote.hinta
+        self._tavaroita += 1
+
     def poista(self, tuote):
-        self._tuotteet = list(
-            filter(lambda t: t.id != tuote.id, self._tuotteet)
-        )
+        rivi = self._rivit.get(tuote.id)
 
-    def hinta(self):
-        hinnat = map(lambda t: t.hinta, self._tuotteet)
+        if rivi is None:
+            return False
+
+        rivi[1] -= 1
+        if rivi[1] == 0:
+            del self._rivit[tuote.id]
+
+        self._hinta -= rivi[0].hinta
+        self._tavaroita -= 1
 
-        return sum(hinnat)
+        return True
+
+    def maara(self, tuote):
+        rivi = self._rivit.get(tuote.id)
+
+        return rivi[1] if rivi else 0
+
+    def tuotteet(self):
+        return [(tuote, maara) for tuote, maara in self._rivit.values()]
+
+    def tavaroita_korissa(self):
+        return self._tavaroita
+
+    def hinta(self):
+        return self._hinta
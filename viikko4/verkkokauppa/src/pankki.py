@@ -7,11 +7,21 @@ class Pankki:
 
     def tilisiirto(self, nimi, viitenumero, tililta, tilille, summa):
         self._kirjanpito.lisaa_tapahtuma(
-            f"tilisiirto: tililtä {tililta} tilille {tilille} viite {viitenumero} summa {summa}e"
+            "tilisiirto: tililtä {} tilille {} viite {} summa {}e", tililta, tilille, viitenumero, summa
         )
 
         # täällä olisi koodi joka ottaa yhteyden pankin verkkorajapintaan
         return True
 
+    def tilisiirrot(self, siirrot):
+        # siirrot ovat (nimi, viitenumero, tililta, tilille, summa)-monikoita,
+        # ja ne lähetettäisiin pankille yhdellä pyynnöllä
+        for _, viitenumero, tililta, tilille, summa in siirrot:
+            self._kirjanpito.lisaa_tapahtuma(
+                "tilisiirto: tililtä {} tilille {} viite {} summa {}e", tililta, tilille, viitenumero, summa
+            )
+
+        return [True] * len(siirrot)
+
 
 pankki = Pankki()
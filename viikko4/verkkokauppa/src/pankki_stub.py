@@ -0,0 +1,26 @@
+import time
+from kirjanpito import Kirjanpito
+from pankki import Pankki
+
+
+class PankkiStub(Pankki):
+    # paikallinen pankki suorituskykymittauksiin: jokainen pyyntö pankille
+    # kestää viiveen verran riippumatta siitä, montako siirtoa siinä on
+    def __init__(self, viive=0.005, kirjanpito=None):
+        super().__init__(kirjanpito or Kirjanpito())
+        self._viive = viive
+        self.pyyntoja = 0
+
+    def tilisiirto(self, nimi, viitenumero, tililta, tilille, summa):
+        self._odota()
+
+        return super().tilisiirto(nimi, viitenumero, tililta, tilille, summa)
+
+    def tilisiirrot(self, siirrot):
+        self._odota()
+
+        return super().tilisiirrot(siirrot)
+
+    def _odota(self):
+        self.pyyntoja += 1
+        time.sleep(self._viive)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import time
+from threading import Lock
+from kirjanpito import kirjanpito as default_kirjanpito
+
+
+class PankkiaEiTavoiteta(Exception):
+    pass
+
+
+class PalvelinVirhe(Exception):
+    pass
+
+
+class Katkaisin:
+    # Kun pankki on epäonnistunut raja kertaa peräkkäin, pyyntöjä ei lähetetä
+    # palautumisajan kuluessa lainkaan. Sen jälkeen yksi pyyntö päästetään
+    # kokeiluksi läpi ja muut hylätään, kunnes kokeilu on ratkennut: onnistuminen
+    # sulkee katkaisimen ja epäonnistuminen avaa sen uudelleen. Jos kokeilun
+    # tulosta ei kuulu palautumisajan kuluessa, uusi kokeilu sallitaan.
+    def __init__(self, raja=5, palautumisaika=1.0):
+        self._raja = raja
+        self._palautumisaika = palautumisaika
+        self._perakkaiset_virheet = 0
+        self._avattu = None
+        self._kokeilu = None
+        self._lukko = Lock()
+
+    def sallii(self):
+        with self._lukko:
+            if self._avattu is None:
+                return True
+
+            nyt = time.monotonic()
+            if nyt - self._avattu < self._palautumisaika:
+                return False
+            if self._kokeilu is not None and nyt - self._kokeilu < self._palautumisaika:
+                return False
+
+            self._kokeilu = nyt
+            return True
+
+    def onnistui(self):
+        with self._lukko:
+            self._perakkaiset_virheet = 0
+            self._avattu = None
+            self._kokeilu = None
+
+    def epaonnistui(self):
+        with self._lukko:
+            self._perakkaiset_virheet += 1
+
+            if self._kokeilu is not None or self._perakkaiset_virheet >= self._raja:
+                self._avattu = time.monotonic()
+                self._kokeilu = None
+
+
+class PankkiAsiakas:
+    # Pankki-luokan asynkroninen vastine, joka ottaa oikeasti yhteyden pankin
+    # verkkorajapintaan. Yhteydet pidetään auki ja käytetään uudelleen, ja
+    # samanaikaisten pyyntöjen määrä on rajattu yhteyksien määrään.
+    def __init__(
+        self,
+        isanta,
+        portti,
+        kirjanpito=default_kirjanpito,
+        yhteyksia=10,
+        aikaraja=1.0,
+        yrityksia=5,
+        odotus=0.05,
+        katkaisin=None,
+    ):
+        self._isanta = isanta
+        self._portti = portti
+        self._kirjanpito = kirjanpito
+        self._aikaraja = aikaraja
+        self._yrityksia = yrityksia
+        self._odotus = odotus
+        self._katkaisin = katkaisin or Katkaisin()
+        self._rajoitin = asyncio.Semaphore(yhteyksia)
+        self._vapaat = []
+
+    async def tilisiirto(self, nimi, viitenumero, tililta, tilille, summa):
+        runko = json.dumps(
+            {"nimi": nimi, "viite": viitenumero, "tililta": tililta, "tilille": tilille, "summa": summa}
+        ).encode()
+        # sama viite tarkoittaa samaa maksua, joten uusintayritys ei veloita kahdesti
+        avain = f"viite-{viitenumero}"
+
+        for yritys in range(self._yrityksia):
+            if not self._katkaisin.sallii():
+                raise PankkiaEiTavoiteta("katkaisin on auki")
+
+            try:
+                vastaus = await self._pyynto(runko, avain)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, PalvelinVirhe):
+                self._katkaisin.epaonnistui()
+                # viimeisen yrityksen jälkeen ei odoteta turhaan
+                if yritys < self._yrityksia - 1:
+                    await asyncio.sleep(self._odotus * 2**yritys)
+                continue
+
+            self._katkaisin.onnistui()
+            self._kirjanpito.lisaa_tapahtuma(
+                "tilisiirto: tililtä {} tilille {} viite {} summa {}e", tililta, tilille, viitenumero, summa
+            )
+
+            return vastaus["ok"]
+
+        raise PankkiaEiTavoiteta(f"tilisiirto viitteellä {viitenumero} epäonnistui")
+
+    async def sulje(self):
+        for _, kirjoittaja in self._vapaat:
+            kirjoittaja.close()
+            await kirjoittaja.wait_closed()
+
+        self._vapaat = []
+
+    async def _pyynto(self, runko, avain):
+        # aikaraja koskee vain pyyntöä, ei vapaan yhteyden odottamista
+        async with self._rajoitin:
+            if self._vapaat:
+                yhteys = self._vapaat.pop()
+            else:
+                yhteys = await asyncio.wait_for(
+                    asyncio.open_connection(self._isanta, self._portti), self._aikaraja
+                )
+
+            try:
+                tila, vastaus = await asyncio.wait_for(self._laheta(*yhteys, runko, avain), self._aikaraja)
+            except BaseException:
+                yhteys[1].close()
+                raise
+
+            self._vapaat.append(yhteys)
+
+        if tila >= 500:
+            raise PalvelinVirhe(tila)
+
+        return json.loads(vastaus)
+
+    async def _laheta(self, lukija, kirjoittaja, runko, avain):
+        kirjoittaja.write(
+            f"POST /tilisiirto HTTP/1.1\r\nHost: {self._isanta}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(runko)}\r\n"
+            f"Idempotency-Key: {avain}\r\n\r\n".encode()
+            + runko
+        )
+        await kirjoittaja.drain()
+
+        tilarivi = await lukija.readline()
+        if not tilarivi:
+            raise asyncio.IncompleteReadError(b"", None)
+
+        pituus = 0
+        while (rivi := await lukija.readline()) not in (b"\r\n", b""):
+            nimi, arvo = rivi.decode("latin-1").split(":", 1)
+            if nimi.strip().lower() == "content-length":
+                pituus = int(arvo)
+
+        return int(tilarivi.split()[1]), await lukija.readexactly(pituus)
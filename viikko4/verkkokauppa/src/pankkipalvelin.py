@@ -0,0 +1,88 @@
+import asyncio
+import json
+import random
+
+
+class PankkiPalvelin:
+    # Paikallinen pankin verkkorajapinnan korvike testeihin ja mittauksiin.
+    # Jokaiseen pyyntöön vastataan viiveen jälkeen, ja osa pyynnöistä voidaan
+    # hylätä tilakoodilla 503. Sama idempotenssiavain käsitellään vain kerran.
+    def __init__(self, viive=0.0, virhetodennakoisyys=0.0, siemen=None):
+        self.viive = viive
+        self.virhetodennakoisyys = virhetodennakoisyys
+        self.pyyntoja = 0
+        self.siirtoja = 0
+        self.portti = None
+        self._satunnainen = random.Random(siemen)
+        self._kasitellyt = set()
+        self._palvelin = None
+        self._yhteydet = set()
+
+    async def kaynnista(self, isanta="127.0.0.1", portti=0):
+        self._palvelin = await asyncio.start_server(self._palvele, isanta, portti)
+        self.portti = self._palvelin.sockets[0].getsockname()[1]
+
+    async def sulje(self):
+        self._palvelin.close()
+
+        for kirjoittaja in list(self._yhteydet):
+            kirjoittaja.close()
+
+        await self._palvelin.wait_closed()
+        while self._yhteydet:
+            await asyncio.sleep(0)
+
+    async def _palvele(self, lukija, kirjoittaja):
+        self._yhteydet.add(kirjoittaja)
+
+        try:
+            while True:
+                pyyntorivi = await lukija.readline()
+                if not pyyntorivi:
+                    break
+
+                otsakkeet = {}
+                while (rivi := await lukija.readline()) not in (b"\r\n", b""):
+                    nimi, arvo = rivi.decode("latin-1").split(":", 1)
+                    otsakkeet[nimi.strip().lower()] = arvo.strip()
+
+                await lukija.readexactly(int(otsakkeet.get("content-length", 0)))
+                tila, vastaus = await self._kasittele(otsakkeet.get("idempotency-key"))
+
+                runko = json.dumps(vastaus).encode()
+                kirjoittaja.write(
+                    f"HTTP/1.1 {tila} {'OK' if tila == 200 else 'Service Unavailable'}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(runko)}\r\n\r\n".encode()
+                    + runko
+                )
+                await kirjoittaja.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._yhteydet.discard(kirjoittaja)
+            kirjoittaja.close()
+
+    async def _kasittele(self, avain):
+        self.pyyntoja += 1
+        await asyncio.sleep(self.viive)
+
+        if self._satunnainen.random() < self.virhetodennakoisyys:
+            return 503, {"ok": False}
+
+        if avain not in self._kasitellyt:
+            self._kasitellyt.add(avain)
+            self.siirtoja += 1
+
+        return 200, {"ok": True}
+
+
+async def main():
+    palvelin = PankkiPalvelin(viive=0.01)
+    await palvelin.kaynnista(portti=8000)
+    print(f"pankki kuuntelee portissa {palvelin.portti}")
+
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
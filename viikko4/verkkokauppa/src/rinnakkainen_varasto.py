@@ -0,0 +1,35 @@
+from threading import Lock
+from kirjanpito import kirjanpito as default_kirjanpito
+from varasto import Varasto
+
+
+class RinnakkainenVarasto(Varasto):
+    # tuotteet jaetaan lukoille id:n perusteella, jolloin eri tuotteita
+    # käsittelevät säikeet eivät yleensä joudu odottamaan toisiaan
+    def __init__(self, kirjanpito=default_kirjanpito, lukkoja=64):
+        self._lukot = [Lock() for _ in range(lukkoja)]
+        super().__init__(kirjanpito)
+
+    def _lukko(self, id):
+        return self._lukot[hash(id) % len(self._lukot)]
+
+    def saldo(self, id):
+        with self._lukko(id):
+            return self._saldot[id]
+
+    def ota_varastosta(self, tuote):
+        with self._lukko(tuote.id):
+            if self._saldot[tuote.id] <= 0:
+                return False
+
+            self._saldot[tuote.id] -= 1
+
+        self._kirjanpito.lisaa_tapahtuma("otettiin varastosta {}", tuote)
+
+        return True
+
+    def palauta_varastoon(self, tuote):
+        with self._lukko(tuote.id):
+            self._saldot[tuote.id] += 1
+
+        self._kirjanpito.lisaa_tapahtuma("palautettiin varastoon {}", tuote)
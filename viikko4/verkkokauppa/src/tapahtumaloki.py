@@ -0,0 +1,187 @@
+import os
+import struct
+from threading import Lock
+from kirjanpito import kirjanpito as default_kirjanpito
+from pankki import Pankki
+from varasto import Varasto
+
+SALDO = 1
+MAKSU = 2
+
+# tapahtuma: tyyppi, tuotteen id tai viite, saldon muutos tai summa
+TAPAHTUMA = struct.Struct("<Bqq")
+# tilannekuvan otsake: lokin kohta, tuotteita, maksuja, myynti, viimeisin viite
+OTSAKE = struct.Struct("<Qqqqq")
+SALDORIVI = struct.Struct("<qq")
+
+
+class Kauppatila:
+    def __init__(self):
+        # saldojen muutokset suhteessa varaston alkuperäisiin saldoihin
+        self.saldomuutokset = {}
+        self.maksuja = 0
+        self.myynti = 0
+        self.viimeisin_viite = 0
+
+    def kasittele(self, tyyppi, a, b):
+        if tyyppi == SALDO:
+            self.saldomuutokset[a] = self.saldomuutokset.get(a, 0) + b
+        else:
+            self.maksuja += 1
+            self.myynti += b
+            self.viimeisin_viite = max(self.viimeisin_viite, a)
+
+
+class Tapahtumaloki:
+    # Varastotapahtumat ja maksut kirjoitetaan binäärimuodossa tiedoston
+    # perään. Joka tilannekuvan_vali:s tapahtuma tallennetaan koko tila
+    # tilannekuvaksi, joten käynnistyessä toistetaan vain sen jälkeiset
+    # tapahtumat riippumatta lokin pituudesta.
+    def __init__(self, hakemisto, tilannekuvan_vali=10_000):
+        self._hakemisto = hakemisto
+        self._lokin_polku = os.path.join(hakemisto, "tapahtumat.bin")
+        self._kuvan_polku = os.path.join(hakemisto, "tilannekuva.bin")
+        self._tilannekuvan_vali = tilannekuvan_vali
+        self._kuvan_jalkeen = 0
+        self._lukko = Lock()
+        self.tila, self.toistettuja = self._palauta()
+        self._tiedosto = open(self._lokin_polku, "ab")
+
+    def kirjaa_saldo(self, id, muutos):
+        self._kirjaa(SALDO, id, muutos)
+
+    def kirjaa_maksu(self, viite, summa):
+        self._kirjaa(MAKSU, viite, summa)
+
+    def tallenna_tilannekuva(self):
+        with self._lukko:
+            self._tallenna_tilannekuva()
+
+    def tyhjenna(self):
+        with self._lukko:
+            self._tiedosto.flush()
+            os.fsync(self._tiedosto.fileno())
+
+    def sulje(self):
+        self.tyhjenna()
+        self._tiedosto.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.sulje()
+
+    def _kirjaa(self, *tapahtuma):
+        with self._lukko:
+            self._tiedosto.write(TAPAHTUMA.pack(*tapahtuma))
+            self.tila.kasittele(*tapahtuma)
+            self._kuvan_jalkeen += 1
+
+            if self._kuvan_jalkeen >= self._tilannekuvan_vali:
+                self._tallenna_tilannekuva()
+
+    def _tallenna_tilannekuva(self):
+        # tilannekuvaan tallennettu lokin kohta ei saa osoittaa levylle
+        # ehtimättömän datan yli, muuten sen jälkeen kirjatut tapahtumat
+        # ohitettaisiin palautuksessa
+        self._tiedosto.flush()
+        os.fsync(self._tiedosto.fileno())
+        tila = self.tila
+        osat = [
+            OTSAKE.pack(
+                self._tiedosto.tell(), len(tila.saldomuutokset), tila.maksuja, tila.myynti, tila.viimeisin_viite
+            )
+        ]
+        osat.extend(SALDORIVI.pack(id, muutos) for id, muutos in tila.saldomuutokset.items())
+
+        # kirjoitetaan ensin väliaikaiseen tiedostoon, jotta kesken jäänyt
+        # tallennus ei koskaan korvaa edellistä ehjää tilannekuvaa
+        valiaikainen = self._kuvan_polku + ".tmp"
+        with open(valiaikainen, "wb") as tiedosto:
+            tiedosto.write(b"".join(osat))
+            tiedosto.flush()
+            os.fsync(tiedosto.fileno())
+        os.replace(valiaikainen, self._kuvan_polku)
+        self._tallenna_hakemisto()
+
+        self._kuvan_jalkeen = 0
+
+    def _tallenna_hakemisto(self):
+        # uudelleennimeäminen on pysyvä vasta, kun hakemisto on tallennettu;
+        # kaikki alustat eivät salli hakemiston avaamista
+        try:
+            kuvaaja = os.open(self._hakemisto, os.O_RDONLY)
+        except OSError:
+            return
+
+        try:
+            os.fsync(kuvaaja)
+        finally:
+            os.close(kuvaaja)
+
+    def _palauta(self):
+        tila = Kauppatila()
+        kohta = 0
+
+        if os.path.exists(self._kuvan_polku):
+            with open(self._kuvan_polku, "rb") as tiedosto:
+                data = tiedosto.read()
+
+            kohta, tuotteita, tila.maksuja, tila.myynti, tila.viimeisin_viite = OTSAKE.unpack_from(data)
+            rivit = data[OTSAKE.size:OTSAKE.size + tuotteita * SALDORIVI.size]
+            tila.saldomuutokset = dict(SALDORIVI.iter_unpack(rivit))
+
+        if not os.path.exists(self._lokin_polku):
+            return tila, 0
+
+        with open(self._lokin_polku, "rb") as tiedosto:
+            tiedosto.seek(kohta)
+            data = tiedosto.read()
+
+        # kaatumisen yhteydessä viimeinen tapahtuma on voinut jäädä kesken
+        ehjat = len(data) - len(data) % TAPAHTUMA.size
+        if ehjat < len(data):
+            os.truncate(self._lokin_polku, kohta + ehjat)
+
+        kasittele = tila.kasittele
+        for tapahtuma in TAPAHTUMA.iter_unpack(data[:ehjat]):
+            kasittele(*tapahtuma)
+
+        return tila, ehjat // TAPAHTUMA.size
+
+
+class PysyvaVarasto(Varasto):
+    def __init__(self, loki, kirjanpito=default_kirjanpito):
+        self._loki = loki
+        super().__init__(kirjanpito)
+
+    def lisaa_tuote(self, tuote, saldo):
+        super().lisaa_tuote(tuote, saldo + self._loki.tila.saldomuutokset.get(tuote.id, 0))
+
+    def ota_varastosta(self, tuote):
+        if not super().ota_varastosta(tuote):
+            return False
+
+        self._loki.kirjaa_saldo(tuote.id, -1)
+
+        return True
+
+    def palauta_varastoon(self, tuote):
+        super().palauta_varastoon(tuote)
+
+        self._loki.kirjaa_saldo(tuote.id, 1)
+
+
+class PysyvaPankki(Pankki):
+    def __init__(self, loki, kirjanpito=default_kirjanpito):
+        super().__init__(kirjanpito)
+        self._loki = loki
+
+    def tilisiirto(self, nimi, viitenumero, tililta, tilille, summa):
+        onnistui = super().tilisiirto(nimi, viitenumero, tililta, tilille, summa)
+
+        if onnistui:
+            self._loki.kirjaa_maksu(viitenumero, summa)
+
+        return onnistui
@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import Mock, ANY
+from asiointikauppa import Asiointikauppa
+from kirjanpito import Kirjanpito
+from varasto import Varasto
+from viitegeneraattori import Viitegeneraattori
+
+
+class TestAsiointikauppa(unittest.TestCase):
+    def setUp(self):
+        self.aika = 0
+        self.varasto = Varasto(Kirjanpito())
+        self.pankki_mock = Mock()
+        self.kauppa = Asiointikauppa(
+            self.varasto, self.pankki_mock, Viitegeneraattori(), koreja=3, vanhenemisaika=60, kello=lambda: self.aika
+        )
+
+    def test_istuntojen_korit_ovat_erillisia(self):
+        self.kauppa.aloita_asiointi("a")
+        self.kauppa.aloita_asiointi("b")
+        self.kauppa.lisaa_koriin("a", 1)
+        self.kauppa.lisaa_koriin("b", 3)
+        self.kauppa.lisaa_koriin("b", 3)
+
+        self.kauppa.tilimaksu("a", "pekka", "12345")
+        self.pankki_mock.tilisiirto.assert_called_with("pekka", ANY, "12345", ANY, 3)
+
+        self.kauppa.tilimaksu("b", "arto", "54321")
+        self.pankki_mock.tilisiirto.assert_called_with("arto", ANY, "54321", ANY, 10)
+
+    def test_maksettu_kori_poistuu_eika_palauta_saldoa(self):
+        self.kauppa.aloita_asiointi("a")
+        self.kauppa.lisaa_koriin("a", 1)
+        self.kauppa.tilimaksu("a", "pekka", "12345")
+
+        self.assertEqual(len(self.kauppa), 0)
+        self.assertEqual(self.varasto.saldo(1), 99)
+
+    def test_hylatty_maksu_sailyttaa_korin_ja_voidaan_yrittaa_uudelleen(self):
+        self.kauppa.aloita_asiointi("a")
+        self.kauppa.lisaa_koriin("a", 1)
+        self.kauppa.lisaa_koriin("a", 1)
+        self.pankki_mock.tilisiirto.return_value = False
+
+        self.assertFalse(self.kauppa.tilimaksu("a", "pekka", "12345"))
+        self.assertEqual(len(self.kauppa), 1)
+        self.assertEqual(self.varasto.saldo(1), 98)
+
+        self.pankki_mock.tilisiirto.return_value = True
+        self.assertTrue(self.kauppa.tilimaksu("a", "pekka", "12345"))
+        self.pankki_mock.tilisiirto.assert_called_with("pekka", ANY, "12345", ANY, 6)
+        self.assertEqual(len(self.kauppa), 0)
+
+    def test_maksun_virhe_sailyttaa_korin(self):
+        self.kauppa.aloita_asiointi("a")
+        self.kauppa.lisaa_koriin("a", 1)
+        self.kauppa.lisaa_koriin("a", 1)
+        self.pankki_mock.tilisiirto.side_effect = ConnectionError("pankki ei vastaa")
+
+        self.assertRaises(ConnectionError, self.kauppa.tilimaksu, "a", "pekka", "12345")
+        self.assertEqual(len(self.kauppa), 1)
+
+        # kori vanhenee normaalisti, jos asiakas ei yritä uudelleen
+        self.aika = 61
+        self.kauppa.siivoa()
+        self.assertEqual(self.varasto.saldo(1), 100)
+
+    def test_vanhentunut_kori_palauttaa_tuotteet_varastoon(self):
+        self.kauppa.aloita_asiointi("a")
+        self.kauppa.lisaa_koriin("a", 2)
+        self.kauppa.lisaa_koriin("a", 2)
+        self.assertEqual(self.varasto.saldo(2), 23)
+
+        self.aika = 61
+        self.kauppa.siivoa()
+
+        self.assertEqual(len(self.kauppa), 0)
+        self.assertEqual(self.varasto.saldo(2), 25)
+
+    def test_kaytossa_oleva_kori_ei_vanhene(self):
+        self.kauppa.aloita_asiointi("a")
+        self.aika = 50
+        self.kauppa.lisaa_koriin("a", 1)
+        self.aika = 100
+        self.kauppa.siivoa()
+
+        self.assertEqual(len(self.kauppa), 1)
+
+    def test_tayteen_kauppaan_mahtuu_uusi_kori_vanhimman_kustannuksella(self):
+        for istunto in ("a", "b", "c"):
+            self.kauppa.aloita_asiointi(istunto)
+            self.kauppa.lisaa_koriin(istunto, 5)
+
+        self.kauppa.aloita_asiointi("d")
+
+        self.assertEqual(len(self.kauppa), 3)
+        self.assertEqual(self.varasto.saldo(5), 13)
+        self.assertRaises(KeyError, self.kauppa.lisaa_koriin, "a", 5)
+
+    def test_uudelleen_aloitettu_asiointi_palauttaa_vanhan_korin(self):
+        self.kauppa.aloita_asiointi("a")
+        self.kauppa.lisaa_koriin("a", 4)
+        self.kauppa.aloita_asiointi("a")
+
+        self.assertEqual(self.varasto.saldo(4), 40)
+
+    def test_kesken_lisayksen_poistettu_kori_ei_hukkaa_tuotetta(self):
+        self.kauppa.aloita_asiointi("a")
+        ota_varastosta = self.varasto.ota_varastosta
+
+        def ota_ja_vanhenna(tuote):
+            # toinen säie vanhentaa korin juuri kun tuote on otettu varastosta
+            onnistui = ota_varastosta(tuote)
+            self.aika = 61
+            self.kauppa.siivoa()
+            return onnistui
+
+        self.varasto.ota_varastosta = ota_ja_vanhenna
+        self.kauppa.lisaa_koriin("a", 1)
+
+        self.assertEqual(len(self.kauppa), 0)
+        self.assertEqual(self.varasto.saldo(1), 100)
@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from threading import Thread
+from jaettu_viitegeneraattori import JaettuViitegeneraattori, tarkiste, viitenumero
+
+
+def varaa_viitteita(polku, maara):
+    viitegeneraattori = JaettuViitegeneraattori(polku, lohkon_koko=97)
+
+    return [viitegeneraattori.uusi() for _ in range(maara)]
+
+
+class TestJaettuViitegeneraattori(unittest.TestCase):
+    def setUp(self):
+        hakemisto = tempfile.TemporaryDirectory()
+        self.addCleanup(hakemisto.cleanup)
+        self.polku = os.path.join(hakemisto.name, "viitteet.db")
+
+    def test_tarkiste_lasketaan_painoilla_731(self):
+        self.assertEqual(tarkiste(123), 2)
+        self.assertEqual(viitenumero(1234561), 12345614)
+        self.assertEqual(viitenumero(100), 1009)
+
+    def test_liian_lyhyt_tai_pitka_perusosa_hylataan(self):
+        self.assertRaises(ValueError, viitenumero, 99)
+        self.assertRaises(ValueError, viitenumero, 10**19)
+        self.assertEqual(len(str(viitenumero(10**19 - 1))), 20)
+
+    def test_viitteet_jatkuvat_uudessa_instanssissa(self):
+        ensimmainen = JaettuViitegeneraattori(self.polku, lohkon_koko=10)
+        toinen = JaettuViitegeneraattori(self.polku, lohkon_koko=10)
+
+        self.assertEqual(ensimmainen.uusi(), 2)
+        self.assertEqual(toinen.uusi(), 12)
+        self.assertEqual(ensimmainen.uusi(), 3)
+
+    def test_viitteet_tarkisteella(self):
+        viitegeneraattori = JaettuViitegeneraattori(self.polku, tarkisteella=True)
+
+        self.assertEqual(viitegeneraattori.uusi(), viitenumero(102))
+        self.assertEqual(list(viitegeneraattori.varaa_lohko(2)), [viitenumero(10_102), viitenumero(10_103)])
+        self.assertEqual(viitenumero(102), 1025)
+
+    def test_saikeet_eivat_saa_samoja_viitteita(self):
+        viitegeneraattori = JaettuViitegeneraattori(self.polku, lohkon_koko=13)
+        tulokset = [[] for _ in range(8)]
+
+        def varaa(i):
+            tulokset[i].extend(viitegeneraattori.uusi() for _ in range(2_000))
+
+        saikeet = [Thread(target=varaa, args=(i,)) for i in range(8)]
+        for saie in saikeet:
+            saie.start()
+        for saie in saikeet:
+            saie.join()
+
+        viitteet = [viite for tulos in tulokset for viite in tulos]
+        self.assertEqual(len(set(viitteet)), 16_000)
+
+    def test_prosessit_eivat_saa_samoja_viitteita(self):
+        with ProcessPoolExecutor(max_workers=4) as prosessit:
+            tulokset = list(prosessit.map(varaa_viitteita, [self.polku] * 8, [5_000] * 8))
+
+        viitteet = [viite for tulos in tulokset for viite in tulos]
+        self.assertEqual(len(set(viitteet)), 40_000)
@@ -0,0 +1,113 @@
+import unittest
+from unittest.mock import Mock
+from kassajono import Kassajono
+from kauppa import Kauppa
+from kirjanpito import Kirjanpito
+from pankki_stub import PankkiStub
+from varasto import Varasto
+from viitegeneraattori import Viitegeneraattori
+
+
+class TestKassajono(unittest.TestCase):
+    def setUp(self):
+        self.pankki = PankkiStub(viive=0)
+        self.viitegeneraattori = Viitegeneraattori()
+
+    def test_maksut_lahetetaan_pankille_erissa(self):
+        with Kassajono(self.pankki, self.viitegeneraattori, eran_koko=10, odotusaika=1) as jono:
+            tulokset = [jono.lisaa("pekka", "12345", "33333-44455", 5) for _ in range(30)]
+
+        self.assertTrue(all(tulos.result() for tulos in tulokset))
+        self.assertEqual(self.pankki.pyyntoja, 3)
+
+    def test_vajaa_era_lahtee_odotusajan_jalkeen(self):
+        jono = Kassajono(self.pankki, self.viitegeneraattori, eran_koko=100, odotusaika=0.01)
+        self.addCleanup(jono.sulje)
+
+        tulos = jono.lisaa("pekka", "12345", "33333-44455", 5)
+
+        self.assertTrue(tulos.result(timeout=1))
+
+    def test_viitenumerot_varataan_lohkoina_ja_ovat_erillisia(self):
+        pankki = Mock()
+        pankki.tilisiirrot.side_effect = lambda siirrot: [True] * len(siirrot)
+        viitegeneraattori = Mock(wraps=self.viitegeneraattori)
+
+        with Kassajono(pankki, viitegeneraattori, eran_koko=5, viitelohko=4) as jono:
+            for _ in range(10):
+                jono.lisaa("pekka", "12345", "33333-44455", 5)
+
+        viitteet = [
+            siirto[1] for kutsu in pankki.tilisiirrot.call_args_list for siirto in kutsu.args[0]
+        ]
+        self.assertEqual(len(set(viitteet)), 10)
+        self.assertEqual(viitegeneraattori.varaa_lohko.call_count, 3)
+        viitegeneraattori.uusi.assert_not_called()
+
+    def test_pankin_virhe_valittyy_tilauksille(self):
+        pankki = Mock()
+        pankki.tilisiirrot.side_effect = ConnectionError("pankki ei vastaa")
+
+        with Kassajono(pankki, self.viitegeneraattori) as jono:
+            tulos = jono.lisaa("pekka", "12345", "33333-44455", 5)
+
+        self.assertRaises(ConnectionError, tulos.result)
+
+    def test_puuttuvat_tulokset_valittyvat_tilauksille(self):
+        pankki = Mock()
+        pankki.tilisiirrot.side_effect = lambda siirrot: [True] * (len(siirrot) - 1)
+
+        with Kassajono(pankki, self.viitegeneraattori, eran_koko=3, odotusaika=1) as jono:
+            tulokset = [jono.lisaa("pekka", "12345", "33333-44455", 5) for _ in range(3)]
+
+        for tulos in tulokset:
+            self.assertRaises(ValueError, tulos.result, timeout=1)
+
+    def test_viitteen_varaamisen_virhe_ei_pysayta_jonoa(self):
+        pankki = Mock()
+        pankki.tilisiirrot.side_effect = lambda siirrot: [True] * len(siirrot)
+        viitegeneraattori = Mock()
+        viitegeneraattori.varaa_lohko.side_effect = [OSError("levy täynnä"), range(1, 100)]
+
+        with Kassajono(pankki, viitegeneraattori, eran_koko=1) as jono:
+            ensimmainen = jono.lisaa("pekka", "12345", "33333-44455", 5)
+            self.assertRaises(OSError, ensimmainen.result, timeout=1)
+            toinen = jono.lisaa("pekka", "12345", "33333-44455", 5)
+
+        self.assertTrue(toinen.result(timeout=1))
+
+    def test_peruttua_tilausta_ei_laheteta(self):
+        pankki = Mock()
+        pankki.tilisiirrot.side_effect = lambda siirrot: [True] * len(siirrot)
+
+        with Kassajono(pankki, self.viitegeneraattori, eran_koko=2, odotusaika=1) as jono:
+            peruttu = jono.lisaa("pekka", "12345", "33333-44455", 5)
+            self.assertTrue(peruttu.cancel())
+            tulos = jono.lisaa("arto", "54321", "33333-44455", 7)
+
+            self.assertTrue(tulos.result(timeout=2))
+
+        siirrot = [siirto for kutsu in pankki.tilisiirrot.call_args_list for siirto in kutsu.args[0]]
+        self.assertEqual([siirto[0] for siirto in siirrot], ["arto"])
+
+    def test_kauppa_lisaa_ostoskorin_summan_jonoon(self):
+        kirjanpito = Kirjanpito()
+        pankki = PankkiStub(0, kirjanpito)
+
+        with Kassajono(pankki, self.viitegeneraattori) as jono:
+            kauppa = Kauppa(Varasto(Kirjanpito()), pankki, self.viitegeneraattori, jono)
+            kauppa.aloita_asiointi()
+            kauppa.lisaa_koriin(1)
+            kauppa.lisaa_koriin(3)
+            tulos = kauppa.tilimaksu_jonoon("pekka", "12345")
+
+        self.assertTrue(tulos.result())
+        self.assertEqual(
+            kirjanpito.tapahtumat, ["tilisiirto: tililtä 12345 tilille 33333-44455 viite 2 summa 8e"]
+        )
+
+    def test_tilimaksu_jonoon_ilman_kassajonoa_antaa_selkean_virheen(self):
+        kauppa = Kauppa(Varasto(Kirjanpito()), self.pankki, self.viitegeneraattori)
+        kauppa.aloita_asiointi()
+
+        self.assertRaises(RuntimeError, kauppa.tilimaksu_jonoon, "pekka", "12345")
@@ -216,4 +216,16 @@ class TestKauppa(unittest.TestCase):
         kauppa.poista_korista(2)
         self.varasto_mock.palauta_varastoon.assert_called_with(Tuote(2, "piimä", 6))
         kauppa.tilimaksu("pekka", "12345")
-        self.pankki_mock.tilisiirto.assert_called_with("pekka", 42, "12345", ANY, 5)
\ No newline at end of file
+        self.pankki_mock.tilisiirto.assert_called_with("pekka", 42, "12345", ANY, 5)
+
+    def test_korista_puuttuvaa_tuotetta_ei_palauteta_varastoon(self):
+        self.varasto_mock.saldo.return_value = 10
+        self.varasto_mock.hae_tuote.side_effect = lambda tuote_id: Tuote(tuote_id, "maito", 5)
+
+        kauppa = Kauppa(self.varasto_mock, self.pankki_mock, self.viitegeneraattori_mock)
+
+        kauppa.aloita_asiointi()
+        kauppa.lisaa_koriin(1)
+        kauppa.poista_korista(2)
+
+        self.varasto_mock.palauta_varastoon.assert_not_called()
@@ -0,0 +1,45 @@
+import unittest
+from ostoskori import Ostoskori
+from tuote import Tuote
+
+
+class TestOstoskori(unittest.TestCase):
+    def setUp(self):
+        self.kori = Ostoskori()
+        self.maito = Tuote(1, "maito", 3)
+        self.piima = Tuote(2, "piimä", 5)
+
+    def test_tyhjan_korin_hinta_on_nolla(self):
+        self.assertEqual(self.kori.hinta(), 0)
+
+    def test_saman_tuotteen_lisaaminen_kasvattaa_maaraa(self):
+        for _ in range(1000):
+            self.kori.lisaa(self.maito)
+        self.kori.lisaa(self.piima)
+
+        self.assertEqual(self.kori.maara(self.maito), 1000)
+        self.assertEqual(self.kori.tavaroita_korissa(), 1001)
+        self.assertEqual(self.kori.hinta(), 3005)
+
+    def test_poistaminen_poistaa_vain_yhden_kappaleen(self):
+        self.kori.lisaa(self.maito)
+        self.kori.lisaa(self.maito)
+
+        self.assertTrue(self.kori.poista(self.maito))
+
+        self.assertEqual(self.kori.maara(self.maito), 1)
+        self.assertEqual(self.kori.hinta(), 3)
+
+    def test_viimeisen_kappaleen_poistaminen_tyhjentaa_rivin(self):
+        self.kori.lisaa(self.piima)
+        self.kori.poista(self.piima)
+
+        self.assertEqual(self.kori.maara(self.piima), 0)
+        self.assertEqual(self.kori.tavaroita_korissa(), 0)
+        self.assertEqual(self.kori.hinta(), 0)
+
+    def test_korissa_olemattoman_tuotteen_poistaminen_ei_muuta_koria(self):
+        self.kori.lisaa(self.maito)
+
+        self.assertFalse(self.kori.poista(self.piima))
+        self.assertEqual(self.kori.hinta(), 3)
@@ -0,0 +1,149 @@
+import asyncio
+import time
+import unittest
+from threading import Barrier, Thread
+from kirjanpito import Kirjanpito
+from pankkiasiakas import Katkaisin, PankkiAsiakas, PankkiaEiTavoiteta
+from pankkipalvelin import PankkiPalvelin
+
+
+class TestPankkiAsiakas(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.palvelin = PankkiPalvelin(siemen=1)
+        await self.palvelin.kaynnista()
+        self.kirjanpito = Kirjanpito()
+
+    async def asyncTearDown(self):
+        await self.palvelin.sulje()
+
+    def luo_asiakas(self, **asetukset):
+        asiakas = PankkiAsiakas("127.0.0.1", self.palvelin.portti, self.kirjanpito, odotus=0.001, **asetukset)
+        self.addAsyncCleanup(asiakas.sulje)
+
+        return asiakas
+
+    async def test_tilisiirto_onnistuu_ja_kirjataan(self):
+        asiakas = self.luo_asiakas()
+
+        self.assertTrue(await asiakas.tilisiirto("pekka", 42, "12345", "33333-44455", 5))
+        self.assertEqual(
+            self.kirjanpito.tapahtumat, ["tilisiirto: tililtä 12345 tilille 33333-44455 viite 42 summa 5e"]
+        )
+
+    async def test_yhteydet_kaytetaan_uudelleen(self):
+        asiakas = self.luo_asiakas(yhteyksia=2)
+        yhteyksia = 0
+        alkuperainen = asyncio.open_connection
+
+        async def laske_yhteydet(*args):
+            nonlocal yhteyksia
+            yhteyksia += 1
+            return await alkuperainen(*args)
+
+        asyncio.open_connection = laske_yhteydet
+        self.addCleanup(setattr, asyncio, "open_connection", alkuperainen)
+
+        await asyncio.gather(*(asiakas.tilisiirto("pekka", i, "12345", "33333-44455", 5) for i in range(50)))
+
+        self.assertLessEqual(yhteyksia, 2)
+        self.assertEqual(self.palvelin.siirtoja, 50)
+
+    async def test_epaonnistuneet_pyynnot_yritetaan_uudelleen_kertaalleen_veloittaen(self):
+        self.palvelin.virhetodennakoisyys = 0.5
+        asiakas = self.luo_asiakas(yrityksia=20, katkaisin=Katkaisin(raja=1000))
+
+        tulokset = await asyncio.gather(
+            *(asiakas.tilisiirto("pekka", i, "12345", "33333-44455", 5) for i in range(30))
+        )
+
+        self.assertTrue(all(tulokset))
+        self.assertGreater(self.palvelin.pyyntoja, 30)
+        self.assertEqual(self.palvelin.siirtoja, 30)
+
+    async def test_hidas_pankki_aiheuttaa_aikakatkaisun(self):
+        self.palvelin.viive = 0.2
+        asiakas = self.luo_asiakas(aikaraja=0.01, yrityksia=2)
+
+        with self.assertRaises(PankkiaEiTavoiteta):
+            await asiakas.tilisiirto("pekka", 1, "12345", "33333-44455", 5)
+
+    async def test_viimeisen_yrityksen_jalkeen_ei_odoteta(self):
+        self.palvelin.virhetodennakoisyys = 1.0
+        asiakas = PankkiAsiakas("127.0.0.1", self.palvelin.portti, self.kirjanpito, odotus=60, yrityksia=1)
+        self.addAsyncCleanup(asiakas.sulje)
+
+        with self.assertRaises(PankkiaEiTavoiteta):
+            await asyncio.wait_for(asiakas.tilisiirto("pekka", 1, "12345", "33333-44455", 5), 5)
+
+    async def test_katkaisin_estaa_pyynnot_toistuvien_virheiden_jalkeen(self):
+        self.palvelin.virhetodennakoisyys = 1.0
+        asiakas = self.luo_asiakas(yrityksia=10, katkaisin=Katkaisin(raja=3, palautumisaika=60))
+
+        with self.assertRaises(PankkiaEiTavoiteta):
+            await asiakas.tilisiirto("pekka", 1, "12345", "33333-44455", 5)
+        with self.assertRaises(PankkiaEiTavoiteta):
+            await asiakas.tilisiirto("pekka", 2, "12345", "33333-44455", 5)
+
+        self.assertEqual(self.palvelin.pyyntoja, 3)
+
+    async def test_puoliavoin_katkaisin_paastaa_pankkiin_vain_yhden_pyynnon(self):
+        self.palvelin.virhetodennakoisyys = 1.0
+        asiakas = self.luo_asiakas(yrityksia=1, katkaisin=Katkaisin(raja=1, palautumisaika=0.05))
+
+        with self.assertRaises(PankkiaEiTavoiteta):
+            await asiakas.tilisiirto("pekka", 1, "12345", "33333-44455", 5)
+        await asyncio.sleep(0.05)
+
+        tulokset = await asyncio.gather(
+            *(asiakas.tilisiirto("pekka", viite, "12345", "33333-44455", 5) for viite in range(2, 10)),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(tulos, PankkiaEiTavoiteta) for tulos in tulokset))
+        self.assertEqual(self.palvelin.pyyntoja, 2)
+
+
+class TestKatkaisin(unittest.TestCase):
+    def test_katkaisin_sallii_kokeilun_palautumisajan_jalkeen(self):
+        katkaisin = Katkaisin(raja=1, palautumisaika=0)
+        katkaisin.epaonnistui()
+
+        self.assertTrue(katkaisin.sallii())
+
+    def test_onnistuminen_sulkee_katkaisimen(self):
+        katkaisin = Katkaisin(raja=1, palautumisaika=60)
+        katkaisin.epaonnistui()
+        self.assertFalse(katkaisin.sallii())
+
+        katkaisin.onnistui()
+        self.assertTrue(katkaisin.sallii())
+
+    def test_palautumisajan_jalkeen_vain_yksi_kokeilu_paasee_lapi(self):
+        katkaisin = Katkaisin(raja=1, palautumisaika=0.05)
+        katkaisin.epaonnistui()
+        time.sleep(0.05)
+        este = Barrier(8)
+        sallitut = []
+
+        def kysy():
+            este.wait()
+            sallitut.append(katkaisin.sallii())
+
+        saikeet = [Thread(target=kysy) for _ in range(8)]
+        for saie in saikeet:
+            saie.start()
+        for saie in saikeet:
+            saie.join()
+
+        self.assertEqual(sallitut.count(True), 1)
+
+    def test_epaonnistunut_kokeilu_avaa_katkaisimen_uudelleen(self):
+        katkaisin = Katkaisin(raja=3, palautumisaika=0.05)
+        for _ in range(3):
+            katkaisin.epaonnistui()
+        time.sleep(0.05)
+
+        self.assertTrue(katkaisin.sallii())
+        katkaisin.epaonnistui()
+
+        self.assertFalse(katkaisin.sallii())
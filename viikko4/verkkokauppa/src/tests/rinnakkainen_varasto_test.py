@@ -0,0 +1,69 @@
+import unittest
+from threading import Barrier, Thread
+from kauppa import Kauppa
+from kirjanpito import Kirjanpito
+from pankki import Pankki
+from rinnakkainen_varasto import RinnakkainenVarasto
+from tuote import Tuote
+from viitegeneraattori import Viitegeneraattori
+
+
+class TestRinnakkainenVarasto(unittest.TestCase):
+    def setUp(self):
+        self.varasto = RinnakkainenVarasto(Kirjanpito(), lukkoja=4)
+        self.varasto.lisaa_tuote(Tuote(10, "harvinainen", 9), 500)
+
+    def aja_saikeissa(self, saikeita, tehtava):
+        este = Barrier(saikeita)
+        tulokset = [None] * saikeita
+
+        def aja(i):
+            este.wait()
+            tulokset[i] = tehtava()
+
+        saikeet = [Thread(target=aja, args=(i,)) for i in range(saikeita)]
+        for saie in saikeet:
+            saie.start()
+        for saie in saikeet:
+            saie.join()
+
+        return tulokset
+
+    def test_loppuunmyyty_tuote_ei_mene_miinukselle(self):
+        self.varasto.lisaa_tuote(Tuote(11, "viimeinen", 1), 0)
+
+        self.assertFalse(self.varasto.ota_varastosta(self.varasto.hae_tuote(11)))
+        self.assertEqual(self.varasto.saldo(11), 0)
+
+    def test_rinnakkaiset_otot_eivat_ylimyy(self):
+        tuote = self.varasto.hae_tuote(10)
+
+        def ota_kaikki():
+            onnistuneet = 0
+            for _ in range(200):
+                if self.varasto.ota_varastosta(tuote):
+                    onnistuneet += 1
+            return onnistuneet
+
+        tulokset = self.aja_saikeissa(8, ota_kaikki)
+
+        self.assertEqual(sum(tulokset), 500)
+        self.assertEqual(self.varasto.saldo(10), 0)
+
+    def test_rinnakkaiset_asioinnit_eivat_ylimyy(self):
+        pankki = Pankki(Kirjanpito())
+
+        def asioi():
+            kauppa = Kauppa(self.varasto, pankki, Viitegeneraattori())
+            kauppa.aloita_asiointi()
+            for _ in range(100):
+                kauppa.lisaa_koriin(10)
+                kauppa.lisaa_koriin(1)
+                kauppa.poista_korista(1)
+            return kauppa._ostoskori.tavaroita_korissa()
+
+        tulokset = self.aja_saikeissa(16, asioi)
+
+        self.assertEqual(sum(tulokset), 500)
+        self.assertEqual(self.varasto.saldo(10), 0)
+        self.assertEqual(self.varasto.saldo(1), 100)
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from kauppa import Kauppa
+from kirjanpito import Kirjanpito
+from tapahtumaloki import PysyvaPankki, PysyvaVarasto, Tapahtumaloki
+from viitegeneraattori import Viitegeneraattori
+
+
+class TestTapahtumaloki(unittest.TestCase):
+    def setUp(self):
+        hakemisto = tempfile.TemporaryDirectory()
+        self.addCleanup(hakemisto.cleanup)
+        self.hakemisto = hakemisto.name
+
+    def asioi(self, loki):
+        kauppa = Kauppa(
+            PysyvaVarasto(loki, Kirjanpito()), PysyvaPankki(loki, Kirjanpito()), Viitegeneraattori()
+        )
+        kauppa.aloita_asiointi()
+        kauppa.lisaa_koriin(1)
+        kauppa.lisaa_koriin(3)
+        kauppa.lisaa_koriin(3)
+        kauppa.poista_korista(1)
+        kauppa.tilimaksu("pekka", "12345")
+
+        return kauppa
+
+    def test_saldot_ja_maksut_palautetaan_uudelleenkaynnistyksessa(self):
+        with Tapahtumaloki(self.hakemisto) as loki:
+            self.asioi(loki)
+
+        with Tapahtumaloki(self.hakemisto) as loki:
+            varasto = PysyvaVarasto(loki, Kirjanpito())
+
+            self.assertEqual(varasto.saldo(1), 100)
+            self.assertEqual(varasto.saldo(3), 28)
+            self.assertEqual(loki.tila.maksuja, 1)
+            self.assertEqual(loki.tila.myynti, 10)
+            self.assertEqual(loki.tila.viimeisin_viite, 2)
+
+    def test_palautus_toistaa_vain_tilannekuvan_jalkeiset_tapahtumat(self):
+        with Tapahtumaloki(self.hakemisto, tilannekuvan_vali=100) as loki:
+            for _ in range(1_050):
+                loki.kirjaa_saldo(5, -1)
+
+        with Tapahtumaloki(self.hakemisto) as loki:
+            self.assertEqual(loki.toistettuja, 50)
+            self.assertEqual(loki.tila.saldomuutokset, {5: -1_050})
+
+    def test_kesken_jaanyt_tapahtuma_ohitetaan(self):
+        with Tapahtumaloki(self.hakemisto) as loki:
+            loki.kirjaa_saldo(2, -1)
+            loki.kirjaa_saldo(2, -1)
+
+        with open(os.path.join(self.hakemisto, "tapahtumat.bin"), "ab") as tiedosto:
+            tiedosto.write(b"\x01\x02")
+
+        with Tapahtumaloki(self.hakemisto) as loki:
+            loki.kirjaa_saldo(2, -1)
+
+        with Tapahtumaloki(self.hakemisto) as loki:
+            self.assertEqual(loki.tila.saldomuutokset, {2: -3})
+
+    def test_loki_ja_tilannekuva_tallennetaan_levylle_ennen_korvaamista(self):
+        kutsut = []
+        fsync = os.fsync
+        replace = os.replace
+
+        def tallenna(kuvaaja):
+            kutsut.append(("fsync", os.fstat(kuvaaja).st_ino))
+            fsync(kuvaaja)
+
+        def korvaa(lahde, kohde):
+            kutsut.append(("replace", os.path.basename(kohde)))
+            replace(lahde, kohde)
+
+        with Tapahtumaloki(self.hakemisto) as loki:
+            loki.kirjaa_saldo(1, -1)
+
+            with patch("tapahtumaloki.os.fsync", tallenna), patch("tapahtumaloki.os.replace", korvaa):
+                loki.tallenna_tilannekuva()
+
+        def inode(nimi):
+            return os.stat(os.path.join(self.hakemisto, nimi)).st_ino
+
+        # väliaikainen tilannekuva on nimetty uudelleen, joten sen inode on nyt tilannekuvan
+        self.assertEqual(kutsut, [
+            ("fsync", inode("tapahtumat.bin")),
+            ("fsync", inode("tilannekuva.bin")),
+            ("replace", "tilannekuva.bin"),
+            ("fsync", inode("")),
+        ])
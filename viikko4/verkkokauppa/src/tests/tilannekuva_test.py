@@ -0,0 +1,94 @@
+import unittest
+from threading import Event, Thread
+from kirjanpito import Kirjanpito
+from tilannekuva import LOHKOJA, LOHKON_KOKO, Tilannekuva, TilannekuvaVarasto
+from tuote import Tuote
+
+
+class TestTilannekuva(unittest.TestCase):
+    def test_muutos_ei_nay_vanhassa_versiossa(self):
+        vanha = Tilannekuva().muuta({1: (3, 10)})
+        uusi = vanha.muuta({1: (3, 9)})
+
+        self.assertEqual(vanha.saldo(1), 10)
+        self.assertEqual(uusi.saldo(1), 9)
+        self.assertEqual(uusi.versio, vanha.versio + 1)
+
+    def test_muuttumattomat_lohkot_jaetaan_versioiden_kesken(self):
+        vanha = Tilannekuva().muuta({1: (3, 10), 2: (4, 20)})
+        uusi = vanha.muuta({1: (3, 9)})
+
+        self.assertIs(uusi._lohkot[2], vanha._lohkot[2])
+        self.assertIsNot(uusi._lohkot[1], vanha._lohkot[1])
+
+    def test_lohkojen_maara_kasvaa_tuotteiden_mukana(self):
+        pieni = Tilannekuva().muuta({1: (3, 10)})
+        suuri = pieni.muuta({id: (id, id) for id in range(2, 100_001)})
+
+        self.assertEqual(len(suuri), 100_000)
+        self.assertLessEqual(len(suuri) / len(suuri._lohkot), LOHKON_KOKO)
+        self.assertEqual(suuri.saldo(1), 10)
+        self.assertEqual(suuri.hinta(77_777), 77_777)
+        self.assertEqual(len(pieni._lohkot), LOHKOJA)
+
+
+class TestTilannekuvaVarasto(unittest.TestCase):
+    def setUp(self):
+        self.varasto = TilannekuvaVarasto(Kirjanpito())
+
+    def test_alkuperaiset_tuotteet_ovat_tilannekuvassa(self):
+        self.assertEqual(self.varasto.tilannekuva.saldo(1), 100)
+        self.assertEqual(self.varasto.tilannekuva.hinta(5), 4)
+
+    def test_alkuperaiset_tuotteet_julkaistaan_yhtena_versiona(self):
+        self.assertEqual(self.varasto.tilannekuva.versio, 1)
+
+    def test_tuote_erat_julkaistaan_kerralla(self):
+        ennen = self.varasto.tilannekuva.versio
+
+        self.varasto.lisaa_tuotteet((Tuote(id, "olut", 2), id) for id in range(10, 20_000))
+
+        self.assertEqual(self.varasto.tilannekuva.versio, ennen + 1)
+        self.assertEqual(self.varasto.saldo(12_345), 12_345)
+        self.assertEqual(self.varasto.saldo(1), 100)
+
+    def test_varastosta_ottaminen_julkaisee_uuden_version(self):
+        ennen = self.varasto.tilannekuva
+
+        self.varasto.ota_varastosta(self.varasto.hae_tuote(1))
+
+        self.assertEqual(ennen.saldo(1), 100)
+        self.assertEqual(self.varasto.saldo(1), 99)
+        self.assertGreater(self.varasto.tilannekuva.versio, ennen.versio)
+
+    def test_hinnan_muutos_julkaistaan(self):
+        self.varasto.aseta_hinta(2, 9)
+
+        self.assertEqual(self.varasto.tilannekuva.hinta(2), 9)
+        self.assertEqual(self.varasto.hae_tuote(2).hinta, 9)
+
+    def test_lukijat_nakevat_aina_eheaa_tilannekuvan_kirjoitusten_aikana(self):
+        self.varasto.lisaa_tuote(Tuote(10, "pari", 2), 1_000)
+        self.varasto.lisaa_tuote(Tuote(11, "pari", 2), 1_000)
+        valmis = Event()
+        virheet = []
+
+        def kirjoita():
+            for _ in range(500):
+                self.varasto.ota_varastosta(self.varasto.hae_tuote(10))
+            valmis.set()
+
+        def lue():
+            while not valmis.is_set():
+                tilannekuva = self.varasto.tilannekuva
+                if tilannekuva.saldo(10) > 1_000 or tilannekuva.saldo(11) != 1_000:
+                    virheet.append(tilannekuva.versio)
+
+        saikeet = [Thread(target=kirjoita)] + [Thread(target=lue) for _ in range(4)]
+        for saie in saikeet:
+            saie.start()
+        for saie in saikeet:
+            saie.join()
+
+        self.assertEqual(virheet, [])
+        self.assertEqual(self.varasto.saldo(10), 500)
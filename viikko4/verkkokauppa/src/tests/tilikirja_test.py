@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from kirjanpito import Kirjanpito
+from tilikirja import Tilikirja
+
+
+class TestKirjanpito(unittest.TestCase):
+    def test_tapahtuma_muotoillaan_luettaessa(self):
+        kirjanpito = Kirjanpito()
+        kirjanpito.lisaa_tapahtuma("viite {} summa {}e", 42, 5)
+        kirjanpito.lisaa_tapahtuma("{ei muotoiltava}")
+
+        self.assertEqual(kirjanpito.tapahtumat, ["viite 42 summa 5e", "{ei muotoiltava}"])
+
+
+class TestTilikirja(unittest.TestCase):
+    def setUp(self):
+        hakemisto = tempfile.TemporaryDirectory()
+        self.addCleanup(hakemisto.cleanup)
+        self.polku = os.path.join(hakemisto.name, "tilikirja.log")
+
+    def lue_rivit(self):
+        with open(self.polku, encoding="utf-8") as tiedosto:
+            return tiedosto.read().splitlines()
+
+    def test_tapahtumat_kirjoitetaan_tiedostoon_jarjestyksessa(self):
+        with Tilikirja(self.polku, eran_koko=7) as tilikirja:
+            for i in range(100):
+                tilikirja.lisaa_tapahtuma("tapahtuma {}", i)
+
+        self.assertEqual(self.lue_rivit(), [f"tapahtuma {i}" for i in range(100)])
+
+    def test_muistissa_pidetaan_vain_viimeisimmat(self):
+        with Tilikirja(self.polku, muistissa=3) as tilikirja:
+            for i in range(10):
+                tilikirja.lisaa_tapahtuma("tapahtuma {}", i)
+
+            self.assertEqual(
+                tilikirja.tapahtumat, ["tapahtuma 7", "tapahtuma 8", "tapahtuma 9"]
+            )
+
+    def test_tyhjennyksen_jalkeen_tapahtumat_ovat_tiedostossa(self):
+        tilikirja = Tilikirja(self.polku, jonon_koko=2)
+        self.addCleanup(tilikirja.sulje)
+
+        for i in range(50):
+            tilikirja.lisaa_tapahtuma("tapahtuma {}", i)
+        tilikirja.tyhjenna()
+
+        self.assertEqual(len(self.lue_rivit()), 50)
+
+    def test_tiedostoon_lisataan_aiempien_tapahtumien_peraan(self):
+        with Tilikirja(self.polku) as tilikirja:
+            tilikirja.lisaa_tapahtuma("eka")
+        with Tilikirja(self.polku) as tilikirja:
+            tilikirja.lisaa_tapahtuma("toka")
+
+        self.assertEqual(self.lue_rivit(), ["eka", "toka"])
+
+    def test_virheellinen_muoto_kirjoitetaan_sellaisenaan(self):
+        tilikirja = Tilikirja(self.polku, jonon_koko=2)
+        self.addCleanup(tilikirja.sulje)
+
+        tilikirja.lisaa_tapahtuma("viite {} summa {}", 42)
+        for i in range(50):
+            tilikirja.lisaa_tapahtuma("tapahtuma {}", i)
+        tilikirja.tyhjenna()
+
+        rivit = self.lue_rivit()
+        self.assertEqual(rivit[0], "viite {} summa {} (42,)")
+        self.assertEqual(rivit[-1], "tapahtuma 49")
+
+    def test_avaamaton_tiedosto_antaa_virheen_heti(self):
+        polku = os.path.join(self.polku, "ei", "ole", "tilikirja.log")
+
+        self.assertRaises(OSError, Tilikirja, polku)
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from kirjanpito import Kirjanpito
+from luettelovarasto import LuetteloVarasto
+from tuote import Tuote
+from tuoteluettelo import hinta_senteiksi, lue_luettelo
+
+
+class TestTuoteluettelo(unittest.TestCase):
+    def setUp(self):
+        hakemisto = tempfile.TemporaryDirectory()
+        self.addCleanup(hakemisto.cleanup)
+        self.polku = os.path.join(hakemisto.name, "luettelo.csv")
+
+        with open(self.polku, "w", encoding="utf-8") as tiedosto:
+            tiedosto.write(
+                "id,nimi,hinta,saldo\n"
+                "3,Sierra Nevada Pale Ale,5,30\n"
+                '1,"Koff Portteri, 0,33l",3.5,100\n'
+                "2,Fink Bräu I,1.05,0\n"
+            )
+
+        self.luettelo = lue_luettelo(self.polku)
+
+    def test_hinta_muunnetaan_senteiksi(self):
+        self.assertEqual(hinta_senteiksi("3"), 300)
+        self.assertEqual(hinta_senteiksi("3.5"), 350)
+        self.assertEqual(hinta_senteiksi("0.05"), 5)
+
+    def test_virheellinen_hinta_hylataan(self):
+        for hinta in ("-1.5", "-3", "+3", "1.5.3", "1.555", "", ".", "kolme"):
+            self.assertRaises(ValueError, hinta_senteiksi, hinta)
+
+    def test_tyhjat_rivit_ohitetaan(self):
+        with open(self.polku, "a", encoding="utf-8") as tiedosto:
+            tiedosto.write("\n4,Karhu,2,5\n\n")
+
+        self.assertEqual(len(lue_luettelo(self.polku)), 4)
+
+    def test_virheellisen_rivin_numero_kerrotaan(self):
+        with open(self.polku, "a", encoding="utf-8") as tiedosto:
+            tiedosto.write("\n4,Karhu,2\n")
+
+        with self.assertRaisesRegex(ValueError, "rivi 6"):
+            lue_luettelo(self.polku)
+
+    def test_luettelo_jarjestetaan_idn_mukaan(self):
+        self.assertEqual(list(self.luettelo.idt), [1, 2, 3])
+        self.assertEqual(list(self.luettelo.saldot), [100, 0, 30])
+
+    def test_tuote_luodaan_rivista(self):
+        tuote = self.luettelo.tuote(self.luettelo.rivi(1))
+
+        self.assertEqual(tuote.nimi, "Koff Portteri, 0,33l")
+        self.assertEqual(tuote.hinta, 3.5)
+        self.assertEqual(self.luettelo.tuote(self.luettelo.rivi(3)).hinta, 5)
+
+    def test_tuntemattomalla_idlla_ei_ole_rivia(self):
+        self.assertIsNone(self.luettelo.rivi(4))
+
+    def test_varasto_kayttaa_luettelon_saldoja(self):
+        varasto = LuetteloVarasto(self.luettelo, Kirjanpito())
+        tuote = varasto.hae_tuote(1)
+
+        self.assertTrue(varasto.ota_varastosta(tuote))
+        self.assertFalse(varasto.ota_varastosta(varasto.hae_tuote(2)))
+        self.assertEqual(varasto.saldo(1), 99)
+        self.assertIsNone(varasto.hae_tuote(5))
+
+    def test_tuntematon_id_on_keyerror_kuten_varastossa(self):
+        varasto = LuetteloVarasto(self.luettelo, Kirjanpito())
+
+        self.assertRaises(KeyError, varasto.saldo, 5)
+
+    def test_varastoon_voi_lisata_tuotteita(self):
+        varasto = LuetteloVarasto(self.luettelo, Kirjanpito())
+        varasto.lisaa_tuote(Tuote(0, "Karhu", 2.2), 10)
+        varasto.lisaa_tuote(Tuote(5, "Lapin Kulta", 2), 7)
+        varasto.lisaa_tuote(Tuote(3, "Sierra Nevada Pale Ale", 6), 1)
+
+        self.assertEqual(list(self.luettelo.idt), [0, 1, 2, 3, 5])
+        self.assertEqual(varasto.saldo(0), 10)
+        self.assertEqual(varasto.hae_tuote(0).hinta, 2.2)
+        self.assertEqual(varasto.saldo(3), 1)
+        self.assertEqual(varasto.hae_tuote(3).hinta, 6)
+        self.assertTrue(varasto.ota_varastosta(varasto.hae_tuote(5)))
+        self.assertEqual(varasto.saldo(5), 6)
@@ -0,0 +1,44 @@
+import unittest
+from kirjanpito import Kirjanpito
+from tuote import Tuote
+from varasto import Varasto
+
+
+class TestVarasto(unittest.TestCase):
+    def setUp(self):
+        self.kirjanpito = Kirjanpito()
+        self.varasto = Varasto(self.kirjanpito)
+
+    def test_tuote_loytyy_idn_perusteella(self):
+        tuote = self.varasto.hae_tuote(3)
+
+        self.assertEqual(tuote.id, 3)
+        self.assertEqual(tuote.nimi, "Sierra Nevada Pale Ale")
+
+    def test_tuntematon_id_palauttaa_none(self):
+        self.assertIsNone(self.varasto.hae_tuote(999))
+
+    def test_lisatyn_tuotteen_saldo_loytyy(self):
+        self.varasto.lisaa_tuote(Tuote(200_000, "olut", 2), 7)
+
+        self.assertEqual(self.varasto.saldo(200_000), 7)
+
+    def test_varastosta_ottaminen_vahentaa_saldoa(self):
+        tuote = self.varasto.hae_tuote(1)
+        self.varasto.ota_varastosta(tuote)
+
+        self.assertEqual(self.varasto.saldo(1), 99)
+        self.assertEqual(self.kirjanpito.tapahtumat, ["otettiin varastosta Koff Portteri"])
+
+    def test_varastoon_palauttaminen_kasvattaa_saldoa(self):
+        tuote = self.varasto.hae_tuote(2)
+        self.varasto.palauta_varastoon(tuote)
+
+        self.assertEqual(self.varasto.saldo(2), 26)
+
+    def test_loppunutta_tuotetta_ei_voi_ottaa_varastosta(self):
+        tuote = Tuote(6, "loppunut", 2)
+        self.varasto.lisaa_tuote(tuote, 0)
+
+        self.assertFalse(self.varasto.ota_varastosta(tuote))
+        self.assertEqual(self.varasto.saldo(6), 0)
@@ -0,0 +1,17 @@
+import unittest
+from viitegeneraattori import Viitegeneraattori
+
+
+class TestViitegeneraattori(unittest.TestCase):
+    def setUp(self):
+        self.viitegeneraattori = Viitegeneraattori()
+
+    def test_uudet_viitteet_kasvavat(self):
+        self.assertEqual(self.viitegeneraattori.uusi(), 2)
+        self.assertEqual(self.viitegeneraattori.uusi(), 3)
+
+    def test_lohko_varaa_perakkaiset_viitteet(self):
+        self.viitegeneraattori.uusi()
+
+        self.assertEqual(list(self.viitegeneraattori.varaa_lohko(3)), [3, 4, 5])
+        self.assertEqual(self.viitegeneraattori.uusi(), 6)
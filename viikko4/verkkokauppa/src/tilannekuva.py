@@ -0,0 +1,124 @@
+from threading import Lock
+from kirjanpito import kirjanpito as default_kirjanpito
+from tuote import Tuote
+from varasto import Varasto
+
+LOHKOJA = 256
+# kun lohkoissa on keskimäärin enemmän rivejä, lohkojen määrä kaksinkertaistetaan,
+# jotta yksittäinen muutos kopioi aina vain pienen lohkon
+LOHKON_KOKO = 64
+
+
+class Tilannekuva:
+    # Muuttumaton kuva tuotteiden hinnoista ja saldoista. Tuotteet on jaettu
+    # lohkoihin, ja uusi versio kopioi vain ne lohkot, joihin muutos osuu.
+    # Muut lohkot jaetaan edellisen version kanssa.
+    def __init__(self, versio=0, lohkot=None, riveja=0):
+        self.versio = versio
+        self._lohkot = lohkot or tuple({} for _ in range(LOHKOJA))
+        self._riveja = riveja
+
+    def __len__(self):
+        return self._riveja
+
+    def hinta(self, id):
+        return self._lohkot[hash(id) % len(self._lohkot)][id][0]
+
+    def saldo(self, id):
+        return self._lohkot[hash(id) % len(self._lohkot)][id][1]
+
+    def muuta(self, muutokset):
+        # muutokset ovat muotoa {id: (hinta, saldo)}
+        lohkot = list(self._lohkot)
+        lohkoja = len(lohkot)
+        riveja = self._riveja
+        kopioidut = set()
+
+        for id, rivi in muutokset.items():
+            lohko = hash(id) % lohkoja
+
+            if lohko not in kopioidut:
+                lohkot[lohko] = dict(lohkot[lohko])
+                kopioidut.add(lohko)
+
+            if id not in lohkot[lohko]:
+                riveja += 1
+            lohkot[lohko][id] = rivi
+
+        if riveja > LOHKON_KOKO * lohkoja:
+            lohkot = _jaa_lohkoihin(lohkot, riveja)
+
+        return Tilannekuva(self.versio + 1, tuple(lohkot), riveja)
+
+
+def _jaa_lohkoihin(lohkot, riveja):
+    lohkoja = len(lohkot)
+    while riveja > LOHKON_KOKO * lohkoja:
+        lohkoja *= 2
+
+    uudet = [{} for _ in range(lohkoja)]
+    for lohko in lohkot:
+        for id, rivi in lohko.items():
+            uudet[hash(id) % lohkoja][id] = rivi
+
+    return uudet
+
+
+class TilannekuvaVarasto(Varasto):
+    # Lukijat käyttävät viimeisintä julkaistua tilannekuvaa ilman lukitusta.
+    # Kirjoittajat vuorottelevat yhden lukon avulla ja julkaisevat jokaisen
+    # muutoksen jälkeen uuden version.
+    def __init__(self, kirjanpito=default_kirjanpito):
+        self._kirjoituslukko = Lock()
+        self._tilannekuva = Tilannekuva()
+        super().__init__(kirjanpito)
+
+    @property
+    def tilannekuva(self):
+        return self._tilannekuva
+
+    def lisaa_tuote(self, tuote, saldo):
+        self.lisaa_tuotteet([(tuote, saldo)])
+
+    def lisaa_tuotteet(self, tuotteet):
+        # koko erä julkaistaan yhtenä versiona, joten suuren luettelon
+        # lataaminen ei kopioi lohkoa jokaisen tuotteen kohdalla
+        with self._kirjoituslukko:
+            idt = []
+            for tuote, saldo in tuotteet:
+                super().lisaa_tuote(tuote, saldo)
+                idt.append(tuote.id)
+            self._julkaise(*idt)
+
+    def aseta_hinta(self, id, hinta):
+        with self._kirjoituslukko:
+            tuote = self._tuotteet[id]
+            self._tuotteet[id] = Tuote(id, tuote.nimi, hinta)
+            self._julkaise(id)
+
+    def saldo(self, id):
+        return self._tilannekuva.saldo(id)
+
+    def ota_varastosta(self, tuote):
+        with self._kirjoituslukko:
+            if self._saldot[tuote.id] <= 0:
+                return False
+
+            self._saldot[tuote.id] -= 1
+            self._julkaise(tuote.id)
+
+        self._kirjanpito.lisaa_tapahtuma("otettiin varastosta {}", tuote)
+
+        return True
+
+    def palauta_varastoon(self, tuote):
+        with self._kirjoituslukko:
+            self._saldot[tuote.id] += 1
+            self._julkaise(tuote.id)
+
+        self._kirjanpito.lisaa_tapahtuma("palautettiin varastoon {}", tuote)
+
+    def _julkaise(self, *idt):
+        self._tilannekuva = self._tilannekuva.muuta(
+            {id: (self._tuotteet[id].hinta, self._saldot[id]) for id in idt}
+        )
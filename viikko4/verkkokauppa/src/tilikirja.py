@@ -0,0 +1,98 @@
+from collections import deque
+from queue import Empty, Queue
+from threading import Thread
+from kirjanpito import muotoile
+
+_LOPETA = object()
+
+
+def _muotoile_rivi(tapahtuma):
+    # virheellinen muoto ei saa pysäyttää kirjoittajaa, joten tapahtuma
+    # kirjoitetaan silloin sellaisenaan
+    try:
+        return muotoile(tapahtuma)
+    except (IndexError, KeyError, ValueError, AttributeError, TypeError):
+        muoto, arvot = tapahtuma
+        return f"{muoto} {arvot!r}"
+
+
+class Tilikirja:
+    # Kirjanpidon korvaaja pitkään käynnissä oleville prosesseille: tapahtumat
+    # kirjoitetaan taustasäikeessä erissä tiedoston perään ja muistissa
+    # pidetään vain viimeisimmät. Jos kirjoittaja ei pysy perässä, täysi
+    # jono pysäyttää tapahtumia lisäävän säikeen, kunnes tilaa vapautuu.
+    def __init__(self, polku, jonon_koko=10_000, eran_koko=1_000, muistissa=1_000):
+        self._polku = polku
+        self._jono = Queue(maxsize=jonon_koko)
+        self._eran_koko = eran_koko
+        self._viimeisimmat = deque(maxlen=muistissa)
+        self._virhe = None
+        # tiedosto avataan jo tässä, jotta avaamisen virhe nousee kutsujalle
+        # eikä pysäytä kirjoittajaa ennen kuin se ehtii tyhjentää jonoa
+        self._tiedosto = open(self._polku, "a", encoding="utf-8")
+        self._kirjoittaja = Thread(target=self._kirjoita, daemon=True)
+        self._kirjoittaja.start()
+
+    @property
+    def tapahtumat(self):
+        return [_muotoile_rivi(tapahtuma) for tapahtuma in list(self._viimeisimmat)]
+
+    def lisaa_tapahtuma(self, muoto, *arvot):
+        tapahtuma = (muoto, arvot)
+        self._tarkista()
+
+        self._viimeisimmat.append(tapahtuma)
+        self._jono.put(tapahtuma)
+
+    def tyhjenna(self):
+        self._jono.join()
+        self._tarkista()
+
+    def sulje(self):
+        self._jono.put(_LOPETA)
+        self._kirjoittaja.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.sulje()
+
+    def _tarkista(self):
+        if self._virhe is not None:
+            raise RuntimeError("tilikirjan kirjoittaminen epäonnistui") from self._virhe
+
+    def _seuraava_era(self):
+        era = [self._jono.get()]
+
+        while len(era) < self._eran_koko:
+            try:
+                era.append(self._jono.get_nowait())
+            except Empty:
+                break
+
+        return era
+
+    def _kirjoita(self):
+        with self._tiedosto as tiedosto:
+            while True:
+                era = self._seuraava_era()
+                lopeta = _LOPETA in era
+
+                # kirjoitusvirheen jälkeen jonoa tyhjennetään edelleen, jotta
+                # lisääjät eivät jää odottamaan, ja virhe nostetaan niille
+                if self._virhe is None:
+                    try:
+                        tiedosto.writelines(
+                            _muotoile_rivi(tapahtuma) + "\n"
+                            for tapahtuma in era if tapahtuma is not _LOPETA
+                        )
+                        tiedosto.flush()
+                    except Exception as virhe:
+                        self._virhe = virhe
+
+                for _ in era:
+                    self._jono.task_done()
+
+                if lopeta:
+                    return
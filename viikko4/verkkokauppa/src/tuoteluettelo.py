@@ -0,0 +1,100 @@
+import csv
+import sys
+from array import array
+from bisect import bisect_left
+from tuote import Tuote
+
+
+def hinta_senteiksi(hinta):
+    euroja, _, sentteja = hinta.strip().partition(".")
+
+    # int() hyväksyisi myös etumerkit, joten osat tarkistetaan numeroiksi
+    if not (euroja + sentteja).isdigit() or len(sentteja) > 2:
+        raise ValueError(f"virheellinen hinta: {hinta}")
+
+    return int(euroja or 0) * 100 + int((sentteja + "00")[:2])
+
+
+class Tuoteluettelo:
+    # Tuotteet tallennetaan sarakkeittain tyypitettyihin taulukoihin, jolloin
+    # miljoonankin tuotteen luettelo vie vähän muistia. Tuote-olioita luodaan
+    # vasta kun niitä pyydetään.
+    def __init__(self):
+        self.idt = array("q")
+        self.hinnat = array("q")
+        self.saldot = array("q")
+        self.nimet = []
+
+    def __len__(self):
+        return len(self.idt)
+
+    def lisaa(self, id, nimi, hinta_senteissa, saldo):
+        self.idt.append(id)
+        self.nimet.append(sys.intern(nimi))
+        self.hinnat.append(hinta_senteissa)
+        self.saldot.append(saldo)
+
+    def aseta(self, id, nimi, hinta_senteissa, saldo):
+        # lisää tuotteen järjestyksessä oikealle paikalleen tai korvaa
+        # saman id:n tuotteen tiedot
+        rivi = bisect_left(self.idt, id)
+
+        if rivi < len(self.idt) and self.idt[rivi] == id:
+            self.nimet[rivi] = sys.intern(nimi)
+            self.hinnat[rivi] = hinta_senteissa
+            self.saldot[rivi] = saldo
+            return
+
+        self.idt.insert(rivi, id)
+        self.nimet.insert(rivi, sys.intern(nimi))
+        self.hinnat.insert(rivi, hinta_senteissa)
+        self.saldot.insert(rivi, saldo)
+
+    def rivi(self, id):
+        rivi = bisect_left(self.idt, id)
+
+        if rivi < len(self.idt) and self.idt[rivi] == id:
+            return rivi
+
+        return None
+
+    def tuote(self, rivi):
+        sentit = self.hinnat[rivi]
+        # kokonaiset eurot pidetään kokonaislukuina kuten muuallakin kaupassa
+        hinta = sentit // 100 if sentit % 100 == 0 else sentit / 100
+
+        return Tuote(self.idt[rivi], self.nimet[rivi], hinta)
+
+    def jarjesta(self):
+        if all(self.idt[i] < self.idt[i + 1] for i in range(len(self.idt) - 1)):
+            return
+
+        jarjestys = sorted(range(len(self.idt)), key=self.idt.__getitem__)
+
+        self.idt = array("q", (self.idt[i] for i in jarjestys))
+        self.hinnat = array("q", (self.hinnat[i] for i in jarjestys))
+        self.saldot = array("q", (self.saldot[i] for i in jarjestys))
+        self.nimet = [self.nimet[i] for i in jarjestys]
+
+
+def lue_luettelo(polku):
+    # tiedostossa on otsakerivi ja sarakkeet id, nimi, hinta ja saldo
+    luettelo = Tuoteluettelo()
+
+    with open(polku, encoding="utf-8", newline="") as tiedosto:
+        rivit = csv.reader(tiedosto)
+        next(rivit, None)
+
+        for rivi in rivit:
+            if not rivi:
+                continue
+
+            try:
+                id, nimi, hinta, saldo = rivi
+                luettelo.lisaa(int(id), nimi, hinta_senteiksi(hinta), int(saldo))
+            except ValueError as virhe:
+                raise ValueError(f"virheellinen rivi {rivit.line_num}: {virhe}") from virhe
+
+    luettelo.jarjesta()
+
+    return luettelo
@@ -5,43 +5,50 @@ from kirjanpito import kirjanpito as default_kirjanpito
 class Varasto:
     def __init__(self, kirjanpito=default_kirjanpito):
         self._kirjanpito = kirjanpito
+        # tuotteet ja saldot tallennetaan tuotteen id:n perusteella,
+        # jolloin haku ei vaadi koko varaston läpikäyntiä
+        self._tuotteet = {}
         self._saldot = {}
         self._alusta_tuotteet()
 
-    def hae_tuote(self, id):
-        tuotteet = self._saldot.keys()
+    def lisaa_tuote(self, tuote, saldo):
+        self._tuotteet[tuote.id] = tuote
+        self._saldot[tuote.id] = saldo
 
-        for tuote in tuotteet:
-            if tuote.id == id:
-                return tuote
+    def lisaa_tuotteet(self, tuotteet):
+        # tuotteet ovat pareja (tuote, saldo)
+        for tuote, saldo in tuotteet:
+            self.lisaa_tuote(tuote, saldo)
 
-        return None
+    def hae_tuote(self, id):
+        return self._tuotteet.get(id)
 
     def saldo(self, id):
-        tuote = self.hae_tuote(id)
-
-        return self._saldot[tuote]
+        return self._saldot[id]
 
     def ota_varastosta(self, tuote):
-        saldo = self.saldo(tuote.id)
+        if self._saldot[tuote.id] <= 0:
+            return False
 
-        self._saldot[tuote] = saldo - 1
+        self._saldot[tuote.id] -= 1
 
-        self._kirjanpito.lisaa_tapahtuma(f"otettiin varastosta {tuote}")
+        self._kirjanpito.lisaa_tapahtuma("otettiin varastosta {}", tuote)
 
-    def palauta_varastoon(self, tuote):
-        saldo = self.saldo(tuote.id)
+        return True
 
-        self._saldot[tuote] = saldo + 1
+    def palauta_varastoon(self, tuote):
+        self._saldot[tuote.id] += 1
 
-        self._kirjanpito.lisaa_tapahtuma(f"palautettiin varastoon {tuote}")
+        self._kirjanpito.lisaa_tapahtuma("palautettiin varastoon {}", tuote)
 
     def _alusta_tuotteet(self):
-        self._saldot[Tuote(1, "Koff Portteri", 3)] = 100
-        self._saldot[Tuote(2, "Fink Bräu I", 1)] = 25
-        self._saldot[Tuote(3, "Sierra Nevada Pale Ale", 5)] = 30
-        self._saldot[Tuote(4, "Mikkeller not just another Wit", 7)] = 40
-        self._saldot[Tuote(5, "Weihenstephaner Hefeweisse", 4)] = 15
+        self.lisaa_tuotteet([
+            (Tuote(1, "Koff Portteri", 3), 100),
+            (Tuote(2, "Fink Bräu I", 1), 25),
+            (Tuote(3, "Sierra Nevada Pale Ale", 5), 30),
+            (Tuote(4, "Mikkeller not just another Wit", 7), 40),
+            (Tuote(5, "Weihenstephaner Hefeweisse", 4), 15),
+        ])
 
 
 varasto = Varasto()
@@ -7,5 +7,11 @@ class Viitegeneraattori:
 
         return self._seuraava
 
+    def varaa_lohko(self, koko):
+        alku = self._seuraava + 1
+        self._seuraava = self._seuraava + koko
+
+        return range(alku, alku + koko)
+
 
 viitegeneraattori = Viitegeneraattori()
@@ -0,0 +1,137 @@
+import random
+import time
+import tracemalloc
+
+from match_engine import MatchScorer, estimate_match_win
+from match_log import MatchLog
+from tennis_game import TennisGame
+from tournament import Tournament
+
+
+def score_points(points=1_000_000):
+    rng = random.Random(1)
+    winners = [rng.randrange(2) for _ in range(1000)]
+    names = ["player1", "player2"]
+
+    start = time.perf_counter()
+    game = TennisGame(*names)
+    for i in range(points):
+        game.won_point(names[winners[i % 1000]])
+        game.get_score()
+        if i % 8 == 7:
+            game = TennisGame(*names)
+    game_rate = points / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    scorer = MatchScorer()
+    for i in range(points):
+        scorer.point_won(winners[i % 1000])
+        if scorer.winner is not None:
+            scorer = MatchScorer()
+    scorer_rate = points / (time.perf_counter() - start)
+
+    return game_rate, scorer_rate
+
+
+def poll_scores(polls=2_000_000):
+    games = [TennisGame("player1", "player2") for _ in range(64)]
+    for i, game in enumerate(games):
+        game.score_player1 = i % 8
+        game.score_player2 = i // 8
+
+    start = time.perf_counter()
+    for i in range(polls):
+        games[i & 63].get_score()
+
+    return polls / (time.perf_counter() - start)
+
+
+def live_feed(matches=10_000, batches=100, batch_size=10_000):
+    rng = random.Random(2)
+    events = [
+        [(match_id, f"p{match_id % 500}" if rng.random() < 0.5 else f"q{match_id % 500}")
+         for match_id in (rng.randrange(matches) for _ in range(batch_size))]
+        for _ in range(batches)
+    ]
+
+    tracemalloc.start()
+    games = [TennisGame(f"p{i % 500}", f"q{i % 500}") for i in range(matches)]
+    games_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for batch in events:
+        shown = {}
+        for match_id, player_name in batch:
+            game = games[match_id]
+            if match_id not in shown:
+                shown[match_id] = game.get_score()
+            game.won_point(player_name)
+        [(match_id, games[match_id].get_score()) for match_id, score in shown.items()
+         if games[match_id].get_score() != score]
+    games_rate = batches * batch_size / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    tournament = Tournament()
+    for i in range(matches):
+        tournament.add_match(f"p{i % 500}", f"q{i % 500}")
+    tournament_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for batch in events:
+        tournament.apply_points(batch)
+    tournament_rate = batches * batch_size / (time.perf_counter() - start)
+
+    return games_memory, games_rate, tournament_memory, tournament_rate
+
+
+def score_queries(points=5_000, queries=2_000):
+    rng = random.Random(3)
+    log = MatchLog("player1", "player2")
+    for _ in range(points):
+        log.won_point(rng.choice(["player1", "player2"]))
+    events = [rng.randrange(points + 1) for _ in range(queries)]
+
+    start = time.perf_counter()
+    for event in events:
+        game = TennisGame("player1", "player2")
+        for i in range(event):
+            game.won_point("player1" if log._events[i] == 0 else "player2")
+        game.get_score()
+    replay_rate = queries / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for event in events:
+        log.score_at(event)
+    log_rate = queries / (time.perf_counter() - start)
+
+    return replay_rate, log_rate
+
+
+def simulate(matches=1_000_000):
+    start = time.perf_counter()
+    p, error = estimate_match_win(0.65, 0.62, matches, seed=1)
+
+    return p, error, matches / (time.perf_counter() - start)
+
+
+def main():
+    game_rate, scorer_rate = score_points()
+    print(f"TennisGame: {game_rate:>10.0f} points/s, MatchScorer: {scorer_rate:>10.0f} points/s")
+
+    print(f"TennisGame.get_score: {poll_scores():>10.0f} polls/s")
+
+    games_memory, games_rate, tournament_memory, tournament_rate = live_feed()
+    print(f"10000 TennisGames: {games_memory / 1024:.0f} KiB, {games_rate:.0f} events/s")
+    print(f"Tournament of 10000: {tournament_memory / 1024:.0f} KiB, {tournament_rate:.0f} events/s")
+
+    replay_rate, log_rate = score_queries()
+    print(f"score at event N of 5000: replay {replay_rate:.0f} queries/s, MatchLog {log_rate:.0f} queries/s")
+
+    p, error, rate = simulate()
+    print(f"simulated match win probability {p:.4f} ± {1.96 * error:.4f}, {rate:.0f} matches/s")
+
+
+if __name__ == "__main__":
+    main()
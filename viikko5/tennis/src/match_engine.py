@@ -0,0 +1,176 @@
+import math
+import random
+
+GAME_POINTS = 4
+TIEBREAK_POINTS = 7
+SET_GAMES = 6
+
+POINT_NAMES = ["0", "15", "30", "40"]
+
+
+def build_point_table(target):
+    # Point states of a game or a tiebreak as small ints. Scores below target
+    # are numbered a * target + b, and (target - 1, target - 1) doubles as
+    # deuce. The four states after those are the advantages and the wins.
+    adv1 = target * target
+    adv2 = adv1 + 1
+    win1 = adv1 + 2
+    win2 = adv1 + 3
+    deuce = (target - 1) * target + target - 1
+    table = [0] * ((win2 + 1) * 2)
+
+    for a in range(target):
+        for b in range(target):
+            state = a * target + b
+
+            if a + 1 < target:
+                table[state * 2] = state + target
+            else:
+                table[state * 2] = adv1 if state == deuce else win1
+
+            if b + 1 < target:
+                table[state * 2 + 1] = state + 1
+            else:
+                table[state * 2 + 1] = adv2 if state == deuce else win2
+
+    table[adv1 * 2], table[adv1 * 2 + 1] = win1, deuce
+    table[adv2 * 2], table[adv2 * 2 + 1] = deuce, win2
+    table[win1 * 2] = table[win1 * 2 + 1] = win1
+    table[win2 * 2] = table[win2 * 2 + 1] = win2
+
+    return table, win1, win2
+
+
+GAME_TABLE, GAME_WIN1, GAME_WIN2 = build_point_table(GAME_POINTS)
+TIEBREAK_TABLE, TIEBREAK_WIN1, TIEBREAK_WIN2 = build_point_table(TIEBREAK_POINTS)
+
+
+def point_labels(state):
+    if state < GAME_POINTS * GAME_POINTS:
+        a, b = divmod(state, GAME_POINTS)
+        return POINT_NAMES[a], POINT_NAMES[b]
+    return [("Ad", "40"), ("40", "Ad"), ("Game", ""), ("", "Game")][state - GAME_POINTS * GAME_POINTS]
+
+
+def win_probability(table, win1, p):
+    # probability that player 1 reaches win1 from the first state when they
+    # win each point with probability p; iterated because deuce is a cycle
+    values = [0.0] * (len(table) // 2)
+    values[win1] = 1.0
+
+    for _ in range(200):
+        for state in range(win1):
+            values[state] = p * values[table[state * 2]] + (1 - p) * values[table[state * 2 + 1]]
+
+    return values[0]
+
+
+class MatchScorer:
+    # Point by point scoring of a whole match. Players are 0 and 1.
+    def __init__(self, sets_to_win=2):
+        self.sets_to_win = sets_to_win
+        self.sets = [0, 0]
+        self.games = [0, 0]
+        self.points = 0
+        self.tiebreak = False
+        self.tiebreak_points = [0, 0]
+        self.winner = None
+
+    def point_won(self, player):
+        if self.winner is not None:
+            return
+
+        if self.tiebreak:
+            # the table only tracks the state, the shown score is counted apart
+            self.tiebreak_points[player] += 1
+            self.points = TIEBREAK_TABLE[self.points * 2 + player]
+            if self.points >= TIEBREAK_WIN1:
+                self._game_won(self.points - TIEBREAK_WIN1)
+        else:
+            self.points = GAME_TABLE[self.points * 2 + player]
+            if self.points >= GAME_WIN1:
+                self._game_won(self.points - GAME_WIN1)
+
+    def score(self):
+        if self.tiebreak:
+            points = tuple(self.tiebreak_points)
+        else:
+            points = point_labels(self.points)
+
+        return tuple(self.sets), tuple(self.games), points
+
+    def _game_won(self, player):
+        self.points = 0
+        self.games[player] += 1
+        games, other = self.games[player], self.games[1 - player]
+
+        if self.tiebreak or (games >= SET_GAMES and games - other >= 2):
+            self.sets[player] += 1
+            self.games = [0, 0]
+            self.tiebreak = False
+            self.tiebreak_points = [0, 0]
+            if self.sets[player] == self.sets_to_win:
+                self.winner = player
+        elif games == other == SET_GAMES:
+            self.tiebreak = True
+
+
+def _simulate_tiebreak(rng, first_server, serve_win):
+    state = 0
+    point = 0
+
+    while state < TIEBREAK_WIN1:
+        # the first server serves one point, then the serve alternates every two
+        server = first_server if (point + 1) // 2 % 2 == 0 else 1 - first_server
+        winner = server if rng() < serve_win[server] else 1 - server
+        state = TIEBREAK_TABLE[state * 2 + winner]
+        point += 1
+
+    return state - TIEBREAK_WIN1
+
+
+def simulate_match(rng, serve_win, hold, sets_to_win=2):
+    # Games are decided with one draw each from the precomputed probability
+    # of holding serve. Only tiebreaks are played point by point.
+    sets = [0, 0]
+    server = 0
+
+    while True:
+        games = [0, 0]
+
+        while True:
+            if games[0] == games[1] == SET_GAMES:
+                winner = _simulate_tiebreak(rng, server, serve_win)
+                games[winner] += 1
+                server = 1 - server
+                break
+
+            winner = server if rng() < hold[server] else 1 - server
+            games[winner] += 1
+            server = 1 - server
+
+            if games[winner] >= SET_GAMES and games[winner] - games[1 - winner] >= 2:
+                break
+
+        sets[winner] += 1
+        if sets[winner] == sets_to_win:
+            return winner
+
+
+def estimate_match_win(p1_serve, p2_serve, matches=1_000_000, sets_to_win=2, seed=None):
+    # returns player 1's estimated match win probability and its standard error
+    rng = random.Random(seed).random
+    serve_win = (p1_serve, p2_serve)
+    hold = (
+        win_probability(GAME_TABLE, GAME_WIN1, p1_serve),
+        win_probability(GAME_TABLE, GAME_WIN1, p2_serve),
+    )
+
+    wins = 0
+    for _ in range(matches):
+        if simulate_match(rng, serve_win, hold, sets_to_win) == 0:
+            wins += 1
+
+    p = wins / matches
+
+    return p, math.sqrt(p * (1 - p) / matches)
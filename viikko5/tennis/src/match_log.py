@@ -0,0 +1,73 @@
+from array import array
+
+from tennis_game import TennisGame, score_table, score_index
+
+CHECKPOINT_INTERVAL = 64
+
+
+class MatchLog:
+    # Point by point log of one game. Each event is stored as one byte, 0 when
+    # player 1 won the point and 1 otherwise. The number of points player 1
+    # had won is checkpointed every CHECKPOINT_INTERVAL events, so the score
+    # at any event is found by counting at most that many bytes.
+    def __init__(self, player1_name, player2_name):
+        self.player1_name = player1_name
+        self.player2_name = player2_name
+        self._events = bytearray()
+        self._checkpoints = array("I", [0])
+        self._player1_points = 0
+        self._scores = score_table(player1_name, player2_name)
+
+    def __len__(self):
+        return len(self._events)
+
+    def won_point(self, player_name):
+        if player_name == self.player1_name:
+            self._events.append(0)
+            self._player1_points += 1
+        else:
+            self._events.append(1)
+
+        if len(self._events) % CHECKPOINT_INTERVAL == 0:
+            self._checkpoints.append(self._player1_points)
+
+    def points_at(self, event):
+        # points of both players after the first `event` events
+        if not 0 <= event <= len(self._events):
+            raise IndexError(f"event {event} out of range 0..{len(self._events)}")
+
+        checkpoint = event // CHECKPOINT_INTERVAL
+        start = checkpoint * CHECKPOINT_INTERVAL
+        player1 = self._checkpoints[checkpoint] + self._events.count(0, start, event)
+
+        return player1, event - player1
+
+    def score_at(self, event):
+        return self._scores[score_index(*self.points_at(event))]
+
+    def game_at(self, event):
+        game = TennisGame(self.player1_name, self.player2_name)
+        game.score_player1, game.score_player2 = self.points_at(event)
+
+        return game
+
+    def save(self, path):
+        with open(path, "wb") as file:
+            file.write(f"{self.player1_name}\t{self.player2_name}\n".encode())
+            file.write(self._events)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as file:
+            player1_name, player2_name = file.readline().decode().rstrip("\n").split("\t")
+            events = file.read()
+
+        log = cls(player1_name, player2_name)
+        for start in range(0, len(events), CHECKPOINT_INTERVAL):
+            chunk = events[start:start + CHECKPOINT_INTERVAL]
+            log._events += chunk
+            log._player1_points += chunk.count(0)
+            if len(chunk) == CHECKPOINT_INTERVAL:
+                log._checkpoints.append(log._player1_points)
+
+        return log
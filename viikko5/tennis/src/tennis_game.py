@@ -1,39 +1,66 @@
+from functools import lru_cache
+
+SCORES = ["Love", "Fifteen", "Thirty", "Forty"]
+
+
+def _score(score_player1, score_player2, player1_name, player2_name):
+    if score_player1 == score_player2:
+        if score_player1 <= 2:
+            return f"{SCORES[score_player1]}-All"
+        return "Deuce"
+
+    if score_player1 < 4 and score_player2 < 4:
+        return f"{SCORES[score_player1]}-{SCORES[score_player2]}"
+
+    diff = score_player1 - score_player2
+
+    if diff >= 2:
+        return f"Win for {player1_name}"
+    if diff <= -2:
+        return f"Win for {player2_name}"
+    if diff == 1:
+        return f"Advantage {player1_name}"
+    return f"Advantage {player2_name}"
+
+
+@lru_cache(maxsize=1024)
+def score_table(player1_name, player2_name):
+    # Scores below four points are stored at score_player1 * 4 + score_player2.
+    # Once either player has four points only the difference matters, and
+    # differences -2...2 are stored at 18 + difference.
+    table = [_score(p1, p2, player1_name, player2_name) for p1 in range(4) for p2 in range(4)]
+    table += [_score(4 + max(diff, 0), 4 - min(diff, 0), player1_name, player2_name) for diff in range(-2, 3)]
+
+    return tuple(table)
+
+
+def score_index(score_player1, score_player2):
+    # position of the score in the table returned by score_table
+    if score_player1 < 4 and score_player2 < 4:
+        return score_player1 * 4 + score_player2
+
+    diff = score_player1 - score_player2
+    if diff > 2:
+        diff = 2
+    elif diff < -2:
+        diff = -2
+
+    return 18 + diff
+
+
 class TennisGame:
     def __init__(self, player1_name, player2_name):
         self.player1_name = player1_name
         self.player2_name = player2_name
         self.score_player1 = 0
         self.score_player2 = 0
+        self._scores = score_table(player1_name, player2_name)
 
     def won_point(self, player_name):
         if player_name == self.player1_name:
             self.score_player1 += 1
         else:
             self.score_player2 += 1
-        
+
     def get_score(self):
-        self.scores = ["Love", "Fifteen", "Thirty", "Forty"]
-        if self.score_player1 == self.score_player2:
-            return self.even()
-        if self.score_player1 >= 4 or self.score_player2 >= 4:
-            return self.over40()
-        return self.under40()
-    
-    def even(self):
-        if self.score_player1 <= 2:
-            return f"{self.scores[self.score_player1]}-All"
-        return "Deuce"
-    
-    def under40(self):
-        return f"{self.scores[self.score_player1]}-{self.scores[self.score_player2]}"
-    
-    def over40(self):
-        diff = self.score_player1 - self.score_player2
-
-        if diff >= 2:
-            return f"Win for {self.player1_name}"
-        if diff <= -2:
-            return f"Win for {self.player2_name}"
-        if diff == 1:
-            return f"Advantage {self.player1_name}"
-        return f"Advantage {self.player2_name}"
\ No newline at end of file
+        return self._scores[score_index(self.score_player1, self.score_player2)]
@@ -0,0 +1,97 @@
+import random
+import unittest
+
+from match_engine import (
+    GAME_TABLE,
+    GAME_WIN1,
+    MatchScorer,
+    TIEBREAK_TABLE,
+    TIEBREAK_WIN1,
+    TIEBREAK_WIN2,
+    estimate_match_win,
+    win_probability,
+)
+
+
+def play(table, points):
+    state = 0
+    for player in points:
+        state = table[state * 2 + player]
+    return state
+
+
+class TestPointTables(unittest.TestCase):
+    def test_game_is_won_with_four_straight_points(self):
+        self.assertEqual(play(GAME_TABLE, [0, 0, 0, 0]), GAME_WIN1)
+
+    def test_game_needs_two_point_lead_after_deuce(self):
+        deuce = play(GAME_TABLE, [0, 1, 0, 1, 0, 1])
+
+        self.assertEqual(play(GAME_TABLE, [0, 1, 0, 1, 0, 1, 0, 1, 1, 0]), deuce)
+        self.assertEqual(play(GAME_TABLE, [0, 1, 0, 1, 0, 1, 0, 0]), GAME_WIN1)
+
+    def test_tiebreak_goes_to_seven_by_two(self):
+        self.assertEqual(play(TIEBREAK_TABLE, [1] * 7), TIEBREAK_WIN2)
+        self.assertLess(play(TIEBREAK_TABLE, [0, 1] * 6 + [0]), TIEBREAK_WIN1)
+        self.assertEqual(play(TIEBREAK_TABLE, [0, 1] * 6 + [0, 0]), TIEBREAK_WIN1)
+
+    def test_hold_probability_matches_closed_form(self):
+        p = 0.6
+        q = 1 - p
+        deuce = p * p / (p * p + q * q)
+        expected = p**4 * (1 + 4 * q + 10 * q * q) + 20 * p**3 * q**3 * deuce
+
+        self.assertAlmostEqual(win_probability(GAME_TABLE, GAME_WIN1, p), expected)
+
+
+class TestMatchScorer(unittest.TestCase):
+    def test_points_are_shown_as_tennis_scores(self):
+        scorer = MatchScorer()
+        for player in (0, 0, 1):
+            scorer.point_won(player)
+
+        self.assertEqual(scorer.score(), ((0, 0), (0, 0), ("30", "15")))
+
+    def test_set_goes_to_tiebreak_at_six_all(self):
+        scorer = MatchScorer()
+        for _ in range(6):
+            for player in (0, 1):
+                for _ in range(4):
+                    scorer.point_won(player)
+
+        self.assertTrue(scorer.tiebreak)
+
+        for player in (0, 1, 0, 0, 0, 0, 0, 0):
+            scorer.point_won(player)
+
+        self.assertEqual(scorer.score(), ((1, 0), (0, 0), ("0", "0")))
+
+    def test_match_ends_after_two_sets(self):
+        scorer = MatchScorer()
+        for _ in range(2 * 6 * 4):
+            scorer.point_won(1)
+
+        self.assertEqual(scorer.winner, 1)
+        self.assertEqual(scorer.score()[0], (0, 2))
+
+    def test_scorer_agrees_with_simulated_random_matches(self):
+        rng = random.Random(3)
+        for _ in range(20):
+            scorer = MatchScorer(sets_to_win=3)
+            while scorer.winner is None:
+                scorer.point_won(rng.randrange(2))
+
+            self.assertEqual(scorer.sets[scorer.winner], 3)
+            self.assertLess(scorer.sets[1 - scorer.winner], 3)
+
+
+class TestSimulator(unittest.TestCase):
+    def test_equal_players_win_half_of_matches(self):
+        p, error = estimate_match_win(0.62, 0.62, matches=20_000, seed=1)
+
+        self.assertLess(abs(p - 0.5), 4 * error)
+
+    def test_better_server_is_favourite(self):
+        p, _ = estimate_match_win(0.7, 0.6, matches=5_000, seed=2)
+
+        self.assertGreater(p, 0.8)
@@ -0,0 +1,56 @@
+import os
+import random
+import tempfile
+import unittest
+
+from match_log import MatchLog
+from tennis_game import TennisGame
+
+
+class TestMatchLog(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.points = [rng.choice(["Ann", "Bob"]) for _ in range(1000)]
+        self.log = MatchLog("Ann", "Bob")
+        for player_name in self.points:
+            self.log.won_point(player_name)
+
+    def test_score_at_every_event_matches_replay(self):
+        game = TennisGame("Ann", "Bob")
+
+        for event, player_name in enumerate(self.points):
+            self.assertEqual(self.log.score_at(event), game.get_score())
+            game.won_point(player_name)
+
+        self.assertEqual(self.log.score_at(len(self.points)), game.get_score())
+
+    def test_events_outside_log_are_rejected(self):
+        log = MatchLog("Ann", "Bob")
+        for _ in range(10):
+            log.won_point("Ann")
+
+        self.assertEqual(log.points_at(10), (10, 0))
+        self.assertRaises(IndexError, log.points_at, 14)
+        self.assertRaises(IndexError, log.points_at, -3)
+        self.assertRaises(IndexError, log.score_at, 11)
+
+    def test_game_at_event_can_be_continued(self):
+        game = self.log.game_at(3)
+        game.won_point("Ann")
+
+        self.assertEqual(
+            (game.score_player1, game.score_player2), (self.points[:4].count("Ann"), self.points[:4].count("Bob"))
+        )
+
+    def test_log_survives_save_and_load(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "match.log")
+
+        self.log.save(path)
+        loaded = MatchLog.load(path)
+
+        self.assertEqual(len(loaded), 1000)
+        self.assertEqual(loaded.player2_name, "Bob")
+        for event in (0, 1, 63, 64, 65, 999, 1000):
+            self.assertEqual(loaded.points_at(event), self.log.points_at(event))
@@ -60,3 +60,46 @@ class TestTennis(unittest.TestCase):
             (p1_points, p2_points, score) = test_case
             game = play_game(p1_points, p2_points)
             self.assertEqual(score, game.get_score())
+
+
+def original_score(score_player1, score_player2, player1_name, player2_name):
+    # TennisGame.get_score before the score table
+    scores = ["Love", "Fifteen", "Thirty", "Forty"]
+
+    if score_player1 == score_player2:
+        if score_player1 <= 2:
+            return f"{scores[score_player1]}-All"
+        return "Deuce"
+
+    if score_player1 >= 4 or score_player2 >= 4:
+        diff = score_player1 - score_player2
+
+        if diff >= 2:
+            return f"Win for {player1_name}"
+        if diff <= -2:
+            return f"Win for {player2_name}"
+        if diff == 1:
+            return f"Advantage {player1_name}"
+        return f"Advantage {player2_name}"
+
+    return f"{scores[score_player1]}-{scores[score_player2]}"
+
+
+class TestScoreTable(unittest.TestCase):
+    def test_score_matches_original_implementation_for_all_scores(self):
+        game = TennisGame("Ann", "Bob")
+
+        for p1_points in range(30):
+            for p2_points in range(30):
+                game.score_player1 = p1_points
+                game.score_player2 = p2_points
+
+                self.assertEqual(
+                    game.get_score(), original_score(p1_points, p2_points, "Ann", "Bob"), (p1_points, p2_points)
+                )
+
+    def test_games_with_same_players_share_score_strings(self):
+        first = play_game(4, 3)
+        second = play_game(5, 4)
+
+        self.assertIs(first.get_score(), second.get_score())
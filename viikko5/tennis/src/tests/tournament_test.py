@@ -0,0 +1,71 @@
+import random
+import unittest
+
+from tennis_game import TennisGame
+from tournament import Tournament
+
+
+class TestTournament(unittest.TestCase):
+    def setUp(self):
+        self.tournament = Tournament()
+        self.first = self.tournament.add_match("Ann", "Bob")
+        self.second = self.tournament.add_match("Cid", "Dan")
+
+    def test_new_match_is_love_all(self):
+        self.assertEqual(len(self.tournament), 2)
+        self.assertEqual(self.tournament.get_score(self.second), "Love-All")
+
+    def test_unknown_match_id_is_rejected(self):
+        for match_id in (-1, 2):
+            self.assertRaises(IndexError, self.tournament.won_point, match_id, "Ann")
+            self.assertRaises(IndexError, self.tournament.get_score, match_id)
+
+        self.assertEqual(self.tournament.get_score(self.second), "Love-All")
+
+    def test_batch_with_unknown_match_id_changes_nothing(self):
+        events = [(self.first, "Ann"), (-1, "Dan")]
+
+        self.assertRaises(IndexError, self.tournament.apply_points, events)
+        self.assertEqual(self.tournament.get_score(self.first), "Love-All")
+        self.assertEqual(self.tournament.get_score(self.second), "Love-All")
+
+    def test_points_are_kept_per_match(self):
+        self.tournament.won_point(self.first, "Ann")
+        self.tournament.won_point(self.second, "Dan")
+
+        self.assertEqual(self.tournament.get_score(self.first), "Fifteen-Love")
+        self.assertEqual(self.tournament.get_score(self.second), "Love-Fifteen")
+
+    def test_batch_reports_only_changed_scores(self):
+        for _ in range(3):
+            self.tournament.won_point(self.first, "Ann")
+            self.tournament.won_point(self.first, "Bob")
+
+        changed = self.tournament.apply_points(
+            [(self.first, "Ann"), (self.first, "Bob"), (self.second, "Cid")]
+        )
+
+        self.assertEqual(changed, [(self.second, "Fifteen-Love")])
+        self.assertEqual(self.tournament.get_score(self.first), "Deuce")
+
+    def test_finished_match_is_not_reported_again(self):
+        self.tournament.apply_points([(self.first, "Ann")] * 4)
+
+        self.assertEqual(self.tournament.apply_points([(self.first, "Ann")]), [])
+
+    def test_scores_match_separate_tennis_games(self):
+        rng = random.Random(5)
+        tournament = Tournament()
+        games = []
+        for i in range(50):
+            tournament.add_match(f"a{i}", f"b{i}")
+            games.append(TennisGame(f"a{i}", f"b{i}"))
+
+        for _ in range(20):
+            events = [(i, rng.choice([f"a{i}", f"b{i}"])) for i in (rng.randrange(50) for _ in range(30))]
+            tournament.apply_points(events)
+            for match_id, player_name in events:
+                games[match_id].won_point(player_name)
+
+        for match_id, game in enumerate(games):
+            self.assertEqual(tournament.get_score(match_id), game.get_score())
@@ -0,0 +1,88 @@
+from array import array
+
+from tennis_game import score_table, score_index
+
+
+class Tournament:
+    # Keeps the state of many concurrent games in packed arrays indexed by
+    # match id instead of one TennisGame object per match. Every distinct pair
+    # of players is stored once, with its score strings, and matches refer
+    # to the pair by index.
+    def __init__(self):
+        self._score_player1 = array("I")
+        self._score_player2 = array("I")
+        self._pair_ids = array("I")
+        self._pairs = {}
+        self._player1_names = []
+        self._tables = []
+
+    def __len__(self):
+        return len(self._pair_ids)
+
+    def add_match(self, player1_name, player2_name):
+        pair_id = self._pairs.get((player1_name, player2_name))
+
+        if pair_id is None:
+            pair_id = self._pairs[(player1_name, player2_name)] = len(self._tables)
+            self._player1_names.append(player1_name)
+            self._tables.append(score_table(player1_name, player2_name))
+
+        self._score_player1.append(0)
+        self._score_player2.append(0)
+        self._pair_ids.append(pair_id)
+
+        return len(self._pair_ids) - 1
+
+    def won_point(self, match_id, player_name):
+        self._check_match_id(match_id)
+
+        if player_name == self._player1_names[self._pair_ids[match_id]]:
+            self._score_player1[match_id] += 1
+        else:
+            self._score_player2[match_id] += 1
+
+    def get_score(self, match_id):
+        self._check_match_id(match_id)
+        index = score_index(self._score_player1[match_id], self._score_player2[match_id])
+
+        return self._tables[self._pair_ids[match_id]][index]
+
+    def apply_points(self, events):
+        # Applies a batch of (match_id, player_name) events and returns
+        # (match_id, score) for the matches whose shown score changed.
+        # Match ids are checked before any point is applied.
+        events = list(events)
+        if events:
+            self._check_match_id(min(match_id for match_id, _ in events))
+            self._check_match_id(max(match_id for match_id, _ in events))
+
+        score_player1 = self._score_player1
+        score_player2 = self._score_player2
+        pair_ids = self._pair_ids
+        player1_names = self._player1_names
+        before = {}
+
+        for match_id, player_name in events:
+            if match_id not in before:
+                before[match_id] = score_index(score_player1[match_id], score_player2[match_id])
+
+            if player_name == player1_names[pair_ids[match_id]]:
+                score_player1[match_id] += 1
+            else:
+                score_player2[match_id] += 1
+
+        changed = []
+        for match_id, index in before.items():
+            scores = self._tables[pair_ids[match_id]]
+            score = scores[score_index(score_player1[match_id], score_player2[match_id])]
+
+            # compared as strings, as deuce is stored both at 3-3 and after it
+            if score != scores[index]:
+                changed.append((match_id, score))
+
+        return changed
+
+    def _check_match_id(self, match_id):
+        # a negative id would silently index another match from the end
+        if not 0 <= match_id < len(self._pair_ids):
+            raise IndexError(f"match {match_id} out of range 0..{len(self._pair_ids)}")
@@ -0,0 +1,26 @@
+import time
+from lukutyypit import LUKUTYYPIT
+from sovelluslogiikka import Sovelluslogiikka
+
+
+def operaatiot(lukutyyppi, operaatioita=1_000_000):
+    sovellus = Sovelluslogiikka(lukutyyppi=lukutyyppi)
+    operandit = [sovellus.muunna(teksti) for teksti in ("7", "3", "11", "5")]
+
+    alku = time.perf_counter()
+    for i in range(operaatioita // 4):
+        sovellus.plus(operandit[0])
+        sovellus.miinus(operandit[1])
+        sovellus.plus(operandit[2])
+        sovellus.kumoa()
+
+    return operaatioita / (time.perf_counter() - alku)
+
+
+def main():
+    for nimi, lukutyyppi in LUKUTYYPIT.items():
+        print(f"{nimi:<10} {operaatiot(lukutyyppi()):>12.0f} operaatiota/s")
+
+
+if __name__ == "__main__":
+    main()
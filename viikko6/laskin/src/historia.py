@@ -0,0 +1,48 @@
+from array import array
+
+
+class Historia:
+    # Kiinteän kokoinen rengaspuskuri, jonka täyttyessä vanhin arvo
+    # korvautuu uudella. Oletuksena arvot ovat tyypitetyssä taulukossa, ja
+    # jos arvo ei mahdu siihen, puskuri vaihdetaan tavalliseksi listaksi.
+    # Kun tyyppi on None, arvot ovat alusta asti listassa.
+    def __init__(self, koko, tyyppi="q"):
+        if tyyppi is None:
+            self._arvot = [None] * koko
+        else:
+            self._arvot = array(tyyppi, bytes(array(tyyppi).itemsize * koko))
+        self._koko = koko
+        self._alku = 0
+        self._maara = 0
+
+    def __len__(self):
+        return self._maara
+
+    def lisaa(self, arvo):
+        if self._koko == 0:
+            return
+
+        kohta = (self._alku + self._maara) % self._koko
+
+        try:
+            self._arvot[kohta] = arvo
+        except (OverflowError, TypeError):
+            self._arvot = list(self._arvot)
+            self._arvot[kohta] = arvo
+
+        if self._maara < self._koko:
+            self._maara += 1
+        else:
+            self._alku = (self._alku + 1) % self._koko
+
+    def ota(self):
+        if self._maara == 0:
+            return None
+
+        self._maara -= 1
+
+        return self._arvot[(self._alku + self._maara) % self._koko]
+
+    def tyhjenna(self):
+        self._alku = 0
+        self._maara = 0
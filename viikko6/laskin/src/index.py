@@ -1,9 +1,12 @@
-from tkinter import Tk
-from kayttoliittyma import Kayttoliittyma
 from sovelluslogiikka import Sovelluslogiikka
 
 
 def main():
+    # käyttöliittymä ladataan vasta kun sitä tarvitaan, jotta logiikkaa ja
+    # komentoja voi käyttää myös koneilla, joilla ei ole näyttöä
+    from tkinter import Tk
+    from kayttoliittyma import Kayttoliittyma
+
     sovellus = Sovelluslogiikka()
 
     window = Tk()
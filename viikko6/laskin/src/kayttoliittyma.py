@@ -1,12 +1,5 @@
-from enum import Enum
 from tkinter import ttk, constants, StringVar
-
-
-class Komento(Enum):
-    SUMMA = 1
-    EROTUS = 2
-    NOLLAUS = 3
-    KUMOA = 4
+from komento import Komento
 
 
 class Kayttoliittyma:
@@ -24,9 +17,11 @@ class Kayttoliittyma:
     def kaynnista(self):
         self._arvo_var = StringVar()
         self._arvo_var.set(self._sovelluslogiikka.arvo())
+        self._virhe_var = StringVar()
         self._syote_kentta = ttk.Entry(master=self._root)
 
         tulos_teksti = ttk.Label(textvariable=self._arvo_var)
+        virhe_teksti = ttk.Label(textvariable=self._virhe_var, foreground="red")
 
         summa_painike = ttk.Button(
             master=self._root,
@@ -60,15 +55,20 @@ class Kayttoliittyma:
         erotus_painike.grid(row=2, column=1)
         self._nollaus_painike.grid(row=2, column=2)
         self._kumoa_painike.grid(row=2, column=3)
+        virhe_teksti.grid(columnspan=4)
 
     def _suorita_komento(self, komento):
         arvo = 0
 
-        try:
-            arvo = int(self._syote_kentta.get())
-        except Exception:
-            pass
+        if komento in (Komento.SUMMA, Komento.EROTUS):
+            try:
+                arvo = self._sovelluslogiikka.muunna(self._syote_kentta.get())
+            except ValueError as virhe:
+                # virheellinen syöte jätetään kenttään korjattavaksi
+                self._virhe_var.set(str(virhe))
+                return
 
+        self._virhe_var.set("")
         self._komennot[komento](arvo)
 
         self._kumoa_painike["state"] = constants.NORMAL
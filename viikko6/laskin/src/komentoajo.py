@@ -0,0 +1,77 @@
+import sys
+from komento import Komento
+from lukutyypit import LUKUTYYPIT
+from sovelluslogiikka import Sovelluslogiikka
+
+
+def suorita(sovelluslogiikka, rivit, tarkistusvali=0):
+    # Suorittaa komentorivit muotoa "SUMMA 5", "EROTUS 3", "NOLLAUS" ja
+    # "KUMOA". Palauttaa lopullisen arvon ja jokaisen tarkistusvali:nnen
+    # komennon jälkeisen arvon (rivinumero, arvo)-pareina.
+    toiminnot = {
+        Komento.SUMMA.name: sovelluslogiikka.plus,
+        Komento.EROTUS.name: sovelluslogiikka.miinus,
+    }
+    ilman_operandia = {
+        Komento.NOLLAUS.name: sovelluslogiikka.nollaa,
+        Komento.KUMOA.name: sovelluslogiikka.kumoa,
+    }
+    tarkistukset = []
+    komentoja = 0
+
+    for rivinumero, rivi in enumerate(rivit, start=1):
+        osat = rivi.split()
+        if not osat:
+            continue
+
+        toiminto = toiminnot.get(osat[0])
+
+        try:
+            if toiminto:
+                # summalla ja erotuksella on täsmälleen yksi operandi, muilla ei yhtään
+                operandi, = osat[1:]
+                toiminto(sovelluslogiikka.muunna(operandi))
+            else:
+                komento, = osat
+                ilman_operandia[komento]()
+        except (KeyError, ValueError) as virhe:
+            raise ValueError(f"virheellinen komento rivillä {rivinumero}: {rivi.strip()}") from virhe
+
+        komentoja += 1
+        if tarkistusvali and komentoja % tarkistusvali == 0:
+            tarkistukset.append((rivinumero, sovelluslogiikka.arvo()))
+
+    return sovelluslogiikka.arvo(), tarkistukset
+
+
+def main(argumentit=None):
+    # argparse tuodaan vasta tässä, jotta suorita-funktion tuonti pysyy kevyenä
+    import argparse
+
+    jasennin = argparse.ArgumentParser(description="Suorittaa laskimen komentolokin ilman käyttöliittymää")
+    jasennin.add_argument("tiedosto", help="komentoloki, yksi komento riviä kohden")
+    jasennin.add_argument("--tarkistusvali", type=int, default=0, help="tulosta arvo joka n:nnen komennon jälkeen")
+    jasennin.add_argument("--historia", type=int, default=1000, help="kumottavien komentojen enimmäismäärä")
+    jasennin.add_argument("--lukutyyppi", choices=LUKUTYYPIT, default="int", help="laskennassa käytettävät luvut")
+    asetukset = jasennin.parse_args(argumentit)
+
+    with open(asetukset.tiedosto, encoding="utf-8") as tiedosto:
+        try:
+            arvo, tarkistukset = suorita(
+                Sovelluslogiikka(historian_koko=asetukset.historia, lukutyyppi=LUKUTYYPIT[asetukset.lukutyyppi]()),
+                tiedosto,
+                asetukset.tarkistusvali,
+            )
+        except ValueError as virhe:
+            print(virhe, file=sys.stderr)
+            return 1
+
+    for rivinumero, tarkistus in tarkistukset:
+        print(f"rivi {rivinumero}: {tarkistus}")
+    print(f"lopullinen arvo: {arvo}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
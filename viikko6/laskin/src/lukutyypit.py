@@ -0,0 +1,112 @@
+import operator
+from historia import Historia
+
+# decimal ja fractions tuodaan vasta kun niitä käytetään, koska niiden
+# tuonti moninkertaistaisi laskimen käynnistysajan kokonaisluvuilla
+
+
+class Kokonaisluku:
+    # oletus ja nopein vaihtoehto, historia tyypitetyssä taulukossa
+    nolla = 0
+    lisaa = staticmethod(operator.add)
+    vahenna = staticmethod(operator.sub)
+
+    def muunna(self, teksti):
+        return int(teksti)
+
+    def historia(self, koko):
+        return Historia(koko)
+
+
+class Desimaaliluku:
+    def __init__(self, tarkkuus=28):
+        import decimal
+
+        # myös liian suuri eksponentti (Overflow) on virheellinen syöte
+        self._virhe = decimal.DecimalException
+        self._konteksti = decimal.Context(prec=tarkkuus)
+        self.nolla = decimal.Decimal(0)
+        self.lisaa = self._konteksti.add
+        self.vahenna = self._konteksti.subtract
+
+    def muunna(self, teksti):
+        try:
+            tulos = self._konteksti.create_decimal(teksti.strip())
+        except self._virhe as virhe:
+            raise ValueError(f"ei desimaaliluku: {teksti}") from virhe
+
+        # NaN ja ääretön kelpaavat Decimalille, mutta laskutoimituksissa ne
+        # nostaisivat muita kuin ValueError-poikkeuksia
+        if not tulos.is_finite():
+            raise ValueError(f"ei äärellinen desimaaliluku: {teksti}")
+
+        return tulos
+
+    def historia(self, koko):
+        return Historia(koko, tyyppi=None)
+
+
+class Murtoluku:
+    # samaa rajaa käyttää int() merkkijonoja muuntaessaan; Fraction laskisi
+    # 10**eksponentti, mikä jumittaisi laskimen esim. syötteellä 1e100000000
+    SUURIN_EKSPONENTTI = 4300
+
+    lisaa = staticmethod(operator.add)
+    vahenna = staticmethod(operator.sub)
+
+    def __init__(self):
+        import re
+        from fractions import Fraction
+
+        self._murtoluku = Fraction
+        self._eksponentti = re.compile(r"e([-+]?\d[\d_]*)$", re.IGNORECASE)
+        self.nolla = Fraction(0)
+
+    def muunna(self, teksti):
+        eksponentti = self._eksponentti.search(teksti.strip())
+        if eksponentti and abs(int(eksponentti.group(1))) > self.SUURIN_EKSPONENTTI:
+            raise ValueError(f"liian suuri eksponentti: {teksti}")
+
+        try:
+            return self._murtoluku(teksti.strip())
+        except ZeroDivisionError as virhe:
+            raise ValueError(f"nimittäjä on nolla: {teksti}") from virhe
+
+    def historia(self, koko):
+        return MurtolukuHistoria(koko)
+
+
+class MurtolukuHistoria:
+    # osoittajat ja nimittäjät tallennetaan erikseen tyypitettyihin taulukoihin
+    def __init__(self, koko):
+        from fractions import Fraction
+
+        self._murtoluku = Fraction
+        self._osoittajat = Historia(koko)
+        self._nimittajat = Historia(koko)
+
+    def __len__(self):
+        return len(self._osoittajat)
+
+    def lisaa(self, arvo):
+        self._osoittajat.lisaa(arvo.numerator)
+        self._nimittajat.lisaa(arvo.denominator)
+
+    def ota(self):
+        osoittaja = self._osoittajat.ota()
+
+        if osoittaja is None:
+            return None
+
+        return self._murtoluku(osoittaja, self._nimittajat.ota())
+
+    def tyhjenna(self):
+        self._osoittajat.tyhjenna()
+        self._nimittajat.tyhjenna()
+
+
+LUKUTYYPIT = {
+    "int": Kokonaisluku,
+    "decimal": Desimaaliluku,
+    "fraction": Murtoluku,
+}
@@ -1,27 +1,57 @@
+from lukutyypit import Kokonaisluku
+
+
 class Sovelluslogiikka:
-    def __init__(self, arvo=0):
+    def __init__(self, arvo=0, historian_koko=1000, uudelleen=True, lukutyyppi=None):
+        # laskutoimitukset valitaan kerran lukutyypin mukaan, joten
+        # yksittäinen operaatio ei tarkista lukujen tyyppiä
+        self._lukutyyppi = lukutyyppi or Kokonaisluku()
+        self._lisaa = self._lukutyyppi.lisaa
+        self._vahenna = self._lukutyyppi.vahenna
         self._arvo = arvo
-        self._edellinen_arvo = [0]
-    
+        # historia on rajattu, joten pitkään käynnissä oleva laskin ei kasvata muistia
+        self._edellinen_arvo = self._lukutyyppi.historia(historian_koko)
+        self._edellinen_arvo.lisaa(self._lukutyyppi.nolla)
+        self._kumotut = self._lukutyyppi.historia(historian_koko) if uudelleen else None
+
     def _tallenna_edellinen(self):
-        self._edellinen_arvo.append(self._arvo)
+        self._edellinen_arvo.lisaa(self._arvo)
+
+        if self._kumotut is not None:
+            self._kumotut.tyhjenna()
+
+    def muunna(self, teksti):
+        return self._lukutyyppi.muunna(teksti)
 
     def miinus(self, operandi):
         self._tallenna_edellinen()
-        self._arvo = self._arvo - operandi
+        self._arvo = self._vahenna(self._arvo, operandi)
 
     def plus(self, operandi):
         self._tallenna_edellinen()
-        self._arvo = self._arvo + operandi
+        self._arvo = self._lisaa(self._arvo, operandi)
 
     def nollaa(self):
         self._tallenna_edellinen()
-        self._arvo = 0
-    
+        self._arvo = self._lukutyyppi.nolla
+
     def kumoa(self):
-        if self._edellinen_arvo:
-            self._arvo = self._edellinen_arvo[-1]
-            self._edellinen_arvo.pop()
+        edellinen = self._edellinen_arvo.ota()
+
+        if edellinen is not None:
+            if self._kumotut is not None:
+                self._kumotut.lisaa(self._arvo)
+            self._arvo = edellinen
+
+    def tee_uudelleen(self):
+        if self._kumotut is None:
+            return
+
+        seuraava = self._kumotut.ota()
+
+        if seuraava is not None:
+            self._edellinen_arvo.lisaa(self._arvo)
+            self._arvo = seuraava
 
     def aseta_arvo(self, arvo):
         self._arvo = arvo
@@ -0,0 +1,101 @@
+import unittest
+from historia import Historia
+from sovelluslogiikka import Sovelluslogiikka
+
+
+class TestHistoria(unittest.TestCase):
+    def test_arvot_otetaan_uusimmasta_alkaen(self):
+        historia = Historia(5)
+        for arvo in (1, 2, 3):
+            historia.lisaa(arvo)
+
+        self.assertEqual([historia.ota() for _ in range(4)], [3, 2, 1, None])
+
+    def test_taysi_puskuri_unohtaa_vanhimman(self):
+        historia = Historia(3)
+        for arvo in range(1, 8):
+            historia.lisaa(arvo)
+
+        self.assertEqual(len(historia), 3)
+        self.assertEqual([historia.ota() for _ in range(4)], [7, 6, 5, None])
+
+    def test_puskuri_kiertaa_useaan_kertaan(self):
+        historia = Historia(4)
+        for arvo in range(10):
+            historia.lisaa(arvo)
+        historia.ota()
+        historia.ota()
+        for arvo in range(10, 13):
+            historia.lisaa(arvo)
+
+        self.assertEqual([historia.ota() for _ in range(5)], [12, 11, 10, 7, None])
+
+    def test_liian_suuri_arvo_vaihtaa_taulukon_listaksi(self):
+        historia = Historia(3)
+        historia.lisaa(1)
+        historia.lisaa(2**70)
+        historia.lisaa(-(2**70))
+        historia.lisaa(4)
+
+        self.assertIsInstance(historia._arvot, list)
+        self.assertEqual([historia.ota() for _ in range(4)], [4, -(2**70), 2**70, None])
+
+    def test_muu_kuin_kokonaisluku_vaihtaa_taulukon_listaksi(self):
+        historia = Historia(2)
+        historia.lisaa(1)
+        historia.lisaa(1.5)
+
+        self.assertEqual([historia.ota() for _ in range(2)], [1.5, 1])
+
+    def test_nollan_kokoinen_historia_ei_tallenna(self):
+        historia = Historia(0)
+        historia.lisaa(1)
+
+        self.assertEqual(len(historia), 0)
+        self.assertIsNone(historia.ota())
+
+    def test_tyhjennys_poistaa_arvot(self):
+        historia = Historia(3)
+        historia.lisaa(1)
+        historia.tyhjenna()
+
+        self.assertIsNone(historia.ota())
+
+
+class TestSovelluslogiikanHistoria(unittest.TestCase):
+    def setUp(self):
+        self.laskin = Sovelluslogiikka(historian_koko=3)
+
+    def test_kumoa_ja_tee_uudelleen(self):
+        self.laskin.plus(5)
+        self.laskin.plus(3)
+        self.laskin.kumoa()
+        self.assertEqual(self.laskin.arvo(), 5)
+
+        self.laskin.tee_uudelleen()
+        self.assertEqual(self.laskin.arvo(), 8)
+
+    def test_uusi_laskutoimitus_tyhjentaa_uudelleen_tehtavat(self):
+        self.laskin.plus(5)
+        self.laskin.plus(3)
+        self.laskin.kumoa()
+        self.laskin.miinus(1)
+        self.laskin.tee_uudelleen()
+
+        self.assertEqual(self.laskin.arvo(), 4)
+
+    def test_kumoaminen_rajoittuu_historian_kokoon(self):
+        for _ in range(5):
+            self.laskin.plus(1)
+        for _ in range(5):
+            self.laskin.kumoa()
+
+        self.assertEqual(self.laskin.arvo(), 2)
+
+    def test_ilman_uudelleentekoa_tee_uudelleen_ei_tee_mitaan(self):
+        laskin = Sovelluslogiikka(uudelleen=False)
+        laskin.plus(5)
+        laskin.kumoa()
+        laskin.tee_uudelleen()
+
+        self.assertEqual(laskin.arvo(), 0)
@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from komentoajo import main, suorita
+from lukutyypit import Murtoluku
+from sovelluslogiikka import Sovelluslogiikka
+
+
+class TestSuorita(unittest.TestCase):
+    def setUp(self):
+        self.laskin = Sovelluslogiikka()
+
+    def test_komennot_suoritetaan_jarjestyksessa(self):
+        rivit = ["SUMMA 5", "SUMMA 10", "EROTUS 3", "KUMOA", "EROTUS 1"]
+
+        self.assertEqual(suorita(self.laskin, rivit), (14, []))
+
+    def test_nollaus_ja_tyhjat_rivit(self):
+        rivit = ["SUMMA 5", "", "   ", "NOLLAUS", "SUMMA 2"]
+
+        self.assertEqual(suorita(self.laskin, rivit)[0], 2)
+
+    def test_valiarvot_tallennetaan_tarkistusvalein(self):
+        rivit = ["SUMMA 1", "", "SUMMA 2", "SUMMA 3", "SUMMA 4", "EROTUS 5"]
+
+        _, tarkistukset = suorita(self.laskin, rivit, tarkistusvali=2)
+
+        # tyhjä rivi ei ole komento, mutta rivinumerot lasketaan tiedostosta
+        self.assertEqual(tarkistukset, [(3, 3), (5, 10)])
+
+    def test_operandi_muunnetaan_lukutyypin_mukaan(self):
+        laskin = Sovelluslogiikka(lukutyyppi=Murtoluku())
+
+        arvo, _ = suorita(laskin, ["SUMMA 1/3", "SUMMA 1/6"])
+
+        self.assertEqual(str(arvo), "1/2")
+
+    def test_virheellisen_rivin_numero_kerrotaan(self):
+        virheelliset = [
+            "KERTO 2",
+            "SUMMA",
+            "SUMMA kolme",
+            "SUMMA 1 2",
+            "KUMOA 5",
+            "NOLLAUS 0",
+            "summa 1",
+        ]
+
+        for virheellinen in virheelliset:
+            with self.subTest(rivi=virheellinen):
+                rivit = ["SUMMA 1", "", virheellinen, "SUMMA 2"]
+
+                with self.assertRaisesRegex(ValueError, f"rivillä 3: {virheellinen}$"):
+                    suorita(Sovelluslogiikka(), rivit)
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        hakemisto = tempfile.TemporaryDirectory()
+        self.addCleanup(hakemisto.cleanup)
+        self.polku = os.path.join(hakemisto.name, "loki.txt")
+
+    def kirjoita(self, *rivit):
+        with open(self.polku, "w", encoding="utf-8") as tiedosto:
+            tiedosto.write("\n".join(rivit) + "\n")
+
+    def test_tulostaa_tarkistukset_ja_lopullisen_arvon(self):
+        self.kirjoita("SUMMA 5", "SUMMA 5", "EROTUS 1")
+
+        with patch("sys.stdout", new_callable=StringIO) as tuloste:
+            self.assertEqual(main([self.polku, "--tarkistusvali", "2"]), 0)
+
+        self.assertEqual(tuloste.getvalue(), "rivi 2: 10\nlopullinen arvo: 9\n")
+
+    def test_virhe_tulostetaan_ja_palautetaan_virhekoodi(self):
+        self.kirjoita("SUMMA 5", "KUMOA 5")
+
+        with patch("sys.stderr", new_callable=StringIO) as virheet:
+            self.assertEqual(main([self.polku]), 1)
+
+        self.assertIn("rivillä 2", virheet.getvalue())
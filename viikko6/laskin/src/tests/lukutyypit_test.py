@@ -0,0 +1,90 @@
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+from lukutyypit import Desimaaliluku, Kokonaisluku, Murtoluku
+from sovelluslogiikka import Sovelluslogiikka
+
+
+class TestKokonaisluku(unittest.TestCase):
+    def setUp(self):
+        self.laskin = Sovelluslogiikka(lukutyyppi=Kokonaisluku())
+
+    def test_laskee_kokonaisluvuilla(self):
+        self.laskin.plus(self.laskin.muunna("7"))
+        self.laskin.miinus(self.laskin.muunna(" 10 "))
+
+        self.assertEqual(self.laskin.arvo(), -3)
+
+    def test_virheellinen_syote_hylataan(self):
+        self.assertRaises(ValueError, self.laskin.muunna, "1.5")
+        self.assertRaises(ValueError, self.laskin.muunna, "kolme")
+
+    def test_suuri_luku_voidaan_kumota(self):
+        self.laskin.plus(2**70)
+        self.laskin.plus(1)
+        self.laskin.kumoa()
+
+        self.assertEqual(self.laskin.arvo(), 2**70)
+
+
+class TestDesimaaliluku(unittest.TestCase):
+    def setUp(self):
+        self.laskin = Sovelluslogiikka(lukutyyppi=Desimaaliluku())
+
+    def test_laskee_tarkasti_desimaaleilla(self):
+        self.laskin.plus(self.laskin.muunna("0.1"))
+        self.laskin.plus(self.laskin.muunna("0.2"))
+
+        self.assertEqual(self.laskin.arvo(), Decimal("0.3"))
+
+    def test_tarkkuus_rajaa_merkitsevat_numerot(self):
+        laskin = Sovelluslogiikka(lukutyyppi=Desimaaliluku(tarkkuus=3))
+        laskin.plus(laskin.muunna("1.2345"))
+
+        self.assertEqual(laskin.arvo(), Decimal("1.23"))
+
+    def test_virheellinen_syote_hylataan(self):
+        self.assertRaises(ValueError, self.laskin.muunna, "1,5")
+
+    def test_ei_aarelliset_arvot_hylataan(self):
+        for teksti in ("NaN", "sNaN", "Infinity", "-Inf"):
+            self.assertRaises(ValueError, self.laskin.muunna, teksti)
+
+    def test_liian_suuri_eksponentti_hylataan(self):
+        self.assertRaises(ValueError, self.laskin.muunna, "1e999999999")
+
+    def test_kumoa_palauttaa_edellisen_arvon(self):
+        self.laskin.plus(self.laskin.muunna("2.5"))
+        self.laskin.miinus(self.laskin.muunna("1"))
+        self.laskin.kumoa()
+
+        self.assertEqual(self.laskin.arvo(), Decimal("2.5"))
+
+
+class TestMurtoluku(unittest.TestCase):
+    def setUp(self):
+        self.laskin = Sovelluslogiikka(lukutyyppi=Murtoluku())
+
+    def test_laskee_murtoluvuilla(self):
+        self.laskin.plus(self.laskin.muunna("1/3"))
+        self.laskin.plus(self.laskin.muunna("1/6"))
+
+        self.assertEqual(self.laskin.arvo(), Fraction(1, 2))
+
+    def test_nolla_nimittajana_hylataan(self):
+        self.assertRaises(ValueError, self.laskin.muunna, "1/0")
+        self.assertRaises(ValueError, self.laskin.muunna, "puoli")
+
+    def test_liian_suuri_eksponentti_hylataan_heti(self):
+        self.assertRaises(ValueError, self.laskin.muunna, "1e100000000")
+        self.assertRaises(ValueError, self.laskin.muunna, "-2.5E-1_000_000")
+        self.assertEqual(self.laskin.muunna("1.5e3"), Fraction(1500))
+
+    def test_kumoa_ja_tee_uudelleen_sailyttavat_murtoluvun(self):
+        self.laskin.plus(self.laskin.muunna("2/7"))
+        self.laskin.miinus(self.laskin.muunna("-3/5"))
+        self.laskin.kumoa()
+        self.assertEqual(self.laskin.arvo(), Fraction(2, 7))
+
+        self.laskin.tee_uudelleen()
+        self.assertEqual(self.laskin.arvo(), Fraction(31, 35))
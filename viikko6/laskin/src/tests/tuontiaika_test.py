@@ -0,0 +1,19 @@
+import unittest
+from tuontiaika import KEVYET_MODUULIT, mittaa
+
+
+class TestTuontiaika(unittest.TestCase):
+    def test_kevyet_moduulit_eivat_tuo_kayttoliittymaa(self):
+        for moduuli in KEVYET_MODUULIT:
+            with self.subTest(moduuli=moduuli):
+                aika, tuodut = mittaa(moduuli)
+
+                self.assertGreater(aika, 0)
+                self.assertNotIn("tkinter", tuodut)
+                self.assertNotIn("kayttoliittyma", tuodut)
+
+    def test_kevyet_moduulit_eivat_tuo_raskaita_lukutyyppeja(self):
+        _, tuodut = mittaa("sovelluslogiikka")
+
+        self.assertNotIn("decimal", tuodut)
+        self.assertNotIn("fractions", tuodut)
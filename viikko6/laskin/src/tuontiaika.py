@@ -0,0 +1,56 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# moduulit, joiden pitää latautua ilman tkinteriä
+KEVYET_MODUULIT = ["komento", "sovelluslogiikka", "komentoajo"]
+
+
+def mittaa(moduuli):
+    # palauttaa moduulin tuonnin kokonaisajan mikrosekunteina ja tuodut moduulit
+    tulos = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {moduuli}"],
+        # moduulit löytyvät vain src-hakemistosta käsin
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    tuodut = {}
+
+    for rivi in tulos.stderr.splitlines():
+        if not rivi.startswith("import time:") or "cumulative" in rivi:
+            continue
+
+        _, kumulatiivinen, nimi = rivi[len("import time:"):].split("|")
+        tuodut[nimi.strip()] = int(kumulatiivinen)
+
+    return tuodut[moduuli], tuodut
+
+
+def main(argumentit=None):
+    jasennin = argparse.ArgumentParser(description="Mittaa laskimen moduulien tuontiajat")
+    jasennin.add_argument("--raja", type=int, default=50_000, help="suurin sallittu tuontiaika mikrosekunteina")
+    asetukset = jasennin.parse_args(argumentit)
+    virheita = 0
+
+    for moduuli in KEVYET_MODUULIT:
+        aika, tuodut = mittaa(moduuli)
+        print(f"{moduuli:<20} {aika:>8} µs")
+
+        if "tkinter" in tuodut:
+            print(f"  virhe: {moduuli} tuo tkinterin", file=sys.stderr)
+            virheita += 1
+        if aika > asetukset.raja:
+            print(f"  virhe: {moduuli} ylittää {asetukset.raja} µs", file=sys.stderr)
+            virheita += 1
+
+    aika, _ = mittaa("kayttoliittyma")
+    print(f"{'kayttoliittyma':<20} {aika:>8} µs (tkinter mukaan lukien)")
+
+    return 1 if virheita else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,10 +7,14 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from luo_peli import LuoPeli
 from tuomari import Tuomari
+from tekoaly_ngrammi import TekoalyNgrammi
 
 app = Flask(__name__)
 app.secret_key = 'kivi-paperi-sakset-secret-key-2025'
 
+# Keeps the session cookie small; older moves have decayed away anyway
+NGRAM_HISTORY = 100
+
 
 @app.route('/')
 def index():
@@ -45,6 +49,8 @@ def start_game():
     elif game_type == 'c':
         session['ai_muisti'] = [None] * 10
         session['ai_vapaa_indeksi'] = 0
+    elif game_type == 'd':
+        session['ai_historia'] = []
     
     return redirect(url_for('play'))
 
@@ -67,7 +73,8 @@ def play():
     game_modes = {
         'a': 'Pelaaja vs Pelaaja',
         'b': 'Pelaaja vs Tekoäly',
-        'c': 'Pelaaja vs Parannettu Tekoäly'
+        'c': 'Pelaaja vs Parannettu Tekoäly',
+        'd': 'Pelaaja vs N-grammitekoäly'
     }
     game_mode = game_modes.get(game_type, 'Tuntematon')
     
@@ -101,9 +108,12 @@ def make_move():
     elif game_type == 'b':
         # Simple AI
         tokan_siirto = _simple_ai_move()
-    else:  # game_type == 'c'
+    elif game_type == 'c':
         # Advanced AI
         tokan_siirto = _advanced_ai_move(ekan_siirto)
+    else:  # game_type == 'd'
+        # N-gram AI
+        tokan_siirto = _ngram_ai_move(ekan_siirto)
     
     # Create tuomari and update scores
     tuomari = Tuomari()
@@ -229,5 +239,20 @@ def _advanced_ai_move(ekan_siirto):
     return ai_move
 
 
+def _ngram_ai_move(ekan_siirto):
+    """N-gram AI rebuilt from the player's recent moves"""
+    historia = session.get('ai_historia', [])
+
+    tekoaly = TekoalyNgrammi(3)
+    for siirto in historia:
+        tekoaly.aseta_siirto(siirto)
+    ai_move = tekoaly.anna_siirto()
+
+    historia.append(ekan_siirto)
+    session['ai_historia'] = historia[-NGRAM_HISTORY:]
+
+    return ai_move
+
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
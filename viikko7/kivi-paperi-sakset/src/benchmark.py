@@ -0,0 +1,57 @@
+import random
+import time
+import tracemalloc
+
+from tekoaly_parannettu import TekoalyParannettu
+from tekoaly_ngrammi import TekoalyNgrammi
+
+
+def parannettu_tekoaly(kierroksia=200_000, koot=(10, 100, 1000, 10_000)):
+    rng = random.Random(1)
+    siirrot = [rng.choice("kps") for _ in range(1000)]
+    tulokset = {}
+
+    for koko in koot:
+        tekoaly = TekoalyParannettu(koko)
+
+        alku = time.perf_counter()
+        for i in range(kierroksia):
+            tekoaly.anna_siirto()
+            tekoaly.aseta_siirto(siirrot[i % 1000])
+        tulokset[koko] = kierroksia / (time.perf_counter() - alku)
+
+    return tulokset
+
+
+def ngrammi_tekoaly(kierroksia=100_000, syvyydet=(1, 2, 3, 4, 6, 8)):
+    rng = random.Random(2)
+    siirrot = [rng.choice("kps") for _ in range(1000)]
+    tulokset = {}
+
+    for syvyys in syvyydet:
+        tracemalloc.start()
+        tekoaly = TekoalyNgrammi(syvyys)
+        muisti = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        alku = time.perf_counter()
+        for i in range(kierroksia):
+            tekoaly.anna_siirto()
+            tekoaly.aseta_siirto(siirrot[i % 1000])
+        viive = (time.perf_counter() - alku) / kierroksia
+
+        tulokset[syvyys] = viive, muisti
+
+    return tulokset
+
+
+def main():
+    for koko, nopeus in parannettu_tekoaly().items():
+        print(f"TekoalyParannettu({koko}): {nopeus:,.0f} kierrosta/s")
+
+    for syvyys, (viive, muisti) in ngrammi_tekoaly().items():
+        print(f"TekoalyNgrammi({syvyys}): {viive * 1e6:.2f} us/kierros, {muisti / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from kps_pelaaja_vs_pelaaja import KPSPelaajaVsPelaaja
 from kps_tekoaly import KPSTekoaly
 from kps_parempi_tekoaly import KPSParempiTekoaly
+from kps_ngrammi_tekoaly import KPSNgrammiTekoaly
 
 
 def main():
@@ -9,12 +10,13 @@ def main():
               "\n (a) Ihmistä vastaan"
               "\n (b) Tekoälyä vastaan"
               "\n (c) Parannettua tekoälyä vastaan"
+              "\n (d) N-grammitekoälyä vastaan"
               "\nMuilla valinnoilla lopetetaan"
               )
 
         vastaus = input()
 
-        if not vastaus.endswith(("a", "b", "c")):
+        if not vastaus.endswith(("a", "b", "c", "d")):
             break
 
         print(
@@ -33,6 +35,10 @@ def main():
             haastava_yksinpeli = KPSParempiTekoaly()
             haastava_yksinpeli.pelaa()
 
+        elif vastaus.endswith("d"):
+            ngrammi_yksinpeli = KPSNgrammiTekoaly()
+            ngrammi_yksinpeli.pelaa()
+
 
 if __name__ == "__main__":
     main()
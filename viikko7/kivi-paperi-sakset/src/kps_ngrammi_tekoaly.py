@@ -0,0 +1,15 @@
+from tekoaly_ngrammi import TekoalyNgrammi
+from kivi_paperi_sakset import KiviPaperiSakset
+
+
+class KPSNgrammiTekoaly(KiviPaperiSakset):
+
+    def __init__(self):
+        self.ngrammitekoaly = TekoalyNgrammi(3)
+
+    def _toisen_siirto(self, ekan_siirto):
+        tokan_siirto = self.ngrammitekoaly.anna_siirto()
+        print(f"Tietokone valitsi: {tokan_siirto}")
+        self.ngrammitekoaly.aseta_siirto(ekan_siirto)
+
+        return tokan_siirto
@@ -1,6 +1,7 @@
 from kps_pelaaja_vs_pelaaja import KPSPelaajaVsPelaaja
 from kps_tekoaly import KPSTekoaly
 from kps_parempi_tekoaly import KPSParempiTekoaly
+from kps_ngrammi_tekoaly import KPSNgrammiTekoaly
 
 
 class LuoPeli:
@@ -12,5 +13,7 @@ class LuoPeli:
             return KPSTekoaly()
         if tyyppi == 'c':
             return KPSParempiTekoaly()
+        if tyyppi == 'd':
+            return KPSNgrammiTekoaly()
     
         return None
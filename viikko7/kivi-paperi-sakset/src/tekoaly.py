@@ -2,6 +2,10 @@ class Tekoaly:
     def __init__(self):
         self._siirto = 0
 
+    def aseta_siirto(self, siirto):
+        # ei tehdä mitään, tekoäly ei muista vastustajan siirtoja
+        pass
+
     def anna_siirto(self):
         self._siirto = self._siirto + 1
         self._siirto = self._siirto % 3
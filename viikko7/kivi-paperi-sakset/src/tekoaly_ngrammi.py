@@ -0,0 +1,69 @@
+from array import array
+
+INDEKSIT = {"k": 0, "p": 1, "s": 2}
+# voittava vastaus ennustettuun siirtoon
+VASTAUKSET = "psk"
+
+
+class TekoalyNgrammi:
+    def __init__(self, syvyys=3, taulun_koko=4096, vaimennus=0.9):
+        self._syvyys = syvyys
+        self._taulun_koko = taulun_koko
+        self._vaimennus = vaimennus
+        # jokaisella kontekstilla kolme painoa: kuinka usein sitä seurasi k, p tai s
+        self._painot = array("f", bytes(4 * 3 * taulun_koko))
+        # viimeisimmät siirrot, uusin ensin
+        self._historia = []
+
+    def _rivit(self):
+        # kontekstit lyhimmästä pisimpään; eripituiset kontekstit eivät
+        # osu samaan avaimeen, koska avaimeen lisätään pituuden siirtymä
+        avain = 0
+        siirtyma = 0
+        kerroin = 1
+
+        for siirto in self._historia:
+            avain = avain * 3 + siirto
+            siirtyma += kerroin
+            kerroin *= 3
+            yield (((avain + siirtyma) * 2654435761) & 0xFFFFFFFF) % self._taulun_koko * 3
+
+    def aseta_siirto(self, siirto):
+        # virheellinen siirto lopettaa pelin, sitä ei kirjata
+        if siirto not in INDEKSIT:
+            return
+
+        seuraava = INDEKSIT[siirto]
+        painot = self._painot
+        vaimennus = self._vaimennus
+
+        for rivi in self._rivit():
+            painot[rivi] *= vaimennus
+            painot[rivi + 1] *= vaimennus
+            painot[rivi + 2] *= vaimennus
+            painot[rivi + seuraava] += 1
+
+        self._historia.insert(0, seuraava)
+        if len(self._historia) > self._syvyys:
+            self._historia.pop()
+
+    def anna_siirto(self):
+        painot = self._painot
+        ennuste = None
+
+        # pisin konteksti, josta on havaintoja, ratkaisee
+        for rivi in self._rivit():
+            k, p, s = painot[rivi], painot[rivi + 1], painot[rivi + 2]
+
+            if k + p + s > 0:
+                if k >= p and k >= s:
+                    ennuste = 0
+                elif p >= s:
+                    ennuste = 1
+                else:
+                    ennuste = 2
+
+        if ennuste is None:
+            return "k"
+
+        return VASTAUKSET[ennuste]
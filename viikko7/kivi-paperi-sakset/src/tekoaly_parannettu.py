@@ -1,39 +1,53 @@
+SIIRROT = {"k": 0, "p": 1, "s": 2}
+
 
 class TekoalyParannettu:
     def __init__(self, muistin_koko):
+        # muisti on rengaspuskuri, _alku osoittaa vanhimpaan siirtoon
         self._muisti = [None] * muistin_koko
         self._vapaa_muisti_indeksi = 0
+        self._alku = 0
+        # _siirtymat[a][b] = kuinka monesti siirtoa a seurasi muistissa siirto b
+        self._siirtymat = [[0, 0, 0] for _ in range(3)]
 
     def aseta_siirto(self, siirto):
-        if self._vapaa_muisti_indeksi == len(self._muisti):
+        koko = len(self._muisti)
+
+        # virheellinen siirto lopettaa pelin, sitä ei kirjata muistiin
+        if koko == 0 or siirto not in SIIRROT:
+            return
+
+        if self._vapaa_muisti_indeksi == koko:
             self.vapauta_muistia()
 
-        self._muisti[self._vapaa_muisti_indeksi] = siirto
+        if self._vapaa_muisti_indeksi > 0:
+            edellinen = self._muisti[(self._alku + self._vapaa_muisti_indeksi - 1) % koko]
+            self._siirtymat[SIIRROT[edellinen]][SIIRROT[siirto]] += 1
+
+        self._muisti[(self._alku + self._vapaa_muisti_indeksi) % koko] = siirto
         self._vapaa_muisti_indeksi += 1
 
     def vapauta_muistia(self):
-        for i in range(1, len(self._muisti)):
-            self._muisti[i - 1] = self._muisti[i]
-            self._vapaa_muisti_indeksi -= 1
+        koko = len(self._muisti)
+        vanhin = self._muisti[self._alku]
+
+        if self._vapaa_muisti_indeksi > 1:
+            seuraava = self._muisti[(self._alku + 1) % koko]
+            self._siirtymat[SIIRROT[vanhin]][SIIRROT[seuraava]] -= 1
+
+        self._muisti[self._alku] = None
+        self._alku = (self._alku + 1) % koko
+        self._vapaa_muisti_indeksi -= 1
 
     def anna_siirto(self):
         if self._vapaa_muisti_indeksi in [0, 1]:
             return "k"
 
-        viimeisin_siirto = self._muisti[self._vapaa_muisti_indeksi - 1]
-
-        k, p, s = 0, 0, 0
-
-        for i in range(0, self._vapaa_muisti_indeksi - 1):
-            if viimeisin_siirto == self._muisti[i]:
-                seuraava = self._muisti[i + 1]
+        viimeisin_siirto = self._muisti[
+            (self._alku + self._vapaa_muisti_indeksi - 1) % len(self._muisti)
+        ]
 
-                if seuraava == "k":
-                    k += 1
-                elif seuraava == "p":
-                    p += 1
-                else:
-                    s += 1
+        k, p, s = self._siirtymat[SIIRROT[viimeisin_siirto]]
 
         if k > p or k > s:
             return "p"
@@ -0,0 +1,185 @@
+import math
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tekoaly import Tekoaly
+from tekoaly_parannettu import TekoalyParannettu
+from tekoaly_ngrammi import TekoalyNgrammi
+from tuomari import Tuomari
+
+
+class Satunnainen:
+    def __init__(self, siemen=None):
+        self._satunnainen = random.Random(siemen)
+
+    def aseta_siirto(self, siirto):
+        pass
+
+    def anna_siirto(self):
+        return self._satunnainen.choice("kps")
+
+
+# strategiat luodaan nimen perusteella prosessissa, jossa ottelu pelataan,
+# joten tehtävinä siirretään vain nimet ja siemenet
+STRATEGIAT = {
+    "tekoaly": lambda siemen: Tekoaly(),
+    "parannettu": lambda siemen: TekoalyParannettu(10),
+    "parannettu1000": lambda siemen: TekoalyParannettu(1000),
+    "ngrammi1": lambda siemen: TekoalyNgrammi(1),
+    "ngrammi3": lambda siemen: TekoalyNgrammi(3),
+    "satunnainen": Satunnainen,
+}
+
+
+def pelaa(eka, toka, kierroksia):
+    tuomari = Tuomari()
+
+    for _ in range(kierroksia):
+        ekan_siirto = eka.anna_siirto()
+        tokan_siirto = toka.anna_siirto()
+        tuomari.kirjaa_siirto(ekan_siirto, tokan_siirto)
+        # kumpikin oppii vastustajansa siirroista
+        eka.aseta_siirto(tokan_siirto)
+        toka.aseta_siirto(ekan_siirto)
+
+    return tuomari
+
+
+def _ottelu(tehtava):
+    eka, toka, kierroksia, siemen = tehtava
+
+    alku = time.perf_counter()
+    tuomari = pelaa(STRATEGIAT[eka](siemen), STRATEGIAT[toka](siemen + 1), kierroksia)
+
+    return tuomari.ekan_pisteet, tuomari.tokan_pisteet, tuomari.tasapelit, time.perf_counter() - alku
+
+
+def luottamusvali(osuudet, kierroksia):
+    # otteluiden välinen hajonta, koska saman ottelun kierrokset eivät ole
+    # toisistaan riippumattomia; yhdestä ottelusta arvioidaan binomijakaumalla
+    keskiarvo = statistics.fmean(osuudet)
+
+    if len(osuudet) < 2:
+        return keskiarvo, 1.96 * math.sqrt(keskiarvo * (1 - keskiarvo) / kierroksia)
+
+    return keskiarvo, 1.96 * statistics.stdev(osuudet) / math.sqrt(len(osuudet))
+
+
+class Turnaus:
+    def __init__(self, strategiat, kierroksia=100_000, toistoja=4, prosesseja=None, siemen=0):
+        self.strategiat = list(strategiat)
+        self.kierroksia = kierroksia
+        self.toistoja = toistoja
+        self.prosesseja = prosesseja or os.cpu_count()
+        self.siemen = siemen
+
+        # voitot[i][j] ja tasapelit[i][j]: (osuus, luottamusvälin puolileveys)
+        self.voitot = None
+        self.tasapelit = None
+        self.kesto = 0
+        self.prosessiaika = 0
+
+    def _tehtavat(self):
+        parit = []
+        tehtavat = []
+
+        for i, eka in enumerate(self.strategiat):
+            for j in range(i, len(self.strategiat)):
+                parit.append((i, j))
+                for _ in range(self.toistoja):
+                    siemen = self.siemen + 2 * (len(tehtavat) + 1)
+                    tehtavat.append((eka, self.strategiat[j], self.kierroksia, siemen))
+
+        return parit, tehtavat
+
+    def pelaa(self):
+        parit, tehtavat = self._tehtavat()
+
+        alku = time.perf_counter()
+        if self.prosesseja == 1:
+            tulokset = list(map(_ottelu, tehtavat))
+        else:
+            with ProcessPoolExecutor(self.prosesseja) as pooli:
+                tulokset = list(pooli.map(_ottelu, tehtavat))
+        self.kesto = time.perf_counter() - alku
+        self.prosessiaika = sum(tulos[3] for tulos in tulokset)
+
+        n = len(self.strategiat)
+        self.voitot = [[None] * n for _ in range(n)]
+        self.tasapelit = [[None] * n for _ in range(n)]
+
+        for k, (i, j) in enumerate(parit):
+            ottelut = tulokset[k * self.toistoja:(k + 1) * self.toistoja]
+            ekan = luottamusvali([tulos[0] / self.kierroksia for tulos in ottelut], self.kierroksia)
+            tokan = luottamusvali([tulos[1] / self.kierroksia for tulos in ottelut], self.kierroksia)
+            tasan = luottamusvali([tulos[2] / self.kierroksia for tulos in ottelut], self.kierroksia)
+
+            # itseään vastaan pelatessa rivillä näytetään ensimmäisen pelaajan voitot
+            self.voitot[j][i] = tokan
+            self.voitot[i][j] = ekan
+            self.tasapelit[i][j] = self.tasapelit[j][i] = tasan
+
+        return self
+
+    @property
+    def kierroksia_yhteensa(self):
+        n = len(self.strategiat)
+        return n * (n + 1) // 2 * self.toistoja * self.kierroksia
+
+    def _matriisi(self, otsikko, arvot):
+        leveys = max(14, *(len(nimi) + 2 for nimi in self.strategiat))
+        rivit = [otsikko, " " * leveys + "".join(nimi.rjust(leveys) for nimi in self.strategiat)]
+
+        for nimi, rivi in zip(self.strategiat, arvot):
+            solut = "".join(
+                f"{osuus:.1%} ±{vali:.1%}".rjust(leveys) for osuus, vali in rivi
+            )
+            rivit.append(nimi.ljust(leveys) + solut)
+
+        return "\n".join(rivit)
+
+    def __str__(self):
+        kierroksia = self.kierroksia_yhteensa
+
+        return "\n\n".join([
+            self._matriisi("Voitot (rivi voittaa sarakkeen, 95 % luottamusväli)", self.voitot),
+            self._matriisi("Tasapelit", self.tasapelit),
+            f"{kierroksia:,} kierrosta {self.kesto:.2f} sekunnissa: "
+            f"{kierroksia / self.kesto:,.0f} kierrosta/s, "
+            f"{kierroksia / self.prosessiaika:,.0f} kierrosta/s prosessia kohden",
+        ])
+
+
+def main():
+    import argparse
+
+    jasennin = argparse.ArgumentParser(description="Pelaa tekoälyt toisiaan vastaan")
+    jasennin.add_argument(
+        "strategiat", nargs="*", default=list(STRATEGIAT),
+        help="pelaavat strategiat: " + ", ".join(STRATEGIAT),
+    )
+    jasennin.add_argument("--kierroksia", type=int, default=100_000, help="kierroksia ottelussa")
+    jasennin.add_argument("--toistoja", type=int, default=4, help="otteluita kullekin parille")
+    jasennin.add_argument("--prosesseja", type=int, default=None)
+    jasennin.add_argument("--siemen", type=int, default=0)
+    argumentit = jasennin.parse_args()
+
+    for nimi in argumentit.strategiat:
+        if nimi not in STRATEGIAT:
+            jasennin.error(f"tuntematon strategia: {nimi}")
+
+    turnaus = Turnaus(
+        argumentit.strategiat,
+        argumentit.kierroksia,
+        argumentit.toistoja,
+        argumentit.prosesseja,
+        argumentit.siemen,
+    )
+    print(turnaus.pelaa())
+
+
+if __name__ == "__main__":
+    main()
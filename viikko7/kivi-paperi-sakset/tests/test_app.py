@@ -65,6 +65,16 @@ class TestStartGame:
             assert sess['ai_vapaa_indeksi'] == 0
             assert 'ai_siirto' not in sess
 
+    def test_start_game_type_d(self, client):
+        """Test starting game with n-gram AI"""
+        response = client.post('/start', data={'game_type': 'd'}, follow_redirects=False)
+        assert response.status_code == 302
+
+        with client.session_transaction() as sess:
+            assert sess['game_type'] == 'd'
+            assert sess['ai_historia'] == []
+            assert 'ai_muisti' not in sess
+
     def test_start_game_invalid_type(self, client):
         """Test starting game with invalid type redirects to index"""
         response = client.post('/start', data={'game_type': 'x'}, follow_redirects=False)
@@ -293,6 +303,23 @@ class TestMakeMove:
             assert sess['ai_vapaa_indeksi'] == 1
             assert sess['round'] == 2
 
+    def test_make_move_ngram_ai(self, client):
+        """Test making a move against n-gram AI"""
+        with client.session_transaction() as sess:
+            sess['game_type'] = 'd'
+            sess['tuomari'] = {'ekan_pisteet': 0, 'tokan_pisteet': 0, 'tasapelit': 0}
+            sess['round'] = 1
+            sess['game_over'] = False
+            sess['ai_historia'] = []
+
+        response = client.post('/move', data={'ekan_siirto': 's'}, follow_redirects=False)
+        assert response.status_code == 302
+
+        with client.session_transaction() as sess:
+            assert sess['ai_historia'] == ['s']
+            assert sess['last_result']['tokan_siirto'] == 'Kivi'
+            assert sess['round'] == 2
+
     def test_make_move_game_ends_at_3_wins_player1(self, client):
         """Test game ends when player 1 reaches 3 wins"""
         with client.session_transaction() as sess:
@@ -465,6 +492,23 @@ class TestAILogic:
             assert sess['ai_muisti'][9] == 'p'
             assert sess['ai_vapaa_indeksi'] == 10
 
+    def test_ngram_ai_history_is_bounded(self, client):
+        """Test that n-gram AI keeps only the latest moves in session"""
+        with client.session_transaction() as sess:
+            sess['game_type'] = 'd'
+            sess['tuomari'] = {'ekan_pisteet': 0, 'tokan_pisteet': 0, 'tasapelit': 0}
+            sess['round'] = 1
+            sess['game_over'] = False
+            sess['ai_historia'] = ['k'] * 100
+
+        client.post('/move', data={'ekan_siirto': 'p'})
+
+        with client.session_transaction() as sess:
+            assert len(sess['ai_historia']) == 100
+            assert sess['ai_historia'][-1] == 'p'
+            # AI expected another rock and answered with paper
+            assert sess['last_result']['tokan_siirto'] == 'Paperi'
+
     def test_advanced_ai_initial_moves(self, client):
         """Test advanced AI behavior on first moves"""
         with client.session_transaction() as sess:
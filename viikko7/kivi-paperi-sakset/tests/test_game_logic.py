@@ -10,11 +10,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from tuomari import Tuomari
 from tekoaly import Tekoaly
 from tekoaly_parannettu import TekoalyParannettu
+from tekoaly_ngrammi import TekoalyNgrammi
 from luo_peli import LuoPeli
 from kivi_paperi_sakset import KiviPaperiSakset
 from kps_pelaaja_vs_pelaaja import KPSPelaajaVsPelaaja
 from kps_tekoaly import KPSTekoaly
 from kps_parempi_tekoaly import KPSParempiTekoaly
+from kps_ngrammi_tekoaly import KPSNgrammiTekoaly
 
 
 class TestTuomari:
@@ -182,6 +184,115 @@ class TestTekoalyParannettu:
         move = ai.anna_siirto()
         assert move == 's'  # Counters expected 'p'
 
+    def test_full_memory_keeps_latest_moves(self):
+        """Test full memory drops only the oldest move"""
+        ai = TekoalyParannettu(3)
+        for move in ['k', 'p', 's', 'p', 'k']:
+            ai.aseta_siirto(move)
+
+        assert ai._vapaa_muisti_indeksi == 3
+        assert [ai._muisti[(ai._alku + i) % 3] for i in range(3)] == ['s', 'p', 'k']
+
+    def test_eviction_forgets_old_transitions(self):
+        """Test transitions of evicted moves no longer affect predictions"""
+        ai = TekoalyParannettu(4)
+        for move in ['k', 'p', 'k', 'p']:
+            ai.aseta_siirto(move)
+        for move in ['s', 'k', 's', 'k']:
+            ai.aseta_siirto(move)
+
+        # Only 's' -> 'k' and 'k' -> 's' remain in memory
+        assert ai._siirtymat[0] == [0, 0, 1]
+        assert ai.anna_siirto() == 'k'
+
+    def test_matches_full_rescan(self):
+        """Test incremental counts match counting the memory from scratch"""
+        import random
+
+        rng = random.Random(7)
+        ai = TekoalyParannettu(50)
+        history = []
+
+        for _ in range(500):
+            move = rng.choice('kps')
+            ai.aseta_siirto(move)
+            history.append(move)
+            window = history[-50:]
+
+            for a in 'kps':
+                counts = [
+                    sum(1 for i in range(len(window) - 1)
+                        if window[i] == a and window[i + 1] == b)
+                    for b in 'kps'
+                ]
+                assert ai._siirtymat['kps'.index(a)] == counts
+
+
+class TestTekoalyNgrammi:
+    """Test the n-gram AI class"""
+
+    def test_anna_siirto_without_history(self):
+        """Test AI returns 'k' before it has seen any moves"""
+        ai = TekoalyNgrammi(3)
+        assert ai.anna_siirto() == 'k'
+
+    def test_history_is_bounded(self):
+        """Test AI remembers only the last N moves"""
+        ai = TekoalyNgrammi(2)
+        for move in ['k', 'p', 's', 'k', 'p']:
+            ai.aseta_siirto(move)
+        assert len(ai._historia) == 2
+
+    def test_table_size_is_fixed(self):
+        """Test context table does not grow with the number of moves"""
+        ai = TekoalyNgrammi(4, taulun_koko=64)
+        for i in range(1000):
+            ai.aseta_siirto('kps'[i * i % 3])
+        assert len(ai._painot) == 64 * 3
+
+    def test_learns_second_order_pattern(self):
+        """Test AI predicts a pattern a first-order model cannot see"""
+        ai = TekoalyNgrammi(2)
+        # After 'k' comes 'k' or 's' depending on the move before it
+        for _ in range(10):
+            for move in ['k', 'k', 's']:
+                ai.aseta_siirto(move)
+
+        # Last moves 'k', 's' -> next is 'k', countered with 'p'
+        assert ai.anna_siirto() == 'p'
+        ai.aseta_siirto('k')
+        # Last moves 's', 'k' -> next is 'k', countered with 'p'
+        assert ai.anna_siirto() == 'p'
+        ai.aseta_siirto('k')
+        # Last moves 'k', 'k' -> next is 's', countered with 'k'
+        assert ai.anna_siirto() == 'k'
+
+    def test_decay_favours_recent_moves(self):
+        """Test old habits are forgotten when the player changes style"""
+        ai = TekoalyNgrammi(1, vaimennus=0.5)
+        for _ in range(20):
+            ai.aseta_siirto('k')
+        for _ in range(3):
+            ai.aseta_siirto('s')
+            ai.aseta_siirto('k')
+
+        # 'k' was followed by 'k' 19 times long ago, by 's' recently
+        assert ai.anna_siirto() == 'k'
+
+    def test_beats_cycling_ai(self):
+        """Test AI learns to beat the simple cycling AI"""
+        ai = TekoalyNgrammi(3)
+        vastustaja = Tekoaly()
+        tuomari = Tuomari()
+
+        for _ in range(100):
+            oma = ai.anna_siirto()
+            toisen = vastustaja.anna_siirto()
+            tuomari.kirjaa_siirto(oma, toisen)
+            ai.aseta_siirto(toisen)
+
+        assert tuomari.ekan_pisteet >= 95
+
 
 class TestLuoPeli:
     """Test the factory class for creating games"""
@@ -196,6 +307,11 @@ class TestLuoPeli:
         peli = LuoPeli.luo_peli('b')
         assert isinstance(peli, KPSTekoaly)
     
+    def test_luo_peli_type_d(self):
+        """Test creating game with n-gram AI"""
+        peli = LuoPeli.luo_peli('d')
+        assert isinstance(peli, KPSNgrammiTekoaly)
+
     def test_luo_peli_type_c(self):
         """Test creating game with advanced AI"""
         peli = LuoPeli.luo_peli('c')
@@ -278,3 +394,52 @@ class TestKPSParempiTekoaly:
         """Test AI is initialized with correct memory size"""
         peli = KPSParempiTekoaly()
         assert len(peli.supertekoaly._muisti) == 10
+
+    def test_invalid_move_quits_game(self, monkeypatch, capsys):
+        """Test quitting with an invalid move ends the game normally"""
+        siirrot = iter(['k', 'p', 'x'])
+        monkeypatch.setattr('builtins.input', lambda _: next(siirrot))
+
+        peli = KPSParempiTekoaly()
+        peli.pelaa()
+
+        assert 'Kiitos!' in capsys.readouterr().out
+        assert peli.supertekoaly._vapaa_muisti_indeksi == 2
+
+    def test_ignores_invalid_move(self):
+        """Test AI does not store moves other than k, p or s"""
+        ai = TekoalyParannettu(10)
+        ai.aseta_siirto('k')
+        ai.aseta_siirto('x')
+        assert ai._vapaa_muisti_indeksi == 1
+
+
+class TestKPSNgrammiTekoaly:
+    """Test game with n-gram AI"""
+
+    def test_initialization(self):
+        """Test KPSNgrammiTekoaly initializes with n-gram AI"""
+        peli = KPSNgrammiTekoaly()
+        assert isinstance(peli.ngrammitekoaly, TekoalyNgrammi)
+
+    def test_inheritance(self):
+        """Test that KPSNgrammiTekoaly inherits from KiviPaperiSakset"""
+        peli = KPSNgrammiTekoaly()
+        assert isinstance(peli, KiviPaperiSakset)
+
+    def test_invalid_first_move_quits_game(self, monkeypatch, capsys):
+        """Test quitting on the very first move ends the game normally"""
+        monkeypatch.setattr('builtins.input', lambda _: 'x')
+
+        peli = KPSNgrammiTekoaly()
+        peli.pelaa()
+
+        assert 'Kiitos!' in capsys.readouterr().out
+        assert peli.ngrammitekoaly._historia == []
+
+    def test_ignores_invalid_move(self):
+        """Test AI does not learn from moves other than k, p or s"""
+        ai = TekoalyNgrammi(2)
+        ai.aseta_siirto('k')
+        ai.aseta_siirto('x')
+        assert ai._historia == [0]
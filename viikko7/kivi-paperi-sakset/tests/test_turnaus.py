@@ -0,0 +1,81 @@
+"""
+Tests for the headless AI tournament runner
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tekoaly import Tekoaly
+from tekoaly_ngrammi import TekoalyNgrammi
+from turnaus import Satunnainen, Turnaus, luottamusvali, pelaa
+
+
+class TestPelaa:
+    """Test playing a single AI vs AI match"""
+
+    def test_every_round_is_scored(self):
+        """Test wins and draws add up to the number of rounds"""
+        tuomari = pelaa(Satunnainen(1), Satunnainen(2), 1000)
+        assert tuomari.ekan_pisteet + tuomari.tokan_pisteet + tuomari.tasapelit == 1000
+
+    def test_same_strategy_always_draws(self):
+        """Test two cycling AIs play the same moves every round"""
+        tuomari = pelaa(Tekoaly(), Tekoaly(), 300)
+        assert tuomari.tasapelit == 300
+
+    def test_learning_ai_beats_cycling_ai(self):
+        """Test n-gram AI wins nearly every round against the cycling AI"""
+        tuomari = pelaa(TekoalyNgrammi(3), Tekoaly(), 1000)
+        assert tuomari.ekan_pisteet > 950
+
+
+class TestLuottamusvali:
+    """Test confidence intervals of win rates"""
+
+    def test_identical_matches_have_no_spread(self):
+        """Test deterministic results give a zero-width interval"""
+        assert luottamusvali([0.5, 0.5, 0.5], 100) == (0.5, 0.0)
+
+    def test_single_match_uses_binomial_estimate(self):
+        """Test one match falls back to the binomial interval over rounds"""
+        osuus, vali = luottamusvali([0.5], 10_000)
+        assert osuus == 0.5
+        assert abs(vali - 0.0098) < 1e-6
+
+
+class TestTurnaus:
+    """Test the tournament matrix"""
+
+    def test_matrix_covers_all_pairs(self):
+        """Test every pair of strategies gets a result"""
+        turnaus = Turnaus(['tekoaly', 'ngrammi3', 'satunnainen'], 500, 2, prosesseja=1).pelaa()
+
+        assert turnaus.kierroksia_yhteensa == 6 * 2 * 500
+        for rivi in turnaus.voitot + turnaus.tasapelit:
+            assert None not in rivi
+
+    def test_results_are_consistent(self):
+        """Test wins, losses and draws of a pair add up to one"""
+        turnaus = Turnaus(['tekoaly', 'ngrammi3'], 500, 2, prosesseja=1).pelaa()
+
+        voitot, _ = turnaus.voitot[1][0]
+        tappiot, _ = turnaus.voitot[0][1]
+        tasapelit, _ = turnaus.tasapelit[0][1]
+        assert abs(voitot + tappiot + tasapelit - 1) < 1e-9
+        assert voitot > 0.9
+
+    def test_process_pool_gives_same_results(self):
+        """Test results do not depend on the number of processes"""
+        strategiat = ['parannettu', 'satunnainen']
+        yksi = Turnaus(strategiat, 300, 2, prosesseja=1).pelaa()
+        kaksi = Turnaus(strategiat, 300, 2, prosesseja=2).pelaa()
+
+        assert yksi.voitot == kaksi.voitot
+        assert yksi.tasapelit == kaksi.tasapelit
+
+    def test_report_contains_matrix_and_speed(self):
+        """Test printed report shows strategy names and rounds per second"""
+        teksti = str(Turnaus(['tekoaly', 'satunnainen'], 100, 1, prosesseja=1).pelaa())
+        assert 'satunnainen' in teksti
+        assert 'kierrosta/s' in teksti